@@ -10,6 +10,7 @@ from antpod.apUtils.sensorMap import *
 import os
 import warnings
 import rasterstats
+import numpy as np
 import rasterio as rio
 from rasterio import plot
 
@@ -71,6 +72,32 @@ def rasterCaller(tiffImage: str, status: bool = False):
     return datasetReader
 
 
+def readDecoded(datasetReader, index: int, window=None, status: bool = False):
+    """ Function to read a band of a rasterio DatasetReader object as float32, decoding
+    quantized int16 index exports with the scale and offset stored in the GeoTIFF metadata
+
+    Args:
+        datasetReader : a rasterio DatasetReader object
+        index : an integer value for locating the band in the datasetReader object
+        window : a windows.Window object to read a rectangular subset of the band
+        status: to display status of function completion
+    Returns:
+        band : a float32 numpy array of the band with nodata pixels as NaN
+    """
+    band = datasetReader.read(index, window=window, masked=True)
+    scale, offset = datasetReader.scales[index - 1], datasetReader.offsets[index - 1]
+
+    band = band.astype(np.float32)
+    if scale != 1 or offset != 0:
+        band = band * np.float32(scale) + np.float32(offset)
+    band = band.filled(np.nan)
+
+    if status:
+        print("Decoding band ", index, " with scale ", scale, " and offset ", offset, " ... successful")
+
+    return band
+
+
 def retBandBounds(datasetReader, status: bool = False):
     """ Function to return bounds of a DatasetReader object
 
@@ -108,7 +135,7 @@ def showRaster(datasetReader, antpodProduct: str, sensor: str, ind: str, cmap: s
         print("Band not found in sensormap.json")
         return
     b = bands.index(ind)
-    plotIndex = datasetReader.read(int(b+1))
+    plotIndex = readDecoded(datasetReader, int(b+1))
     plot.show(plotIndex, cmap=cmap, title=ind)
 
 
@@ -167,7 +194,7 @@ def retClipGeoData(datasetReader, geodf, index: int, status: bool = False):
         according to the window provided by GeoDataFrame boundaries
     """
     windowRaster = retWindowRaster(datasetReader, geodf, status)
-    clipGeoData = datasetReader.read(index, window=windowRaster)
+    clipGeoData = readDecoded(datasetReader, index, window=windowRaster)
 
     if status:
         print("Clipping GeoDataFrame and Rasterio objects ... successful")
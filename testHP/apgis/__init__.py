@@ -11,10 +11,15 @@ Geocoding and most importantly the Earth Engine Python API library.
 Copyrights (c) 2020 ANTPOD Designs Private Limited. All Rights Reserved.
 ************************************************************************
 """
+import json
+import time
+import threading
+
 import ee
 
 import apgis.apjsonio as jsonio
 import apgis.apconversion as conversion
+import apgis.apvector as vector
 import apgis.apexception as apexception
 
 import apgis.geebase as gee
@@ -23,22 +28,67 @@ import apgis.geetemporal as temporal
 import apgis.geeindex as index
 import apgis.geemask as mask
 from apgis.geeexport import Export
+from apgis.geetask import TaskScheduler
 
+from apgis.apcache import RasterCache
 from apgis.apcloud import FirebaseStorage
 from apgis.apconfig import Config
 from apgis.apdate import Date
 from apgis.apfield import Field
 from apgis.apgeojson import GeoJSON
+from apgis.apmanifest import ExportManifest
 from apgis.aprequestlist import RequestList
 
+EE_KEY_BLOB = "ee-auth/eeservicekey.json"
+
+__eeCredentials__ = None
+__eeCredentialsLock__ = threading.Lock()
+
+
+def eeCredentials(refresh: bool = False):
+    """ *Returns the Earth Engine Service Account credentials, fetching them into memory on first use.*
+
+    The Service Account Key is read from the Firebase Cloud Storage bucket straight into memory, without being
+    written to disk, and the Service Account is the client_email of the key. The credentials are kept for the
+    life of the process, so later initializations make no fetch at all.
+
+    Args:
+        refresh:    A bool to fetch the key again, like after a key rotation. Defaults to False.
+    Returns:
+        The Earth Engine Service Account credentials.
+    Raises:
+        FirebaseError:      Occurs if the Firebase pull fails.
+        EERuntimeError:     Occurs if the credential building fails.
+    """
+    global __eeCredentials__
+
+    with __eeCredentialsLock__:
+        if __eeCredentials__ is None or refresh:
+            try:
+                keyData = FirebaseStorage.session(bucket="antpod-apgis").readBlob(remoteName=EE_KEY_BLOB)
+
+            except Exception as e:
+                raise apexception.FirebaseError(f"Earth Engine Initialisation Failed @ Firebase Pull: {e}")
+
+            try:
+                keyData = keyData.decode("utf-8")
+                serviceAccountID = json.loads(keyData)["client_email"]
+                __eeCredentials__ = ee.ServiceAccountCredentials(serviceAccountID, key_data=keyData)
+
+            except Exception as e:
+                raise apexception.EERuntimeError(f"Earth Engine Initialisation Failed @ Credential Building: {e}")
 
-def eeInitialize(internalConfig: bool = False) -> None:
+        return __eeCredentials__
+
+
+def eeInitialize(internalConfig: bool = False) -> dict:
     """ *Authenticates and initializes an Earth Engine session.*
 
     Accepts a flag internalConfig to specify whether to use the internal OAuth2 credentials.
 
-    If internalConfig is not set, Earth Engine Service Account Keys are fetched from a Firebase
-    Cloud Storage bucket and deleted upon session initialization.
+    If internalConfig is not set, the Earth Engine Service Account Key is fetched from a Firebase
+    Cloud Storage bucket into memory with eeCredentials(), never touching the disk. The credentials are
+    reused by later initializations in the same process, so only a cold start makes the single key fetch.
     This method is recommended for all production deployments.
 
     If internalConfig is set, the credentials file containing the refresh token for an OAuth2
@@ -63,12 +113,23 @@ def eeInitialize(internalConfig: bool = False) -> None:
     Args:
         internalConfig:     A bool that is used to determine whether or not use the internal OAuth2
                             credentials for Earth Engine.
+    Returns:
+        dict:       The startup timings in seconds of the credential fetch and the session initialization,
+                    and whether the credentials were cached, for startup benchmarks.
     Raises:
         FirebaseError:      Occurs if the Firebase pull fails.
         EERuntimeError:     Occurs if the Earth Engine initialization fails.
-        EnvironmentError:   Occurs if the environment cleanup fails.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Timing a worker start:*\n
+    ``>> timings = eeInitialize()``\n
+    ``>> print(timings["credentials"], timings["initialize"], timings["cached"])``
     """
+    timings = {"credentials": 0.0, "initialize": 0.0, "cached": True}
+
     if internalConfig:
+        began = time.perf_counter()
         try:
             ee.Initialize()
 
@@ -76,30 +137,20 @@ def eeInitialize(internalConfig: bool = False) -> None:
             ee.Authenticate()
             ee.Initialize()
 
-    else:
-        try:
-            fStorage = FirebaseStorage(bucket="antpod-apgis")
-            fStorage.downloadFolder(remoteFolder="ee-auth", localFolder="eeKeys")
-            fStorage.closeApp()
+        timings["initialize"] = time.perf_counter() - began
 
-        except Exception as e:
-            raise apexception.FirebaseError(f"Earth Engine Initialisation Failed @ Firebase Pull: {e}")
+    else:
+        began = time.perf_counter()
+        timings["cached"] = __eeCredentials__ is not None
+        credentials = eeCredentials()
+        timings["credentials"] = time.perf_counter() - began
 
         try:
-            import os
-            keyDir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "eeKeys/ee-auth")
-
-            serviceAccountID = jsonio.jsonRead(os.path.join(keyDir, "eeserviceacc.json"))['eeServiceAccount']
-            credentials = ee.ServiceAccountCredentials(serviceAccountID, os.path.join(keyDir, "eeservicekey.json"))
-
+            began = time.perf_counter()
             ee.Initialize(credentials=credentials)
+            timings["initialize"] = time.perf_counter() - began
 
         except Exception as e:
             raise apexception.EERuntimeError(f"Earth Engine Initialisation Failed @ EE Authentication: {e}")
 
-        try:
-            import shutil
-            shutil.rmtree(os.path.join(os.path.dirname(os.path.realpath(__file__)), "eeKeys"))
-
-        except Exception as e:
-            raise EnvironmentError(f"Earth Initialisation Succeeded but cleanup failed: {e}")
+    return timings
@@ -0,0 +1,300 @@
+"""
+Class module that implements the class *RasterCache*.
+
+The RasterCache class is a size-bounded local cache of exported rasters. Each export is identified by a
+content address, a stable hash of its export identity (field, sensor, product and date), so the same export
+always maps to the same local file, whichever Drive folder or bucket it is fetched from. Rasters are fetched
+only on a miss and the least recently used rasters are evicted to keep the cache under its byte budget.
+
+************************************************************************
+Copyrights (c) 2020 ANTPOD Designs Private Limited. All Rights Reserved.
+************************************************************************
+"""
+import os
+import glob
+import time
+import shutil
+import hashlib
+import pathlib
+import tempfile
+import threading
+
+import apgis.apraster as raster
+import apgis.apexception as apexception
+
+import typing
+pathString = typing.Union[str, pathlib.Path]
+
+CACHE_BYTES = 10 * 1024 * 1024 * 1024
+LOCK_EXT = ".lock"
+LOCK_TIMEOUT = 600
+LOCK_POLL = 0.05
+
+
+class RasterCache:
+    """
+    *Class for a size-bounded, content-addressed local cache of exported rasters.*
+
+    **Class Methods:**\n
+    - ``exportKey:``    *A staticmethod that returns the content address of an export.*
+    - ``fromDrive:``    *A staticmethod that returns a fetcher that downloads exports from Google Drive.*
+    - ``fromStorage:``  *A staticmethod that returns a fetcher that downloads exports from a Firebase bucket.*
+    - ``path:``         *A method that returns the local path of an export, fetching it on a miss.*
+    - ``evict:``        *A method that evicts the least recently used rasters until the cache fits its budget.*
+    - ``usage:``        *A method that returns the number of cached rasters and their total bytes.*
+    - ``clear:``        *A method that removes all the cached rasters.*
+
+    **Class Attributes:**\n
+    - ``root:``         The directory the rasters are cached in.
+    - ``maxBytes:``     The byte budget of the cache.
+    - ``fetcher:``      The default function that fetches a missing export.
+    - ``hits:``         The number of lookups served from the cache.
+    - ``misses:``       The number of lookups that fetched the export.
+    - ``evictions:``    The number of rasters evicted.
+
+    Rasters are stored as ``root/ab/abcdef....tif`` under the SHA-256 of their export identity. The modification
+    time of a raster is its last use, so the LRU order is shared by every process that uses the same root.\n
+    A fetch holds a lock file next to the raster, so two workers that miss on the same export wait for a single
+    download. The export is fetched into a hidden temporary directory in the root and renamed into place, so a
+    failed or interrupted fetch never leaves a partial raster in the cache.
+    """
+
+    def __init__(self, root: pathString, maxBytes: int = CACHE_BYTES, fetcher: typing.Callable = None):
+        """ **Constructor Method**\n
+        Yields a ``RasterCache`` object.
+
+        Args:
+            root:       A pathlike string to the cache directory. It is created if it does not exist.
+            maxBytes:   The byte budget of the cache. Defaults to 10 GiB.
+            fetcher:    A function called with the fileNamePrefix of a missing export and a directory, which
+                        downloads the export into the directory and returns its path, like the fetchers of
+                        fromDrive() and fromStorage(). Defaults to None.
+        Raises:
+            TypeError:      Occurs if the parameter type checks fail.
+            ValueError:     Occurs if maxBytes is invalid.
+        """
+        if not isinstance(root, (str, pathlib.Path)):
+            raise TypeError("RasterCache Construction Failed @ type check: root must be a pathlike string")
+
+        if not isinstance(maxBytes, int) or maxBytes < 1:
+            raise ValueError("RasterCache Construction Failed @ maxBytes check: maxBytes must be a positive int")
+
+        self.root = pathlib.Path(root)
+        self.maxBytes = maxBytes
+        self.fetcher = fetcher
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.__lock__ = threading.Lock()
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def exportKey(apfieldID: str, sensor: str, product: str, date) -> str:
+        """ *A staticmethod that returns the content address of an export from its identity.*
+
+        Args:
+            apfieldID:  The apfieldID of the Field.
+            sensor:     The sensor of the export, like 'L2A'.
+            product:    The product of the export, like 'NDVI'.
+            date:       The acquisition date as a 'YYYY-MM-DD' string or a Date object.
+        Returns:
+            str:        The hexadecimal content address of the export.
+        """
+        identity = "\n".join([apfieldID, sensor, product, getattr(date, "dateString", str(date))])
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def fromDrive(drive, drivepath: typing.Callable = None) -> typing.Callable:
+        """ *A staticmethod that returns a fetcher that downloads exports from Google Drive.*
+
+        Args:
+            drive:      A Drive object.
+            drivepath:  A function that returns the DrivePath of an export filename. Defaults to
+                        DrivePath.generateExportPath, the month folder of the date of the export.
+        Returns:
+            function:   A fetcher for a RasterCache.
+
+        Examples:
+            Some example uses of this method are:\n
+        *Caching exports from Drive:*\n
+        ``>> cache = RasterCache(root="rasterCache", fetcher=RasterCache.fromDrive(Drive()))``
+        """
+        from apgis.apcloud import DrivePath
+        drivepath = drivepath or DrivePath.generateExportPath
+
+        def fetch(fileNamePrefix, directory):
+            return drive.downloadFile(drivepath=drivepath(fileNamePrefix + raster.TIFF_EXT), downloadPath=directory)
+
+        return fetch
+
+    @staticmethod
+    def fromStorage(storage, remoteFolder: str) -> typing.Callable:
+        """ *A staticmethod that returns a fetcher that downloads exports from a folder of a Firebase bucket.*
+
+        Args:
+            storage:        A FirebaseStorage object, like FirebaseStorage.session().
+            remoteFolder:   The folder of the bucket the exports are in.
+        Returns:
+            function:   A fetcher for a RasterCache.
+
+        Examples:
+            Some example uses of this method are:\n
+        *Caching exports from a bucket:*\n
+        ``>> fetcher = RasterCache.fromStorage(FirebaseStorage.session(), remoteFolder="exports")``\n
+        ``>> cache = RasterCache(root="rasterCache", fetcher=fetcher)``
+        """
+        def fetch(fileNamePrefix, directory):
+            filename = os.path.join(directory, fileNamePrefix + raster.TIFF_EXT)
+            storage.downloadBlob(localName=filename, remoteName=f"{remoteFolder.rstrip('/')}/"
+                                                                f"{fileNamePrefix}{raster.TIFF_EXT}")
+            return filename
+
+        return fetch
+
+    def __filename__(self, key: str) -> pathlib.Path:
+        """ A method that returns the local path of a content address. """
+        return self.root / key[:2] / (key + raster.TIFF_EXT)
+
+    def __acquire__(self, lockFile: pathlib.Path) -> None:
+        """ A method that waits for and takes the lock file of a fill. Locks older than LOCK_TIMEOUT are stale. """
+        while True:
+            try:
+                os.close(os.open(lockFile, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return
+
+            except FileExistsError:
+                try:
+                    if time.time() - lockFile.stat().st_mtime > LOCK_TIMEOUT:
+                        lockFile.unlink()
+                        continue
+                except FileNotFoundError:
+                    continue
+
+                time.sleep(LOCK_POLL)
+
+    def path(self, apfieldID: str, sensor: str, product: str, date, fetcher: typing.Callable = None) -> str:
+        """ *A method that returns the local path of an export, fetching it only on a miss.*
+
+        A hit marks the raster as recently used. On a miss the export named
+        ``apfieldID-sensor-product-YYYY-MM-DD`` is fetched once, even if several workers miss on it together, and
+        the least recently used rasters are then evicted to keep the cache under its budget.
+
+        Args:
+            apfieldID:  The apfieldID of the Field.
+            sensor:     The sensor of the export, like 'L2A'.
+            product:    The product of the export, like 'NDVI'.
+            date:       The acquisition date as a 'YYYY-MM-DD' string or a Date object.
+            fetcher:    A function that fetches the export, overriding the fetcher of the cache. Defaults to None.
+        Returns:
+            str:        The local path of the cached raster.
+        Raises:
+            ValueError:     Occurs if the export is missing and there is no fetcher.
+            RasterError:    Occurs if the fetch fails.
+
+        Examples:
+            Some example uses of this method are:\n
+        *Reading a cached NDVI export:*\n
+        ``>> filename = cache.path(apfieldID="AP-demo000", sensor="L2A", product="NDVI", date="2020-08-23")``\n
+        ``>> with rasterio.open(filename) as source: ...``
+        """
+        key = self.exportKey(apfieldID=apfieldID, sensor=sensor, product=product, date=date)
+        filename = self.__filename__(key)
+        fileNamePrefix = "-".join([apfieldID, sensor, product, getattr(date, "dateString", str(date))])
+
+        if filename.is_file():
+            try:
+                os.utime(filename)
+                with self.__lock__:
+                    self.hits += 1
+                return str(filename)
+            except FileNotFoundError:
+                pass
+
+        fetcher = fetcher or self.fetcher
+        if fetcher is None:
+            raise ValueError(f"Raster Cache Failed @ fetcher check: {fileNamePrefix} is not cached and there is "
+                             f"no fetcher")
+
+        filename.parent.mkdir(parents=True, exist_ok=True)
+        lockFile = filename.with_suffix(LOCK_EXT)
+        self.__acquire__(lockFile=lockFile)
+
+        try:
+            if filename.is_file():
+                os.utime(filename)
+                with self.__lock__:
+                    self.hits += 1
+                return str(filename)
+
+            with tempfile.TemporaryDirectory(prefix=".fetch-", dir=self.root) as directory:
+                os.replace(fetcher(fileNamePrefix, directory), filename)
+
+            with self.__lock__:
+                self.misses += 1
+
+        except Exception as e:
+            raise apexception.RasterError(f"Raster Cache Failed @ Fetch {fileNamePrefix}: {e}")
+
+        finally:
+            lockFile.unlink(missing_ok=True)
+
+        self.evict(keep=filename)
+
+        return str(filename)
+
+    def evict(self, keep: pathString = None) -> int:
+        """ *A method that evicts the least recently used rasters until the cache fits its budget.*
+
+        Rasters that cannot be removed, like those open on Windows, are skipped.
+
+        Args:
+            keep:       A pathlike string to a raster that is never evicted. Defaults to None.
+        Returns:
+            int:        The number of evicted rasters.
+        """
+        entries = []
+        for name in glob.glob(str(self.root / "*" / ("*" + raster.TIFF_EXT))):
+            try:
+                stat = os.stat(name)
+                entries.append((stat.st_mtime, stat.st_size, name))
+            except FileNotFoundError:
+                continue
+
+        total = sum(size for _, size, _ in entries)
+        keep = os.path.abspath(keep) if keep is not None else None
+
+        evicted = 0
+        for _, size, name in sorted(entries):
+            if total <= self.maxBytes:
+                break
+
+            if os.path.abspath(name) == keep:
+                continue
+
+            try:
+                os.remove(name)
+                total -= size
+                evicted += 1
+            except OSError:
+                continue
+
+        with self.__lock__:
+            self.evictions += evicted
+
+        return evicted
+
+    def usage(self) -> dict:
+        """ *A method that returns the number of cached rasters and their total bytes.*
+
+        Returns:
+            dict:       A dictionary with the count of rasters, their bytes and the maxBytes of the cache.
+        """
+        sizes = [os.path.getsize(name) for name in glob.glob(str(self.root / "*" / ("*" + raster.TIFF_EXT)))]
+        return {"rasters": len(sizes), "bytes": sum(sizes), "maxBytes": self.maxBytes}
+
+    def clear(self) -> None:
+        """ *A method that removes all the cached rasters.* """
+        for directory in self.root.iterdir():
+            if directory.is_dir():
+                shutil.rmtree(directory, ignore_errors=True)
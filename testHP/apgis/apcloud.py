@@ -6,15 +6,28 @@ Implements the classes:\n
 - ``CloudStorage`` for Google Cloud Storage.\n
 - ``FireStore`` for Cloud FireStore.\n
 - ``FirebaseStorage`` for Firebase Cloud Storage.\n
+- ``LocalObjectStore`` for a local stand-in of a Cloud Storage bucket.\n
+- ``LocalDriveServer`` for a local stand-in of Google Drive.\n
+- ``LocalFireStore`` for a local stand-in of Cloud FireStore.\n
 
 ************************************************************************
 Copyrights (c) 2020 ANTPOD Designs Private Limited. All Rights Reserved.
 ************************************************************************
 """
 import os
+import time
+import atexit
+import glob
+import io
+import json
+import base64
 import shutil
+import hashlib
 import pathlib
+import threading
+import urllib.request
 
+import apgis.apjsonio as jsonio
 import apgis.apexception as apexception
 from apgis.apconfig import Config
 
@@ -23,6 +36,44 @@ pathString = typing.Union[str, pathlib.Path]
 
 CONFIG = Config()
 
+CHUNK_SIZE = 8 * 1024 * 1024
+SESSION_POOL_SIZE = 16
+COMPOSITE_THRESHOLD = 64 * 1024 * 1024
+COMPOSITE_PART_SIZE = 32 * 1024 * 1024
+COMPOSITE_MAX_PARTS = 32
+FIRESTORE_BATCH_WRITES = 500
+FIRESTORE_BATCH_BYTES = 10 * 1024 * 1024
+FIRESTORE_DOCUMENT_BYTES = 1024 * 1024
+DRIVE_CACHE_TTL = 300
+PART_EXT = ".part"
+SYNC_INDEX = ".apgis-sync.json"
+
+
+def fileMD5(filename: pathString) -> str:
+    """ A function that returns the base64 MD5 digest of a file, as in the md5_hash of a Cloud Storage blob. """
+    digest = hashlib.md5()
+    with open(filename, "rb") as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+    return base64.b64encode(digest.digest()).decode()
+
+
+def fileCRC32C(filename: pathString) -> typing.Optional[str]:
+    """ A function that returns the base64 CRC32C of a file, as in the crc32c of a Cloud Storage blob.
+    Returns None if the google-crc32c library, installed along with the Cloud Storage client, is unavailable. """
+    try:
+        import google_crc32c
+    except ImportError:
+        return None
+
+    checksum = google_crc32c.Checksum()
+    with open(filename, "rb") as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            checksum.update(chunk)
+
+    return base64.b64encode(checksum.digest()).decode()
+
 
 class DrivePath:
     """
@@ -89,7 +140,8 @@ class DrivePath:
     def generateExportPath(filename: str):
         """ *A staticmethod that generates a drivepath for files.*
 
-        Only allows GeoTIFF files with a valid AP Asset ID.
+        Only allows GeoTIFF files with a valid AP Asset ID. The folder is given by the trailing ``YYYY-MM-DD`` date
+        of the filename, so product exports like ``APX000-01-L2A-NDVI-2020-08-23.tif`` are supported as well.
 
         Args:
             filename:       A filename that represents the AP Asset ID.
@@ -116,7 +168,7 @@ class DrivePath:
             raise ValueError
 
         try:
-            year, month = name[3], int(name[4])
+            year, month = name[-3], int(name[-2])
             drivepath = f"root/Test Collections/{year}/{month}.{monthstring[month]}/{filename}"
             drivepath = DrivePath(drivepath=drivepath)
 
@@ -133,17 +185,25 @@ class Drive:
     **Class Methods:**\n
     - ``traverseDrive:``    A method that traverses through a drivepath
     - ``checkFile:``        A method that checks for the existence of a file
+    - ``checkFiles:``       A method that checks for the existence of many files
     - ``downloadFile:``     A method that downloads a file
+    - ``downloadMany:``     A method that downloads many files concurrently
+    - ``uploadFile:``       A method that uploads a file
+    - ``invalidate:``       A method that clears the cached folder listings
 
     **Class Attributes:**\n
     - ``drive:``            The Google Drive session instance.
+    - ``cacheTTL:``         The seconds for which folder IDs and listings are cached.
 
     Initialises a Google Drive session using the pyDrive wrapper library.
     Allows basic file I/O and file existence testing. Authentication is done
-    by remote key retrieval from Firebase Cloud Storage and disposal.
+    by remote key retrieval from Firebase Cloud Storage and disposal.\n
+    The IDs of the folders on a drivepath and the listings of the folders are cached for cacheTTL seconds,
+    so repeated checks and downloads in the same folder only list it once.\n
+    Files are streamed in chunks from their download URL to an explicit path, so downloads can run concurrently.
     """
 
-    def __init__(self):
+    def __init__(self, cacheTTL: float = DRIVE_CACHE_TTL, client=None):
         """ **Constructor Method**\n
         Yields a ``Drive`` object.
 
@@ -156,6 +216,10 @@ class Drive:
         are fetched from a Firebase Cloud Storage bucket and then deleted upon
         initialization.\n
 
+        Args:
+            cacheTTL:   The seconds for which folder IDs and listings are cached. Defaults to 300.
+            client:     A Drive client like LocalDriveServer.client used instead of authenticating with PyDrive.
+                        Defaults to None.
         Raises:
             FirebaseError:  Occurs if the Firebase pull fails.
             DriveError:     Occurs if the Google Drive Authentication fails.
@@ -176,13 +240,21 @@ class Drive:
             *PyDrive wrapper documentation for Google Drive Python Client Library:*
         https://pythonhosted.org/PyDrive/quickstart.html
         """
+        self.cacheTTL = cacheTTL
+        self.__folderIDs__ = {}
+        self.__listings__ = {}
+        self.__cacheLock__ = threading.Lock()
+
+        if client is not None:
+            self.driveClient = client
+            return
+
         from pydrive.auth import GoogleAuth
         from pydrive.drive import GoogleDrive
 
         try:
-            fStorage = FirebaseStorage(bucket="antpod-apgis")
-            fStorage.downloadFolder(remoteFolder="gdrive-auth", localFolder="driveKeys")
-            fStorage.closeApp()
+            FirebaseStorage.session(bucket="antpod-apgis").downloadFolder(remoteFolder="gdrive-auth",
+                                                                          localFolder="driveKeys")
 
         except Exception as e:
             raise apexception.FirebaseError(f"Google Drive Initialisation Failed @ Firebase Pull: {e}")
@@ -210,9 +282,70 @@ class Drive:
         except Exception as e:
             raise EnvironmentError(f"Google Drive Initialisation Succeeded but cleanup failed: {e}")
 
+    def __list_folder__(self, folderID: str) -> list:
+        """ A method that returns the cached listing of a folder, listing it if it is missing or expired. """
+        with self.__cacheLock__:
+            cached = self.__listings__.get(folderID)
+            if cached and cached[1] > time.monotonic():
+                return cached[0]
+
+        fileList = self.driveClient.ListFile({'q': f"'{folderID}' in parents and trashed=false"}).GetList()
+        with self.__cacheLock__:
+            self.__listings__[folderID] = (fileList, time.monotonic() + self.cacheTTL)
+
+        return fileList
+
+    def __folder_id__(self, pathDirs: list) -> str:
+        """ A method that resolves the ID of the folder at the end of a list of path directories. """
+        folderID = 'root'
+        for depth, pathDir in enumerate(pathDirs):
+            key = "/".join(pathDirs[:depth + 1])
+            with self.__cacheLock__:
+                cached = self.__folderIDs__.get(key)
+
+            if cached and cached[1] > time.monotonic():
+                folderID = cached[0]
+                continue
+
+            folders = [file for file in self.__list_folder__(folderID=folderID) if file['title'] == pathDir]
+            if not folders:
+                raise apexception.DriveError(f"{key} could not be found")
+
+            folderID = folders[-1]['id']
+            with self.__cacheLock__:
+                self.__folderIDs__[key] = (folderID, time.monotonic() + self.cacheTTL)
+
+        return folderID
+
+    def invalidate(self, drivepath: DrivePath = None) -> None:
+        """ *A method that clears the cached listing of the folder of a drivepath, or all the cached folders.*
+
+        Call it when files are added to a folder outside this session, like when an Earth Engine export to
+        the Drive completes, so the next check lists the folder again.
+
+        Args:
+            drivepath:  A DrivePath in the folder to clear. Defaults to None and clears all folder IDs and listings.
+
+        Examples:
+            Some example uses of this method are:\n
+        *Clearing the listing of an export folder:*\n
+        ``>> gdrive.invalidate(drivepath=DrivePath.generateExportPath("APX000-01-L2A-NDVI-2020-08-23.tif"))``
+        """
+        with self.__cacheLock__:
+            if drivepath is None:
+                self.__folderIDs__.clear()
+                self.__listings__.clear()
+                return
+
+            cached = self.__folderIDs__.get(drivepath.path)
+            if cached:
+                self.__listings__.pop(cached[0], None)
+
     def traverseDrive(self, drivepath: DrivePath) -> list:
         """ *A method that traverses through a given drivepath from the root of the Drive.*
 
+        The folder IDs and listings along the drivepath are served from the cache while they are fresh.
+
         Args:
             drivepath:  A DrivePath that represents the path to a file in Google Drive.
         Returns:
@@ -227,20 +360,8 @@ class Drive:
         ``>> fileList = gdrive.traversePath("root/testfolder/testfile.txt")``
         """
         try:
-            folder = {}
-            fileList = self.driveClient.ListFile({'q': "'root' in parents and trashed=false"}).GetList()
-
-            for pathDir in drivepath.pathDirs:
-                for file in fileList:
-                    if file['title'] == pathDir:
-                        folder = file
-                if folder:
-                    folderID = folder['id']
-                    fileList = self.driveClient.ListFile({'q': f"'{folderID}' in parents and trashed=false"}).GetList()
-                else:
-                    raise apexception.DriveError
-
-            return fileList
+            folderID = self.__folder_id__(pathDirs=drivepath.pathDirs)
+            return self.__list_folder__(folderID=folderID)
 
         except Exception as e:
             raise apexception.DriveError(f"Google Drive Path Traversal Failed @ Runtime: {e}")
@@ -272,12 +393,100 @@ class Drive:
         except Exception as e:
             raise apexception.DriveError(f"Google Drive File Check Failed @ Runtime: {e}")
 
-    def downloadFile(self, drivepath: DrivePath, downloadPath: pathString) -> None:
-        """ *A method that downloads a specified file from Google Drive into the current directory.*
+    def checkFiles(self, drivepaths: list) -> dict:
+        """ *A method that checks whether each of a list of files exists given their drivepaths.*
+
+        The drivepaths are grouped by their folder and each folder is listed once for all of its files.
+        Files in a folder that does not exist are reported as missing.
+
+        Args:
+            drivepaths: A list of DrivePaths that represent the paths to files in Google Drive.
+        Returns:
+            dict:       A dictionary with the drivepath strings and bools representing whether the files exist
+                        as key-value pairs.
+        Raises:
+            DriveError: Occurs if the file check runtime fails.
+
+        Examples:
+            Some example uses of this method are:\n
+        *Checking the exports of a month:*\n
+        ``>> paths = [DrivePath.generateExportPath(filename) for filename in filenames]``\n
+        ``>> missing = [path for path, exists in gdrive.checkFiles(paths).items() if not exists]``
+        """
+        try:
+            folders = {}
+            for drivepath in drivepaths:
+                folders.setdefault(drivepath.path, []).append(drivepath)
+
+            checks = {}
+            for path, folderPaths in folders.items():
+                try:
+                    titles = {file['title'] for file in self.traverseDrive(drivepath=folderPaths[0])}
+                except apexception.DriveError:
+                    titles = set()
+
+                for drivepath in folderPaths:
+                    checks[drivepath.drivepath] = drivepath.filename in titles
+
+            return checks
+
+        except Exception as e:
+            raise apexception.DriveError(f"Google Drive File Check Failed @ Runtime: {e}")
+
+    def __access_token__(self) -> str:
+        """ A method that returns the OAuth2 access token of the session, refreshing it if it has expired. """
+        with self.__cacheLock__:
+            auth = self.driveClient.auth
+            if auth.access_token_expired:
+                auth.Refresh()
+            return auth.credentials.access_token
+
+    def __stream__(self, file, filename: str, retries: int = 3, timeout: float = 60) -> int:
+        """ A method that streams a Drive file in chunks into a part file, renamed to the filename once complete.
+        A failed transfer is retried from the bytes already written with a range request. Returns the bytes read. """
+        part = f"{filename}{PART_EXT}"
+        if os.path.isfile(part):
+            os.remove(part)
+
+        size = int(file['fileSize']) if file.get('fileSize') is not None else None
+        transferred = 0
+        for attempt in range(retries + 1):
+            try:
+                offset = os.path.getsize(part) if os.path.isfile(part) else 0
+                headers = {"Authorization": f"Bearer {self.__access_token__()}"}
+                if offset:
+                    headers["Range"] = f"bytes={offset}-"
+
+                request = urllib.request.Request(file['downloadUrl'], headers=headers)
+                with urllib.request.urlopen(request, timeout=timeout) as response, \
+                        open(part, "ab" if offset and response.status == 206 else "wb") as sink:
+                    for chunk in iter(lambda: response.read(CHUNK_SIZE), b""):
+                        sink.write(chunk)
+                        transferred += len(chunk)
+
+                if size is not None and os.path.getsize(part) != size:
+                    raise IOError(f"{os.path.getsize(part)} of {size} bytes received")
+
+                os.replace(part, filename)
+                return transferred
+
+            except Exception:
+                if attempt == retries:
+                    if os.path.isfile(part):
+                        os.remove(part)
+                    raise
+
+    def downloadFile(self, drivepath: DrivePath, downloadPath: pathString) -> str:
+        """ *A method that downloads a specified file from Google Drive into a directory.*
+
+        The file is streamed in chunks into a part file in the directory, which is renamed to the filename once
+        the download completes, so a failed download never leaves a partial file behind.
 
         Args:
             drivepath:      A DrivePath that represents the path to a file in Google Drive.
             downloadPath:   A string that represents the download path.
+        Returns:
+            str:            The path of the downloaded file.
         Raises:
             FileNotFoundError:  Occurs if the file was not found at drivepath.
             DriveError:     Occurs if the download runtime failed.
@@ -286,7 +495,7 @@ class Drive:
             Some example uses of this method are:\n
         *Downloading a file:*\n
         ``>> gdrive = Drive()``\n
-        ``>> gdrive.getFile("root/testfolder/testfile.txt")``
+        ``>> gdrive.downloadFile(DrivePath("root/testfolder/testfile.txt"), downloadPath="downloads")``
         """
         try:
             image = {}
@@ -296,39 +505,609 @@ class Drive:
                     image = file
                     break
         except Exception as e:
-            raise apexception.DriveError
+            raise apexception.DriveError(f"Google Drive File Retrieval Failed @ File discovery: {e}")
 
         if image == {}:
             raise FileNotFoundError(f"Google Drive File Retrieval Failed @ File discovery: file was not found")
 
         try:
-            currentDir = os.getcwd()
-            os.chdir(os.path.join(currentDir, downloadPath))
+            os.makedirs(downloadPath, exist_ok=True)
+            filename = os.path.join(downloadPath, image['title'])
+            self.__stream__(file=image, filename=filename)
+            return filename
+
+        except Exception as e:
+            raise apexception.DriveError(f"Google Drive File Retrieval Failed @ Download runtime: {e}")
+
+    def downloadMany(self,
+                     drivepaths: list,
+                     dest: pathString,
+                     maxWorkers: int = 8,
+                     retries: int = 3,
+                     progress: typing.Callable = None) -> dict:
+        """ *A method that downloads many files from Google Drive into a directory concurrently.*
+
+        The files are located with one listing per folder, as in checkFiles(), and streamed into the directory on
+        a thread pool of at most maxWorkers threads. Each file is written to a part file that is renamed once
+        it is complete. Files that are not found are reported as missing.
+
+        Args:
+            drivepaths:     A list of DrivePaths that represent the paths to files in Google Drive.
+            dest:           A string that represents the download path.
+            maxWorkers:     The maximum number of concurrent downloads. Defaults to 8.
+            retries:        The number of times a failed transfer is resumed. Defaults to 3.
+            progress:       A function called with the report after each file. Defaults to None.
+        Returns:
+            dict:       A report with the count of files, the lists of downloaded paths, missing drivepaths and
+                        failures, the bytes transferred, the seconds taken and the throughput in bytes per second.
+        Raises:
+            ValueError:     Occurs if maxWorkers is invalid.
+            DriveError:     Occurs if the listing fails or any file fails to download.
+
+        Examples:
+            Some example uses of this method are:\n
+        *Downloading the exports of a month:*\n
+        ``>> paths = [DrivePath.generateExportPath(filename) for filename in filenames]``\n
+        ``>> report = gdrive.downloadMany(drivepaths=paths, dest="exports")``
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        if not isinstance(maxWorkers, int) or maxWorkers < 1:
+            raise ValueError("Google Drive Batch Retrieval Failed @ maxWorkers check: maxWorkers must be "
+                             "a positive int")
+
+        report = {"files": len(drivepaths), "completed": 0, "downloaded": [], "missing": [], "failed": [],
+                  "bytes": 0, "seconds": 0.0, "throughput": 0.0}
+
+        try:
+            folders = {}
+            for drivepath in drivepaths:
+                folders.setdefault(drivepath.path, []).append(drivepath)
+
+            downloads = []
+            for path, folderPaths in folders.items():
+                try:
+                    files = {file['title']: file for file in self.traverseDrive(drivepath=folderPaths[0])}
+                except apexception.DriveError:
+                    files = {}
 
-            image.GetContentFile(image['title'])
+                for drivepath in folderPaths:
+                    if drivepath.filename in files:
+                        downloads.append((drivepath, files[drivepath.filename]))
+                    else:
+                        report["missing"].append(drivepath.drivepath)
 
-            os.chdir(currentDir)
+            os.makedirs(dest, exist_ok=True)
 
         except Exception as e:
-            raise apexception.DriveError(f"Google Drive File Retrieval Failed @ Download runtime: {e}")
+            raise apexception.DriveError(f"Google Drive Batch Retrieval Failed @ File discovery: {e}")
+
+        began = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=maxWorkers) as pool:
+            futures = {pool.submit(self.__stream__, file=file, filename=os.path.join(dest, file['title']),
+                                   retries=retries): (drivepath, file) for drivepath, file in downloads}
+
+            for future in as_completed(futures):
+                drivepath, file = futures[future]
+                try:
+                    report["bytes"] += future.result()
+                    report["downloaded"].append(os.path.join(dest, file['title']))
+
+                except Exception as e:
+                    report["failed"].append(f"{drivepath.drivepath}: {e}")
+
+                report["completed"] += 1
+                report["seconds"] = time.perf_counter() - began
+                report["throughput"] = report["bytes"] / report["seconds"] if report["seconds"] else 0.0
+                if progress is not None:
+                    progress(report)
+
+        if report["failed"]:
+            raise apexception.DriveError(f"Google Drive Batch Retrieval Failed @ Download runtime: "
+                                         f"{len(report['failed'])} files failed: {report['failed']}")
+
+        return report
+
+    def uploadFile(self, localFile: pathString, drivepath: DrivePath) -> None:
+        """ *A method that uploads a local file into Google Drive at a drivepath.*
+
+        The folder of the drivepath must exist. Its cached listing is cleared so the file is found by the next check.
+
+        Args:
+            localFile:      A string that represents the path of the file to upload.
+            drivepath:      A DrivePath that represents the path to upload the file into in Google Drive.
+        Raises:
+            FileNotFoundError:  Occurs if the local file was not found.
+            DriveError:     Occurs if the upload runtime failed.
+
+        Examples:
+            Some example uses of this method are:\n
+        *Uploading a file:*\n
+        ``>> gdrive = Drive()``\n
+        ``>> gdrive.uploadFile(localFile="testfile.txt", drivepath=DrivePath("root/testfolder/testfile.txt"))``
+        """
+        if not os.path.isfile(localFile):
+            raise FileNotFoundError(f"Google Drive File Upload Failed @ isfile check: {localFile} could not be found")
+
+        try:
+            folderID = self.__folder_id__(pathDirs=drivepath.pathDirs)
+            file = self.driveClient.CreateFile({'title': drivepath.filename, 'parents': [{'id': folderID}]})
+            file.SetContentFile(str(localFile))
+            file.Upload()
+
+        except Exception as e:
+            raise apexception.DriveError(f"Google Drive File Upload Failed @ Upload runtime: {e}")
+
+        finally:
+            self.invalidate(drivepath=drivepath)
 
 
 class CloudStorage:
-    """ **Not Currently Implemented.**
+    """
+    *Class for Google Cloud Storage client interface.*
 
-    ``CloudStorage`` is not currently not implemented.\n
-    This namespace is reserved for future use.
+    **Class Methods:**\n
+    - ``uploadBlob:``       A method that uploads a file into the bucket, in parallel parts if it is large.
+    - ``downloadBlob:``     A method that downloads a blob from the bucket.
+    - ``readRange:``        A method that reads a byte range of a blob.
+    - ``listBlobs:``        A method that lists the metadata of the blobs under a batch of prefixes.
+    - ``exportPrefix:``     A staticmethod that returns the blob name prefix of the exports of a Field.
+
+    **Class Attributes:**\n
+    - ``client:``   The google-cloud-storage client, shared by all CloudStorage objects of the process.
+    - ``bucket:``   The storage bucket.
+
+    Initialises a Cloud Storage bucket with the google-cloud-storage library and the Application Default
+    Credentials. The storage client and its HTTP connection pool are created once per process and shared by
+    every bucket and thread, so parallel transfers reuse their connections.\n
+    Files larger than 64 MiB are uploaded as parallel composite uploads: the file is uploaded as up to 32 parts
+    at once, which are composed into the blob and deleted.\n
+    A LocalObjectStore can be passed as the store to work against a local directory instead of Cloud Storage.
     """
-    pass
+    __client__ = None
+    __clientLock__ = threading.Lock()
+
+    def __init__(self, bucket: str = "antpod-apgis-exports", store=None, poolSize: int = SESSION_POOL_SIZE):
+        """ **Constructor Method**\n
+        Yields a ``CloudStorage`` object.
+
+        Args:
+            bucket:     The bucket to be accessed. Defaults to "antpod-apgis-exports", the bucket of the exports.
+            store:      An object store like LocalObjectStore used as the bucket. Defaults to None.
+            poolSize:   The maximum number of pooled HTTP connections of the shared client if it is created.
+                        Defaults to 16.
+        Raises:
+            CloudStorageError:  Occurs if the Cloud Storage initialisation fails.
+
+        Examples:
+            Some example uses of this class are:\n
+        *Initialising the exports bucket:*\n
+        ``>> gcs = CloudStorage()``\n
+        *Initialising a CloudStorage object over a local stand-in:*\n
+        ``>> gcs = CloudStorage(store=LocalObjectStore(root="bucketDir"))``
+
+        References:
+            *Python Client for Google Cloud Storage:*\n
+        https://googleapis.dev/python/storage/latest/index.html
+        """
+        if store is not None:
+            self.client, self.bucket = None, store
+            return
+
+        try:
+            with CloudStorage.__clientLock__:
+                if CloudStorage.__client__ is None:
+                    from google.cloud import storage
+                    from requests.adapters import HTTPAdapter
+
+                    client = storage.Client()
+                    client._http.mount("https://", HTTPAdapter(pool_connections=poolSize, pool_maxsize=poolSize))
+                    CloudStorage.__client__ = client
+
+            self.client = CloudStorage.__client__
+            self.bucket = self.client.bucket(bucket)
+
+        except Exception as e:
+            raise apexception.CloudStorageError(f"Cloud Storage Initialisation Failed @ Client Initialize: {e}")
+
+    @staticmethod
+    def exportPrefix(apfieldID: str, sensor: str = None, product: str = None, folder: str = None) -> str:
+        """ *A staticmethod that returns the blob name prefix of the exports of a Field.*
+
+        Exports are named ``apfieldID-sensor-product-YYYY-MM-DD``, so the prefix narrows the listing to a Field,
+        or to a sensor or product of the Field.
+
+        Args:
+            apfieldID:  The apfieldID of the Field.
+            sensor:     The sensor of the exports, like 'L2A'. Defaults to None.
+            product:    The product of the exports, like 'NDVI'. Requires the sensor. Defaults to None.
+            folder:     The folder of the bucket the exports are in. Defaults to None (bucket root).
+        Returns:
+            str:        The blob name prefix.
+        """
+        parts = [apfieldID] + ([sensor] if sensor else []) + ([product] if sensor and product else [])
+        return (f"{folder.strip('/')}/" if folder else "") + "-".join(parts) + "-"
+
+    def uploadBlob(self,
+                   localName: pathString,
+                   remoteName: str,
+                   maxWorkers: int = 8,
+                   partSize: int = COMPOSITE_PART_SIZE) -> None:
+        """ *A method that uploads a file into the bucket.*
+
+        Files larger than 64 MiB are split into parts of partSize bytes, or more if that would exceed 32 parts,
+        which are uploaded on a pool of maxWorkers threads and composed into the blob. The parts are deleted
+        afterwards, even if the upload fails. The CRC32C of the composed blob is checked against the file when
+        the google-crc32c library is installed.
+
+        Args:
+            localName:      A pathString representing the file to upload.
+            remoteName:     The name of the blob to upload the file into.
+            maxWorkers:     The maximum number of parts uploaded at once. Defaults to 8.
+            partSize:       The size of the parts in bytes. Defaults to 32 MiB.
+        Raises:
+            FileNotFoundError:  Occurs if the file cannot be found.
+            CloudStorageError:  Occurs if the upload fails.
+
+        Examples:
+            Some example uses of this method are:\n
+        *Uploading a large artifact:*\n
+        ``>> gcs.uploadBlob(localName="APX000-01-timelapse.gif", remoteName="artifacts/APX000-01-timelapse.gif")``
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        if not os.path.isfile(localName):
+            raise FileNotFoundError(f"Upload to Cloud Storage Failed @ isfile check: {localName} could not be found")
+
+        size = os.path.getsize(localName)
+        blob = self.bucket.blob(remoteName)
+
+        if size <= COMPOSITE_THRESHOLD:
+            try:
+                blob.upload_from_filename(str(localName))
+                return
+
+            except Exception as e:
+                raise apexception.CloudStorageError(f"Upload to Cloud Storage Failed @ upload runtime: {e}")
+
+        partSize = max(partSize, -(-size // COMPOSITE_MAX_PARTS))
+        parts = [self.bucket.blob(f"{remoteName}{PART_EXT}-{i:04d}") for i in range(-(-size // partSize))]
+
+        def uploadPart(i):
+            with open(localName, "rb") as file:
+                file.seek(i * partSize)
+                parts[i].upload_from_string(file.read(partSize))
+
+        try:
+            with ThreadPoolExecutor(max_workers=maxWorkers) as pool:
+                list(pool.map(uploadPart, range(len(parts))))
+
+            blob.compose(parts)
+            blob.reload()
+
+            checksum = fileCRC32C(localName)
+            if checksum is not None and blob.crc32c is not None and blob.crc32c != checksum:
+                raise IOError(f"CRC32C of {remoteName} does not match {localName}")
+
+        except Exception as e:
+            raise apexception.CloudStorageError(f"Upload to Cloud Storage Failed @ composite upload: {e}")
+
+        finally:
+            for part in parts:
+                try:
+                    part.delete()
+                except Exception:
+                    pass
+
+    def downloadBlob(self, localName: pathString, remoteName: str) -> None:
+        """ *A method that downloads a blob from the bucket.*
+
+        Args:
+            localName:      A pathString representing the path to download the file into locally.
+            remoteName:     The name of the blob to download.
+        Raises:
+            CloudStorageError:  Occurs if the blob download fails.
+
+        Examples:
+            Some example uses of this method are:\n
+        *Downloading an export:*\n
+        ``>> gcs.downloadBlob(localName="ndvi.tif", remoteName="APX000-01-L2A-NDVI-2020-08-23.tif")``
+        """
+        try:
+            self.bucket.blob(remoteName).download_to_filename(str(localName))
+
+        except Exception as e:
+            raise apexception.CloudStorageError(f"Download from Cloud Storage Failed @ download runtime: {e}")
+
+    def readRange(self, remoteName: str, start: int, end: int) -> bytes:
+        """ *A method that reads the bytes start to end, inclusive, of a blob without downloading the rest.*
+
+        Args:
+            remoteName:     The name of the blob.
+            start:          The offset of the first byte.
+            end:            The offset of the last byte.
+        Returns:
+            bytes:      The bytes of the range.
+        Raises:
+            CloudStorageError:  Occurs if the range read fails.
+
+        Examples:
+            Some example uses of this method are:\n
+        *Reading the header of a GeoTIFF:*\n
+        ``>> header = gcs.readRange(remoteName="APX000-01-L2A-NDVI-2020-08-23.tif", start=0, end=16383)``
+        """
+        try:
+            buffer = io.BytesIO()
+            self.bucket.blob(remoteName).download_to_file(buffer, start=start, end=end)
+            return buffer.getvalue()
+
+        except Exception as e:
+            raise apexception.CloudStorageError(f"Range Read from Cloud Storage Failed @ download runtime: {e}")
+
+    def listBlobs(self, prefixes, dates: list = None, maxWorkers: int = 8) -> dict:
+        """ *A method that lists the metadata of the blobs under a batch of prefixes.*
+
+        The prefixes are listed concurrently on a pool of maxWorkers threads. Use exportPrefix() for the prefixes
+        of the exports of Fields, and dates to keep only the exports of some acquisition dates.
+
+        Args:
+            prefixes:   A blob name prefix or a list of prefixes.
+            dates:      A list of 'YYYY-MM-DD' dates the blob names must contain one of. Defaults to None.
+            maxWorkers: The maximum number of prefixes listed at once. Defaults to 8.
+        Returns:
+            dict:       A dictionary with the prefixes and the lists of the metadata of their blobs, each a dictionary
+                        with the name, size, md5_hash, crc32c and generation of the blob, as key-value pairs.
+        Raises:
+            CloudStorageError:  Occurs if the listing fails.
+
+        Examples:
+            Some example uses of this method are:\n
+        *Listing the NDVI exports of two Fields for a date:*\n
+        ``>> prefixes = [CloudStorage.exportPrefix(field, "L2A", "NDVI") for field in ["APX000", "APX001"]]``\n
+        ``>> listing = gcs.listBlobs(prefixes=prefixes, dates=["2020-08-23"])``
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        prefixes = [prefixes] if isinstance(prefixes, str) else list(prefixes)
+
+        def listPrefix(prefix):
+            return [{"name": blob.name, "size": blob.size, "md5_hash": blob.md5_hash, "crc32c": blob.crc32c,
+                     "generation": blob.generation} for blob in self.bucket.list_blobs(prefix=prefix)
+                    if not dates or any(date in blob.name for date in dates)]
+
+        try:
+            with ThreadPoolExecutor(max_workers=maxWorkers) as pool:
+                return dict(zip(prefixes, pool.map(listPrefix, prefixes)))
+
+        except Exception as e:
+            raise apexception.CloudStorageError(f"Cloud Storage Listing Failed @ list runtime: {e}")
 
 
 class FireStore:
-    """ **Not Currently Implemented.**
+    """
+    *Class for a Cloud FireStore store of per-field time-series results.*
+
+    **Class Methods:**\n
+    - ``documentSize:``     A staticmethod that returns the stored size of a document.
+    - ``upsert:``           A method that buffers the results of a field for a date.
+    - ``flush:``            A method that commits the buffered results in batches.
+    - ``readSeries:``       A method that returns the stored results of a field.
 
-    ``FireStore`` is not currently not implemented.\n
-    This namespace is reserved for future use.
+    **Class Attributes:**\n
+    - ``client:``       The FireStore client.
+    - ``collection:``   The root collection of the results.
+    - ``pending:``      The number of buffered documents.
+    - ``commits:``      The number of batch commits made.
+    - ``written:``      The number of documents written.
+
+    The results of a field for a date, like its mean NDVI and NDMI, its scores and its stress zones, are stored
+    in the document ``collection/apfieldID/series/YYYY-MM-DD``. Upserts are merged into the document, so
+    writing the same results again leaves it unchanged and new results add to it.\n
+    Upserts are buffered and committed in batches of at most 500 writes and 10 MiB, the FireStore limits, once
+    the buffer holds a full batch, when flush() is called or when the store is used as a context manager and
+    the block exits. Upserts of the same document in the buffer are merged into a single write.\n
+    The client of the shared FirebaseStorage session app is used, which connects to the FireStore emulator if
+    FIRESTORE_EMULATOR_HOST is set. A LocalFireStore can be passed as the client to work offline.
     """
-    pass
+
+    def __init__(self, collection: str = "fieldResults", client=None, bucket: str = "antpod-apgis",
+                 batchWrites: int = FIRESTORE_BATCH_WRITES):
+        """ **Constructor Method**\n
+        Yields a ``FireStore`` object.
+
+        Args:
+            collection:     The root collection of the results. Defaults to "fieldResults".
+            client:         A FireStore client like LocalFireStore. Defaults to the client of the shared
+                            FirebaseStorage session of the bucket.
+            bucket:         The bucket of the FirebaseStorage session. Defaults to "antpod-apgis".
+            batchWrites:    The maximum number of writes of a batch commit, at most 500. Defaults to 500.
+        Raises:
+            ValueError:     Occurs if batchWrites is invalid.
+            FireStoreError: Occurs if the FireStore initialisation fails.
+
+        Examples:
+            Some example uses of this class are:\n
+        *Storing the mean NDVI of fields:*\n
+        ``>> with FireStore() as results:``\n
+        ``>>     for apfieldID, ndvi in means.items():``\n
+        ``>>         results.upsert(apfieldID=apfieldID, date="2020-08-23", values={"NDVI": ndvi})``
+
+        References:
+            *Cloud Firestore:*\n
+        https://firebase.google.com/docs/firestore
+        """
+        if not isinstance(batchWrites, int) or not 1 <= batchWrites <= FIRESTORE_BATCH_WRITES:
+            raise ValueError(f"FireStore Initialisation Failed @ batchWrites check: batchWrites must be an int "
+                             f"from 1 to {FIRESTORE_BATCH_WRITES}")
+
+        if client is None:
+            try:
+                from firebase_admin import firestore
+                client = firestore.client(app=FirebaseStorage.session(bucket=bucket).app)
+
+            except Exception as e:
+                raise apexception.FireStoreError(f"FireStore Initialisation Failed @ FireStore Client: {e}")
+
+        self.client = client
+        self.collection = collection
+        self.batchWrites = batchWrites
+        self.commits = 0
+        self.written = 0
+
+        self.__buffer__ = {}
+        self.__lock__ = threading.RLock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.flush()
+
+    @property
+    def pending(self) -> int:
+        """ The number of buffered documents. """
+        return len(self.__buffer__)
+
+    @staticmethod
+    def documentSize(path: str, values: dict) -> int:
+        """ *A staticmethod that returns the stored size of a document in bytes, as FireStore counts it.*
+
+        Args:
+            path:       The path of the document.
+            values:     The fields of the document.
+        Returns:
+            int:        The size of the document in bytes.
+        """
+        def size(value):
+            if isinstance(value, str):
+                return len(value.encode("utf-8")) + 1
+            if isinstance(value, (bool, type(None))):
+                return 1
+            if isinstance(value, (int, float)):
+                return 8
+            if isinstance(value, (list, tuple)):
+                return sum(size(item) for item in value)
+            if isinstance(value, dict):
+                return sum(size(str(key)) + size(item) for key, item in value.items())
+            return len(json.dumps(value, default=str).encode("utf-8"))
+
+        return sum(len(part.encode("utf-8")) + 1 for part in path.split("/")) + 16 + 32 + size(values)
+
+    def __document__(self, apfieldID: str, date: str):
+        """ A method that returns the reference of the document of a field and date. """
+        return self.client.collection(self.collection).document(apfieldID).collection("series").document(date)
+
+    def upsert(self, apfieldID: str, date, values: dict) -> None:
+        """ *A method that buffers the results of a field for a date, to be merged into its document.*
+
+        NumPy values are stored as their Python equivalents. A full batch is committed as soon as it is buffered.
+
+        Args:
+            apfieldID:  The apfieldID of the Field.
+            date:       The date of the results as a 'YYYY-MM-DD' string or a Date object.
+            values:     A dictionary of the results, like {"NDVI": 0.62, "NDMI": 0.18}.
+        Raises:
+            TypeError:      Occurs if the values are not a dictionary.
+            ValueError:     Occurs if the document would exceed the 1 MiB document size limit.
+            FireStoreError: Occurs if the commit of a full batch fails.
+
+        Examples:
+            Some example uses of this method are:\n
+        *Storing the score of a field:*\n
+        ``>> results.upsert(apfieldID="APX000-01", date="2020-08-23", values={"score": 0.82})``
+        """
+        if not isinstance(values, dict):
+            raise TypeError("FireStore Upsert Failed @ type check: values must be a dict")
+
+        def native(value):
+            if isinstance(value, dict):
+                return {str(key): native(item) for key, item in value.items()}
+            if isinstance(value, (list, tuple)):
+                return [native(item) for item in value]
+            return value.item() if hasattr(value, "item") else value
+
+        date = getattr(date, "dateString", str(date))
+        key = (apfieldID, date)
+
+        with self.__lock__:
+            document = dict(self.__buffer__.get(key, {}), **native(values))
+            path = f"{self.collection}/{apfieldID}/series/{date}"
+            if self.documentSize(path, document) > FIRESTORE_DOCUMENT_BYTES:
+                raise ValueError(f"FireStore Upsert Failed @ size check: {path} exceeds "
+                                 f"{FIRESTORE_DOCUMENT_BYTES} bytes")
+
+            self.__buffer__[key] = document
+            if len(self.__buffer__) >= self.batchWrites:
+                self.flush()
+
+    def flush(self) -> int:
+        """ *A method that commits the buffered results in batches under the FireStore limits.*
+
+        A batch holds at most batchWrites documents and 10 MiB. Documents of a failed batch stay buffered, so
+        calling flush() again retries them.
+
+        Returns:
+            int:        The number of documents written.
+        Raises:
+            FireStoreError: Occurs if a batch commit fails.
+        """
+        with self.__lock__:
+            written = 0
+            while self.__buffer__:
+                batch, keys, size = self.client.batch(), [], 0
+                for key, document in self.__buffer__.items():
+                    path = f"{self.collection}/{key[0]}/series/{key[1]}"
+                    documentSize = self.documentSize(path, document)
+                    if keys and (len(keys) == self.batchWrites or size + documentSize > FIRESTORE_BATCH_BYTES):
+                        break
+
+                    batch.set(self.__document__(*key), document, merge=True)
+                    keys.append(key)
+                    size += documentSize
+
+                try:
+                    batch.commit()
+
+                except Exception as e:
+                    raise apexception.FireStoreError(f"FireStore Flush Failed @ batch commit: {e}")
+
+                for key in keys:
+                    del self.__buffer__[key]
+
+                self.commits += 1
+                self.written += len(keys)
+                written += len(keys)
+
+            return written
+
+    def readSeries(self, apfieldID: str, start: str = None, end: str = None) -> dict:
+        """ *A method that returns the stored results of a field, in date order.*
+
+        Buffered results are not included until they are flushed.
+
+        Args:
+            apfieldID:  The apfieldID of the Field.
+            start:      The first 'YYYY-MM-DD' date to be returned. Defaults to None.
+            end:        The last 'YYYY-MM-DD' date to be returned. Defaults to None.
+        Returns:
+            dict:       A dictionary with the dates and the results of the field as key-value pairs.
+        Raises:
+            FireStoreError: Occurs if the read fails.
+
+        Examples:
+            Some example uses of this method are:\n
+        *Reading the NDVI series of a field:*\n
+        ``>> ndvi = {date: values["NDVI"] for date, values in results.readSeries("APX000-01").items()}``
+        """
+        try:
+            series = self.client.collection(self.collection).document(apfieldID).collection("series")
+            documents = {document.id: document.to_dict() for document in series.stream()}
+
+        except Exception as e:
+            raise apexception.FireStoreError(f"FireStore Read Failed @ stream: {e}")
+
+        return {date: documents[date] for date in sorted(documents)
+                if (start is None or date >= start) and (end is None or date <= end)}
 
 
 class FirebaseStorage:
@@ -336,9 +1115,12 @@ class FirebaseStorage:
     *Class for Firebase Cloud Storage client interface.*
 
     **Class Methods:**\n
+    - ``session:``          A classmethod that returns the shared session of a bucket.
+    - ``closeSessions:``    A classmethod that closes all the shared sessions.
     - ``closeApp:``         A method that closes the Firebase app instance gracefully.
     - ``uploadBlob:``       A method that uploads a blob into the app bucket.
     - ``downloadBlob:``     A method that downloads a blob from the app bucket.
+    - ``readBlob:``         A method that reads a blob from the app bucket into memory.
     - ``listBlobs:``        A method that returns a list of all blobs from the app bucket.
     - ``downloadFolder:``   A method that downloads all blobs from a folder in the app bucket.
 
@@ -348,12 +1130,17 @@ class FirebaseStorage:
 
     Initialises a Firebase Storage session using the firebase-admin SDK.
     Allows basic file I/O and downloading of the entire bucket or a specific folder.
-    Authentication is done by locally stored key in apgis/firebasekey/firebasekey.json
+    Authentication is done by locally stored key in apgis/firebasekey/firebasekey.json\n
+    A LocalObjectStore can be passed as the store to work against a local directory instead of Firebase.\n
+    FirebaseStorage.session() returns a process-wide session of a bucket that is created on first use and
+    shared by all apgis components and threads, so the app and the storage client are initialised once.
 
     ***DO NOT COMMIT THIS KEY TO VERSION CONTROL.***
     """
+    __sessions__ = {}
+    __sessionLock__ = threading.RLock()
 
-    def __init__(self, bucket: str = "antpod-apgis"):
+    def __init__(self, bucket: str = "antpod-apgis", store=None, appName: str = None):
         """ **Constructor Method**\n
         Yields a ``FirebaseStorage`` object.
 
@@ -361,6 +1148,8 @@ class FirebaseStorage:
 
         A Firebase App session  for the apGIS app is initialised to access
         the bucket specified in the parameter, bucket. Defaults to "antpod-apgis".\n
+        If store is set, it is used as the bucket and no Firebase App is initialised.\n
+        The app is the default Firebase App unless an appName is set, which allows apps for several buckets.\n
 
         Raises:
             FirebaseError:      Occurs if the Firebase initialisation fails
@@ -374,10 +1163,17 @@ class FirebaseStorage:
         *Initialising a Firebase object with a specific bucket ID:*\n
         ``>> fStorage = FirebaseStorage(bucket="sample-bucket")``
 
+        *Initialising a Firebase object over a local stand-in:*\n
+        ``>> fStorage = FirebaseStorage(store=LocalObjectStore(root="bucketDir"))``
+
         References:
             *Cloud Storage for Firebase:*\n
         https://firebase.google.com/docs/storage
         """
+        if store is not None:
+            self.app, self.bucket = None, store
+            return
+
         import firebase_admin
         from firebase_admin import credentials, storage
 
@@ -389,15 +1185,79 @@ class FirebaseStorage:
             raise FileNotFoundError(f"Firebase Initialisation Failed @ Credential Building: {e}")
 
         try:
-            self.app = firebase_admin.initialize_app(firebaseCredentials, CONFIG.getFirebaseConfig(bucket=bucket))
-            self.bucket = storage.bucket()
+            if appName is None:
+                self.app = firebase_admin.initialize_app(firebaseCredentials, CONFIG.getFirebaseConfig(bucket=bucket))
+            else:
+                self.app = firebase_admin.initialize_app(firebaseCredentials, CONFIG.getFirebaseConfig(bucket=bucket),
+                                                         name=appName)
+            self.bucket = storage.bucket(app=self.app)
 
         except Exception as e:
             raise apexception.FirebaseError(f"Firebase Initialisation Failed @ Firebase App Initialize: {e}")
 
+    @classmethod
+    def session(cls, bucket: str = "antpod-apgis", poolSize: int = SESSION_POOL_SIZE, store=None):
+        """ *A classmethod that returns the shared session of a bucket, creating it on first use.*
+
+        The session is created once per process and bucket under a lock, so concurrent callers share a single
+        Firebase App and storage client. The HTTP connection pool of the storage client holds up to poolSize
+        connections, enough for parallel transfers like downloadFolder(). The session stays open until
+        closeSessions() is called or the process exits.
+
+        Args:
+            bucket:     The bucket of the session. Defaults to "antpod-apgis".
+            poolSize:   The maximum number of pooled HTTP connections. Defaults to 16.
+            store:      An object store like LocalObjectStore used as the bucket if the session is created.
+                        Defaults to None.
+        Returns:
+            FirebaseStorage:    The shared session of the bucket.
+        Raises:
+            FirebaseError:      Occurs if the Firebase initialisation fails
+
+        Examples:
+            Some example uses of this method are:\n
+        *Downloading a blob with the shared session:*\n
+        ``>> FirebaseStorage.session().downloadBlob(localName="download.txt", remoteName="dir/cloudSample.txt")``
+        """
+        with cls.__sessionLock__:
+            if bucket not in cls.__sessions__:
+                fStorage = cls(bucket=bucket, store=store, appName=f"apgis-{bucket}")
+
+                if fStorage.app is not None:
+                    try:
+                        from requests.adapters import HTTPAdapter
+                        adapter = HTTPAdapter(pool_connections=poolSize, pool_maxsize=poolSize)
+                        fStorage.bucket.client._http.mount("https://", adapter)
+
+                    except Exception as e:
+                        fStorage.closeApp()
+                        raise apexception.FirebaseError(f"Firebase Session Failed @ connection pool: {e}")
+
+                cls.__sessions__[bucket] = fStorage
+
+            return cls.__sessions__[bucket]
+
+    @classmethod
+    def closeSessions(cls) -> None:
+        """ *A classmethod that closes all the shared sessions.*
+
+        Sessions are created again on the next call to session(). Called when the process exits.
+
+        Raises:
+            FirebaseError: Occurs if an app shutdown fails.
+        """
+        with cls.__sessionLock__:
+            sessions = list(cls.__sessions__.values())
+            cls.__sessions__.clear()
+
+        for fStorage in sessions:
+            fStorage.closeApp()
+
     def closeApp(self) -> None:
         """ *A method that closes the Firebase app instance gracefully.*
 
+        A shared session that is closed is removed, so the next call to session() creates a new one.
+
         Raises:
             FirebaseError: Occurs if the app shutdown fails.
 
@@ -407,6 +1267,14 @@ class FirebaseStorage:
         ``>> fStorage = FirebaseStorage()``\n
         ``>> fStorage.closeApp()``
         """
+        with self.__sessionLock__:
+            for bucket, fStorage in list(self.__sessions__.items()):
+                if fStorage is self:
+                    del self.__sessions__[bucket]
+
+        if self.app is None:
+            return
+
         import firebase_admin
 
         try:
@@ -459,6 +1327,29 @@ class FirebaseStorage:
         except Exception as e:
             raise apexception.FirebaseError(f"Download from Firebase Failed @ upload runtime: {e}")
 
+    def readBlob(self, remoteName: str) -> bytes:
+        """ *A method that reads a blob from the app bucket into memory, without writing it to disk.*
+
+        Args:
+            remoteName:     a pathString representing the path of the blob on the bucket.
+        Returns:
+            bytes:          The contents of the blob.
+        Raises:
+            FirebaseError:  Occurs if the blob read fails.
+
+        Examples:
+            Some example uses of this method are:\n
+        *Reading a JSON blob:*\n
+        ``>> data = json.loads(FirebaseStorage.session().readBlob(remoteName="dir/cloudSample.json"))``
+        """
+        try:
+            buffer = io.BytesIO()
+            self.bucket.blob(remoteName).download_to_file(buffer)
+            return buffer.getvalue()
+
+        except Exception as e:
+            raise apexception.FirebaseError(f"Read from Firebase Failed @ download runtime: {e}")
+
     def listBlobs(self, folder: str = None) -> list:
         """ *A method that returns a list of all blobs from the app bucket.*
 
@@ -500,18 +1391,38 @@ class FirebaseStorage:
         except Exception as e:
             raise apexception.FirebaseError(f"Listing Firebase Blobs Failed @ list building: {e}")
 
-    def downloadFolder(self, remoteFolder: str = None, localFolder: pathString = None) -> None:
+    def downloadFolder(self,
+                       remoteFolder: str = None,
+                       localFolder: pathString = None,
+                       maxWorkers: int = 8,
+                       chunkSize: int = CHUNK_SIZE,
+                       retries: int = 3,
+                       progress: typing.Callable = None) -> dict:
         """ *A method that downloads all blobs from a folder in the app bucket.*
 
         If remoteFolder is not set, all blobs in the bucket are downloaded into the localFolder.
         otherwise only the blobs in the specified folder are downloaded.\n
-        If localFolder is not set, defaults to "/resource".
+        If localFolder is not set, defaults to "/resource".\n
+        Blobs are downloaded concurrently on a thread pool of at most maxWorkers threads, in ranged chunks
+        into a ``.part`` file named with the blob generation. A failed transfer is resumed from the bytes
+        already written, on a retry or a later call, as long as the blob generation is unchanged. Completed
+        files are verified against the MD5 or CRC32C of the blob before they replace the local file.\n
+        A local file is skipped if it is recorded in the ``.apgis-sync.json`` index of the localFolder with the
+        blob generation and is unchanged since, or otherwise if its size and checksum match the blob. Partial
+        and stale files are downloaded again.
 
         Args:
             remoteFolder:  The folder from which to download blobs.
             localFolder:   The folder in which to download blobs.
+            maxWorkers:    The maximum number of concurrent downloads. Defaults to 8.
+            chunkSize:     The size in bytes of each ranged request. Defaults to 8 MiB.
+            retries:       The number of times a failed transfer is resumed. Defaults to 3.
+            progress:      A function called with the report after each blob. Defaults to None.
+        Returns:
+            dict:       A report with the count of blobs, downloaded, resumed, skipped and failed blobs, the bytes
+                        transferred, the seconds taken and the throughput in bytes per second.
         Raises:
-            FirebaseError: Occurs if the folder download fails.
+            FirebaseError: Occurs if the folder download fails or any blob fails to download.
 
         Examples:
             Some example uses of this method are:\n
@@ -522,35 +1433,535 @@ class FirebaseStorage:
         *Downloading all blobs from a folder:*\n
         ``>> fStorage = FirebaseStorage()``\n
         ``>> fStorage.downloadFolder(remoteFolder="configResource", localFolder="configDir")``
+
+        *Printing the progress of a download:*\n
+        ``>> fStorage.downloadFolder(remoteFolder="exports", progress=lambda report: print(report["completed"]))``
         """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        if not isinstance(maxWorkers, int) or maxWorkers < 1:
+            raise ValueError("Downloading Firebase Folder Failed @ maxWorkers check: maxWorkers must be a positive int")
+
         try:
-            remoteBlobList = self.listBlobs(folder=remoteFolder)
+            remoteBlobs = [blob for blob in (self.bucket.list_blobs(prefix=remoteFolder) if remoteFolder else
+                                             self.bucket.list_blobs()) if not blob.name.endswith("/")]
             folder = "resource" if localFolder is None else localFolder
-            localDir = f"{os.path.dirname(os.path.realpath(__file__))}/{folder}"
+            localDir = os.path.join(os.path.dirname(os.path.realpath(__file__)), folder)
+
+            os.makedirs(localDir, exist_ok=True)
+            indexFile = os.path.join(localDir, SYNC_INDEX)
+            index = jsonio.jsonRead(indexFile) if os.path.isfile(indexFile) else {}
 
         except Exception as e:
             raise apexception.FirebaseError(f"Downloading Firebase Folder Failed @ path setting: {e}")
 
-        try:
-            localBlobList = []
-            for blob in remoteBlobList:
-                filename = f"{localDir}/{blob}"
-                localBlobList.append(filename)
+        def isCurrent(local, blob):
+            """ A function that checks whether a local file is a complete copy of a blob. """
+            stat = os.stat(local)
+            if stat.st_size != blob.size:
+                return False
+
+            entry = index.get(blob.name, {})
+            if entry.get("generation") == blob.generation and entry.get("size") == stat.st_size and \
+                    entry.get("mtime") == stat.st_mtime_ns:
+                return True
+
+            if blob.md5_hash:
+                return fileMD5(local) == blob.md5_hash
+            if blob.crc32c:
+                return fileCRC32C(local) == blob.crc32c
+            return False
 
-            if not os.path.isdir(localDir):
-                os.makedirs(localDir)
+        def fetch(blob):
+            """ A function that skips, resumes or downloads a single blob. """
+            local = os.path.join(localDir, *blob.name.split("/"))
+            if os.path.isfile(local) and isCurrent(local, blob):
+                return blob, "skipped", 0
+
+            os.makedirs(os.path.dirname(local), exist_ok=True)
+            part = f"{local}.{blob.generation}{PART_EXT}"
+            for stale in glob.glob(f"{glob.escape(local)}.*{PART_EXT}"):
+                if stale != part:
+                    os.remove(stale)
+
+            start = os.path.getsize(part) if os.path.isfile(part) else 0
+            resumed = start > 0
+
+            for attempt in range(retries + 1):
+                try:
+                    with open(part, "ab") as file:
+                        file.seek(0, os.SEEK_END)
+                        while file.tell() < blob.size:
+                            offset = file.tell()
+                            blob.download_to_file(file, start=offset, end=min(offset + chunkSize, blob.size) - 1)
+                    break
 
-        except Exception as e:
-            raise apexception.FirebaseError(f"Downloading Firebase Folder Failed @ local filename build: {e}")
+                except Exception:
+                    if attempt == retries:
+                        raise
+                    resumed = True
+
+            if blob.md5_hash:
+                valid = fileMD5(part) == blob.md5_hash
+            else:
+                checksum = fileCRC32C(part) if blob.crc32c else None
+                valid = checksum is None or checksum == blob.crc32c
+
+            if not valid:
+                os.remove(part)
+                raise apexception.FirebaseError(f"checksum mismatch for {blob.name}")
+
+            os.replace(part, local)
+            return blob, "resumed" if resumed else "downloaded", blob.size - start
+
+        report = {"blobs": len(remoteBlobs), "completed": 0, "downloaded": 0, "resumed": 0, "skipped": 0,
+                  "failed": [], "bytes": 0, "seconds": 0.0, "throughput": 0.0}
+        began = time.perf_counter()
 
         try:
-            for local, remote in zip(localBlobList, remoteBlobList):
-                if local.endswith("/"):
-                    if not os.path.isdir(local):
-                        os.makedirs("/".join(local.split("/")[:-1]))
-                else:
-                    if not os.path.isfile(local):
-                        self.downloadBlob(localName=local, remoteName=remote)
+            with ThreadPoolExecutor(max_workers=maxWorkers) as pool:
+                futures = {pool.submit(fetch, blob): blob for blob in remoteBlobs}
+                for future in as_completed(futures):
+                    blob = futures[future]
+                    try:
+                        blob, status, transferred = future.result()
+                        stat = os.stat(os.path.join(localDir, *blob.name.split("/")))
+                        index[blob.name] = {"generation": blob.generation, "size": stat.st_size,
+                                            "mtime": stat.st_mtime_ns}
+                        report[status] += 1
+                        report["bytes"] += transferred
+
+                    except Exception as e:
+                        index.pop(blob.name, None)
+                        report["failed"].append(f"{blob.name}: {e}")
+
+                    report["completed"] += 1
+                    report["seconds"] = time.perf_counter() - began
+                    report["throughput"] = report["bytes"] / report["seconds"] if report["seconds"] else 0.0
+                    if progress is not None:
+                        progress(report)
+
+            jsonio.jsonWrite(dictData=index, filename=indexFile)
 
         except Exception as e:
             raise apexception.FirebaseError(f"Downloading Firebase Folder Failed @ download runtime: {e}")
+
+        if report["failed"]:
+            raise apexception.FirebaseError(f"Downloading Firebase Folder Failed @ download runtime: "
+                                            f"{len(report['failed'])} blobs failed: {report['failed']}")
+
+        return report
+
+
+atexit.register(FirebaseStorage.closeSessions)
+
+
+class LocalObjectStore:
+    """
+    *Class for a local stand-in of a Cloud Storage bucket.*
+
+    **Class Methods:**\n
+    - ``list_blobs:``   A method that returns the blobs of the store, optionally under a prefix.
+    - ``blob:``         A method that returns a blob of the store.
+
+    **Class Attributes:**\n
+    - ``root:``         The directory that holds the blobs of the store.
+    - ``latency:``      The delay in seconds before each download request.
+    - ``failureRate:``  The probability that a download request fails halfway through its range.
+    - ``requests:``     The number of download requests served.
+    - ``bytesServed:``  The number of bytes served.
+    - ``peakConcurrency:``  The highest number of download requests that were served at once.
+
+    Serves the files under a local directory with the subset of the google-cloud-storage Bucket and Blob
+    interface used by FirebaseStorage and CloudStorage, including ranged downloads, composition and the
+    md5_hash, crc32c and generation of each blob. The generation of a blob is the modification time of its
+    file. Pass it as the store of FirebaseStorage or CloudStorage to test and benchmark transfers offline.
+
+    Examples:
+        Some example uses of this class are:\n
+    *Downloading a folder from the stand-in:*\n
+    ``>> fStorage = FirebaseStorage(store=LocalObjectStore(root="bucketDir", latency=0.05, failureRate=0.1))``\n
+    ``>> report = fStorage.downloadFolder(remoteFolder="exports", localFolder="/tmp/exports")``
+    """
+
+    def __init__(self, root: pathString, latency: float = 0.0, failureRate: float = 0.0, seed: int = None):
+        """ **Constructor Method**\n
+        Yields a ``LocalObjectStore`` object.
+
+        Args:
+            root:           The directory that holds the blobs of the store.
+            latency:        The delay in seconds before each download request. Defaults to 0.
+            failureRate:    The probability that a download request fails halfway through. Defaults to 0.
+            seed:           A seed for the random failures. Defaults to None.
+        """
+        import random
+
+        self.root = pathlib.Path(root)
+        self.latency = latency
+        self.failureRate = failureRate
+        self.requests = 0
+        self.bytesServed = 0
+        self.peakConcurrency = 0
+
+        self.__random__ = random.Random(seed)
+        self.__active__ = 0
+        self.__lock__ = threading.Lock()
+
+    def list_blobs(self, prefix: str = None) -> list:
+        """ A method that returns the blobs of the store in name order, optionally only those under a prefix. """
+        names = sorted(path.relative_to(self.root).as_posix() for path in self.root.rglob("*") if path.is_file())
+        return [LocalBlob(store=self, name=name) for name in names if not prefix or name.startswith(prefix)]
+
+    def blob(self, name: str):
+        """ A method that returns a blob of the store, which need not exist yet. """
+        return LocalBlob(store=self, name=name)
+
+    def __serve__(self, path: pathlib.Path, start: int, end: int) -> tuple:
+        """ A method that reads a byte range for a download request and decides whether it fails. """
+        with self.__lock__:
+            self.requests += 1
+            self.__active__ += 1
+            self.peakConcurrency = max(self.peakConcurrency, self.__active__)
+            fail = self.__random__.random() < self.failureRate
+
+        try:
+            time.sleep(self.latency)
+            with open(path, "rb") as file:
+                file.seek(start)
+                data = file.read(end - start + 1)
+
+            with self.__lock__:
+                self.bytesServed += len(data) // 2 if fail else len(data)
+            return data, fail
+
+        finally:
+            with self.__lock__:
+                self.__active__ -= 1
+
+
+class LocalBlob:
+    """
+    *Class for a blob of a LocalObjectStore.*
+
+    **Class Attributes:**\n
+    - ``name:``         The name of the blob.
+    - ``size:``         The size of the blob in bytes, None if it does not exist.
+    - ``md5_hash:``     The base64 MD5 digest of the blob.
+    - ``crc32c:``       The base64 CRC32C of the blob, None without the google-crc32c library.
+    - ``generation:``   The generation of the blob.
+    """
+
+    def __init__(self, store: LocalObjectStore, name: str):
+        """ **Constructor Method**\n
+        Yields a ``LocalBlob`` object.
+
+        Args:
+            store:      The LocalObjectStore of the blob.
+            name:       The name of the blob.
+        """
+        self.name = name
+        self.__store__ = store
+        self.__path__ = store.root / name
+        self.reload()
+
+    def reload(self) -> None:
+        """ A method that reloads the metadata of the blob from its file. """
+        self.size = self.md5_hash = self.crc32c = self.generation = None
+        if self.__path__.is_file():
+            stat = self.__path__.stat()
+            self.size, self.generation = stat.st_size, stat.st_mtime_ns
+            self.md5_hash, self.crc32c = fileMD5(self.__path__), fileCRC32C(self.__path__)
+
+    def download_to_file(self, file, start: int = None, end: int = None) -> None:
+        """ A method that writes the byte range start to end, inclusive, of the blob into a file object. """
+        if not self.__path__.is_file():
+            raise FileNotFoundError(f"No such object: {self.name}")
+
+        start = 0 if start is None else start
+        end = self.__path__.stat().st_size - 1 if end is None else end
+
+        data, fail = self.__store__.__serve__(path=self.__path__, start=start, end=end)
+        if fail:
+            file.write(data[:len(data) // 2])
+            raise ConnectionError(f"Transfer of {self.name} interrupted")
+
+        file.write(data)
+
+    def download_to_filename(self, filename: pathString) -> None:
+        """ A method that downloads the blob into a file. """
+        with open(filename, "wb") as file:
+            self.download_to_file(file)
+
+    def upload_from_filename(self, filename: pathString) -> None:
+        """ A method that uploads a file into the blob. """
+        self.__path__.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(filename, self.__path__)
+        self.reload()
+
+    def upload_from_string(self, data: bytes) -> None:
+        """ A method that uploads bytes into the blob. """
+        self.__path__.parent.mkdir(parents=True, exist_ok=True)
+        self.__path__.write_bytes(data)
+        self.reload()
+
+    def compose(self, sources: list) -> None:
+        """ A method that writes the concatenation of source blobs of the store into the blob. """
+        self.__path__.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.__path__, "wb") as sink:
+            for source in sources:
+                with open(source.__path__, "rb") as file:
+                    shutil.copyfileobj(file, sink)
+        self.reload()
+
+    def delete(self) -> None:
+        """ A method that deletes the blob. """
+        self.__path__.unlink()
+
+
+class LocalDriveServer:
+    """
+    *Class for a local HTTP stand-in of Google Drive.*
+
+    **Class Attributes:**\n
+    - ``root:``         The directory that holds the folders and files of the stand-in Drive.
+    - ``client:``       A client with the subset of the PyDrive GoogleDrive interface used by Drive.
+    - ``latency:``      The delay in seconds before each download response.
+    - ``failureRate:``  The probability that a download is cut off halfway through.
+    - ``requests:``     The number of download requests served.
+    - ``peakConcurrency:``  The highest number of downloads that were served at once.
+
+    Lists the directories and files under a local directory as Drive folders and files, and serves the files
+    over HTTP with range requests and bearer token checks like the Drive download URLs. Use it as a context
+    manager and pass its client to Drive to test and benchmark downloads offline.
+
+    Examples:
+        Some example uses of this class are:\n
+    *Downloading from the stand-in:*\n
+    ``>> with LocalDriveServer(root="driveDir", latency=0.05) as server:``\n
+    ``>>     report = Drive(client=server.client).downloadMany(drivepaths=paths, dest="exports")``
+    """
+    TOKEN = "local-token"
+
+    def __init__(self, root: pathString, latency: float = 0.0, failureRate: float = 0.0, seed: int = None):
+        """ **Constructor Method**\n
+        Yields a ``LocalDriveServer`` object.
+
+        Args:
+            root:           The directory that holds the folders and files of the stand-in Drive.
+            latency:        The delay in seconds before each download response. Defaults to 0.
+            failureRate:    The probability that a download is cut off halfway through. Defaults to 0.
+            seed:           A seed for the random failures. Defaults to None.
+        """
+        import random
+        import types
+
+        self.root = pathlib.Path(root)
+        self.latency = latency
+        self.failureRate = failureRate
+        self.requests = 0
+        self.peakConcurrency = 0
+
+        self.__random__ = random.Random(seed)
+        self.__active__ = 0
+        self.__lock__ = threading.Lock()
+        self.__server__ = None
+        self.__thread__ = None
+
+        server = self
+
+        class FileList:
+            """ A file listing query of the stand-in. """
+
+            def __init__(self, query: dict):
+                self.folderID = query['q'].split("'")[1]
+
+            def GetList(self):
+                return server.__list__(self.folderID)
+
+        auth = types.SimpleNamespace(access_token_expired=False, Refresh=lambda: None,
+                                     credentials=types.SimpleNamespace(access_token=self.TOKEN))
+        self.client = types.SimpleNamespace(ListFile=FileList, auth=auth)
+
+    def __path__(self, fileID: str) -> pathlib.Path:
+        """ A method that returns the local path of a file or folder ID. """
+        return self.root if fileID == "root" else self.root / bytes.fromhex(fileID).decode()
+
+    def __list__(self, folderID: str) -> list:
+        """ A method that lists the folders and files of a folder as Drive file resources. """
+        folder = self.__path__(folderID)
+        if not folder.is_dir():
+            return []
+
+        files = []
+        for path in sorted(folder.iterdir()):
+            fileID = path.relative_to(self.root).as_posix().encode().hex()
+            if path.is_dir():
+                files.append({"title": path.name, "id": fileID, "mimeType": "application/vnd.google-apps.folder"})
+            else:
+                files.append({"title": path.name, "id": fileID, "fileSize": str(path.stat().st_size),
+                              "downloadUrl": f"http://127.0.0.1:{self.__server__.server_address[1]}/files/{fileID}"})
+
+        return files
+
+    def start(self) -> None:
+        """ A method that starts the server on a free local port in a background thread. """
+        import http.server
+
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            """ A request handler that serves file downloads. """
+
+            def do_GET(self):
+                with server.__lock__:
+                    server.requests += 1
+                    server.__active__ += 1
+                    server.peakConcurrency = max(server.peakConcurrency, server.__active__)
+                    fail = server.__random__.random() < server.failureRate
+
+                try:
+                    time.sleep(server.latency)
+                    path = server.__path__(self.path.rsplit("/", 1)[-1])
+
+                    if self.headers.get("Authorization") != f"Bearer {server.TOKEN}":
+                        self.send_error(401, "Unauthorized")
+                    elif not path.is_file():
+                        self.send_error(404, "File not found")
+                    else:
+                        size = path.stat().st_size
+                        start = int(self.headers.get("Range", "bytes=0-")[6:].split("-")[0])
+
+                        self.send_response(206 if start else 200)
+                        if start:
+                            self.send_header("Content-Range", f"bytes {start}-{size - 1}/{size}")
+                        self.send_header("Content-Length", str(size - start))
+                        self.end_headers()
+
+                        with open(path, "rb") as file:
+                            file.seek(start)
+                            data = file.read()
+                        self.wfile.write(data[:len(data) // 2] if fail else data)
+                finally:
+                    with server.__lock__:
+                        server.__active__ -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self.__server__ = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.__thread__ = threading.Thread(target=self.__server__.serve_forever, daemon=True)
+        self.__thread__.start()
+
+    def stop(self) -> None:
+        """ A method that stops the server. """
+        if self.__server__ is not None:
+            self.__server__.shutdown()
+            self.__server__.server_close()
+            self.__server__ = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+class LocalFireStore:
+    """
+    *Class for a local in-memory stand-in of a Cloud FireStore client.*
+
+    **Class Methods:**\n
+    - ``collection:``   A method that returns a reference to a root collection.
+    - ``batch:``        A method that returns a write batch.
+
+    **Class Attributes:**\n
+    - ``documents:``    A dictionary of the stored documents keyed by path.
+    - ``commits:``      The number of batch commits.
+    - ``writes:``       The number of document writes.
+    - ``failureRate:``  The probability that a commit fails.
+
+    Implements the subset of the google-cloud-firestore client used by FireStore. Commits are atomic and
+    batches over the 500 write limit are rejected like FireStore rejects them. Pass it as the client of
+    FireStore to test result stores offline.
+
+    Examples:
+        Some example uses of this class are:\n
+    *Storing results in the stand-in:*\n
+    ``>> results = FireStore(client=LocalFireStore())``
+    """
+
+    def __init__(self, failureRate: float = 0.0, seed: int = None):
+        """ **Constructor Method**\n
+        Yields a ``LocalFireStore`` object.
+
+        Args:
+            failureRate:    The probability that a commit fails. Defaults to 0.
+            seed:           A seed for the random failures. Defaults to None.
+        """
+        import random
+
+        self.documents = {}
+        self.commits = 0
+        self.writes = 0
+        self.failureRate = failureRate
+
+        self.__random__ = random.Random(seed)
+        self.__lock__ = threading.Lock()
+
+    def collection(self, name: str):
+        """ A method that returns a reference to a root collection. """
+        return LocalFireStore.Reference(store=self, path=name)
+
+    def batch(self):
+        """ A method that returns a write batch. """
+        return LocalFireStore.WriteBatch(store=self)
+
+    class Reference:
+        """ A reference to a collection or a document of a LocalFireStore. """
+
+        def __init__(self, store, path: str):
+            self.store, self.path = store, path
+            self.id = path.rsplit("/", 1)[-1]
+
+        def collection(self, name: str):
+            return LocalFireStore.Reference(store=self.store, path=f"{self.path}/{name}")
+
+        def document(self, name: str):
+            return LocalFireStore.Reference(store=self.store, path=f"{self.path}/{name}")
+
+        def get(self):
+            import types
+            with self.store.__lock__:
+                data = self.store.documents.get(self.path)
+            return types.SimpleNamespace(id=self.id, exists=data is not None,
+                                         to_dict=lambda: None if data is None else json.loads(json.dumps(data)))
+
+        def stream(self):
+            with self.store.__lock__:
+                paths = sorted(path for path in self.store.documents
+                               if path.rsplit("/", 1)[0] == self.path)
+            return [self.document(path.rsplit("/", 1)[-1]).get() for path in paths]
+
+    class WriteBatch:
+        """ A write batch of a LocalFireStore. """
+
+        def __init__(self, store):
+            self.store, self.writes = store, []
+
+        def set(self, reference, data: dict, merge: bool = False):
+            self.writes.append((reference.path, json.loads(json.dumps(data)), merge))
+
+        def commit(self):
+            store = self.store
+            with store.__lock__:
+                if len(self.writes) > FIRESTORE_BATCH_WRITES:
+                    raise ValueError(f"maximum {FIRESTORE_BATCH_WRITES} writes allowed per request")
+                if store.__random__.random() < store.failureRate:
+                    raise ConnectionError("commit failed")
+
+                for path, data, merge in self.writes:
+                    store.documents[path] = dict(store.documents.get(path, {}), **data) if merge else data
+
+                store.commits += 1
+                store.writes += len(self.writes)
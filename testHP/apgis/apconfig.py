@@ -29,6 +29,7 @@ class Config:
     - ``getSensorProducts:``   *A method that returns all the Products for a Sensor ID.*
     - ``getRevisitTime:``      *A method that returns the revisit time in days for a Satellite ID.*
     - ``getGEECollection:``    *A method that returns the GEE Collection ID for a Sensor ID.*
+    - ``getBandResolutions:``  *A method that returns the native resolution of the bands of a Sensor ID.*
 
     **Class Attributes:**\n
     - ``configmap:``            *A dictionary that contains the parsed configmap.json file.*
@@ -254,6 +255,37 @@ class Config:
         except Exception as e:
             raise apexception.ConfigError(f"GEE Collection Extraction Failed @ GEE collection extraction: {e}")
 
+    def getBandResolutions(self, sensor: str) -> dict:
+        """ *A method that extracts the native resolution of the bands of a Sensor ID.*
+
+        The method parses the resolution of each band in the Band Details of the Sensor ID
+        from configData.json, like "20m", into metres.
+
+        Args:
+            sensor:     The Sensor ID for which to retrieve the band resolutions.
+        Returns:
+            dict:       A dictionary with the band names and their resolution in metres as key-value pairs.
+        Raises:
+            ValueError:     Occurs if the sensor is not a valid Sensor ID.
+            ConfigError:    Occurs if extracting band resolutions fails.
+
+        Examples:
+            Some example uses of this method are:\n
+        *Extracting Band Resolutions for Sentinel-2 L2A:*\n
+        ``>> configData = Config()``\n
+        ``>> resolutions = configData.getBandResolutions("L2A")``
+        """
+        if sensor not in self.getSensors():
+            raise ValueError("Band Resolution Extraction Failed @ Sensor ID check: Invalid Sensor ID.")
+
+        try:
+            sat = self.getSatfromSensor(sensor)
+            bandDetails = self.configData["satellites"][sat][DATA_PRODUCTS][sensor]["Band Details"]
+            return {band: int(details["resolution"].rstrip("m")) for band, details in bandDetails.items()}
+
+        except Exception as e:
+            raise apexception.ConfigError(f"Band Resolution Extraction Failed @ band details extraction: {e}")
+
     def getFirebaseConfig(self, bucket: str) -> dict:
         """ *A method that extracts the Firebase Config for a given bucket for the app apGIS
         on antpod-canary project.*
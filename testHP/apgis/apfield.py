@@ -18,6 +18,7 @@ import typing
 pathString = typing.Union[str, pathlib.Path]
 
 import apgis.apjsonio as jsonio
+import apgis.apgeocode as geocoding
 import apgis.apexception as apexception
 
 from apgis.apcloud import FirebaseStorage
@@ -26,8 +27,6 @@ from apgis.apconfig import Config
 
 CONFIG = Config()
 
-from geopy.geocoders import Nominatim
-
 
 class Field:
     """
@@ -216,9 +215,8 @@ class Field:
             resource = os.path.join(os.path.dirname(os.path.realpath(__file__)), remotefile)
 
             try:
-                fStorage = FirebaseStorage(bucket="antpod-apgis")
+                fStorage = FirebaseStorage.session(bucket="antpod-apgis")
                 fStorage.downloadBlob(remoteName=f"sample-fields/{remotefile}", localName=resource)
-                fStorage.closeApp()
 
             except Exception as e:
                 raise apexception.FirebaseError(e)
@@ -331,12 +329,7 @@ class Field:
 
     @property
     def geoCode(self):
-        """ Nominatim Geocoding Information. Returns the address field of the reverse GeoCode lookup. """
-        try:
-            geoCoder = Nominatim(user_agent="antpodGIS-FieldGeoCoder")
-            centroid = str(self.centroid[::-1])[1:-2]
-            geocode = geoCoder.reverse(centroid).raw
-            return geocode['address']
-
-        except Exception as e:
-            raise apexception.GeoCodingError(f"GeoCoding lookup failed: {e}")
+        """ Nominatim Geocoding Information. Returns the address field of the reverse GeoCode lookup.\n
+        The address is read from the persistent geocode cache of apgeocode and only looked up on a miss, under the
+        Nominatim rate limit. Use apgeocode.geocodeFields() to geocode many Fields at once. """
+        return geocoding.geocodeFields(fields=[self])[self.apfieldID]
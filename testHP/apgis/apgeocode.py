@@ -0,0 +1,340 @@
+"""
+Module for cached, rate-limited Nominatim reverse geocoding of Fields.
+
+Library of top-level functions that reverse geocode the centroids of Fields with the Nominatim OSM service.
+Addresses are kept in a persistent *GeoCodeCache* keyed by the centroid rounded to a grid of about 100 m,
+so nearby Fields share a single lookup and a Field is only ever looked up once. Lookups are spaced by the
+one request per second limit of the Nominatim usage policy across all the threads of the process, and are
+retried with an increasing delay when the service rate limits them.
+Contains the class *LocalNominatimServer*, a local HTTP stand-in for the Nominatim reverse endpoint for testing.
+Requires the geopy library which is imported when the functions are called.
+
+************************************************************************
+Copyrights (c) 2020 ANTPOD Designs Private Limited. All Rights Reserved.
+************************************************************************
+"""
+import os
+import json
+import time
+import pathlib
+import threading
+import urllib.parse
+
+import apgis.apjsonio as jsonio
+import apgis.apexception as apexception
+
+import typing
+pathString = typing.Union[str, pathlib.Path]
+
+USER_AGENT = "antpodGIS-FieldGeoCoder"
+GEOCODE_PRECISION = 3
+GEOCODE_DELAY = 1.0
+GEOCODE_CACHE = os.path.join(os.path.expanduser("~"), ".apgis", "geocodes.json")
+
+__requestLock__ = threading.Lock()
+__lastRequest__ = 0.0
+__defaultCache__ = None
+__defaultCacheLock__ = threading.Lock()
+
+
+class GeoCodeCache:
+    """
+    *Class for a persistent cache of reverse geocoded addresses.*
+
+    **Class Methods:**\n
+    - ``key:``      *A method that returns the cache key of a centroid.*
+    - ``get:``      *A method that returns the cached address of a centroid.*
+    - ``put:``      *A method that caches the address of a centroid.*
+    - ``save:``     *A method that writes the cache to its file.*
+
+    **Class Attributes:**\n
+    - ``filename:``     The path to the JSON file the cache is persisted in.
+    - ``precision:``    The number of decimals the centroids are rounded to.
+    - ``addresses:``    A dictionary of the cached addresses keyed by rounded centroid.
+
+    Centroids are rounded to precision decimals of a degree, 3 by default or about 110 m, so the Fields of a
+    village share their address. The cache is written to a temporary file that replaces the JSON file, so an
+    interrupted save never corrupts it.
+    """
+
+    def __init__(self, filename: str = None, precision: int = GEOCODE_PRECISION):
+        """ **Constructor Method**\n
+        Yields a ``GeoCodeCache`` object.
+
+        Args:
+            filename:   A pathlike string to the JSON file to persist the cache in. The cache is loaded from it if it
+                        exists. Defaults to None (in-memory cache).
+            precision:  The number of decimals the centroids are rounded to. Defaults to 3.
+        Raises:
+            TypeError:      Occurs if the filename is not a pathlike string.
+            JSONError:      Occurs if the cache file cannot be read.
+        """
+        if filename is not None and not isinstance(filename, str):
+            raise TypeError("GeoCodeCache Construction Failed @ type check: filename must be a pathlike string")
+
+        if filename is not None and not filename.endswith(jsonio.JSON_EXT):
+            filename = filename + jsonio.JSON_EXT
+
+        self.filename = filename
+        self.precision = precision
+        self.addresses = {}
+        self.__lock__ = threading.Lock()
+
+        if filename is not None and os.path.isfile(filename):
+            self.addresses = jsonio.jsonRead(filename=filename)
+
+    def __len__(self):
+        return len(self.addresses)
+
+    def key(self, centroid: list) -> str:
+        """ *A method that returns the cache key of a [longitude, latitude] centroid.* """
+        longitude, latitude = centroid
+        return f"{latitude:.{self.precision}f},{longitude:.{self.precision}f}"
+
+    def get(self, centroid: list) -> dict:
+        """ *A method that returns the cached address of a [longitude, latitude] centroid or None.* """
+        with self.__lock__:
+            return self.addresses.get(self.key(centroid))
+
+    def put(self, centroid: list, address: dict) -> None:
+        """ *A method that caches the address of a [longitude, latitude] centroid.* """
+        with self.__lock__:
+            self.addresses[self.key(centroid)] = address
+
+    def save(self) -> None:
+        """ *A method that writes the cache to its file, if it has one.*
+
+        Raises:
+            JSONError:  Occurs if the cache file cannot be written.
+        """
+        if self.filename is None:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.filename)), exist_ok=True)
+            with self.__lock__:
+                content = json.dumps(self.addresses)
+
+            temporary = f"{self.filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temporary, "w") as file:
+                file.write(content)
+            os.replace(temporary, self.filename)
+
+        except Exception as e:
+            raise apexception.JSONError(f"GeoCodeCache Save Failed @ JSON writing: {e}")
+
+
+def defaultCache() -> GeoCodeCache:
+    """ *A function that returns the process-wide GeoCodeCache persisted in ~/.apgis/geocodes.json.* """
+    global __defaultCache__
+
+    with __defaultCacheLock__:
+        if __defaultCache__ is None:
+            __defaultCache__ = GeoCodeCache(filename=GEOCODE_CACHE)
+
+        return __defaultCache__
+
+
+def reverseGeocode(centroid: list,
+                   geocoder=None,
+                   minDelay: float = GEOCODE_DELAY,
+                   retries: int = 3) -> dict:
+    """ *A function that reverse geocodes a centroid with Nominatim under its rate limit.*
+
+    Requests of all the threads of the process are spaced by at least minDelay seconds. Failed requests, like
+    those rate limited by the service, are retried after 2, 4 and 8 times minDelay.
+
+    Args:
+        centroid:   A [longitude, latitude] centroid.
+        geocoder:   A geopy Nominatim geocoder. Defaults to the public Nominatim service.
+        minDelay:   The minimum delay between requests in seconds. Defaults to 1.
+        retries:    The number of retries of a failed request. Defaults to 3.
+    Returns:
+        dict:       The address field of the reverse geocode lookup.
+    Raises:
+        GeoCodingError:     Occurs if the lookup fails.
+    """
+    global __lastRequest__
+
+    if geocoder is None:
+        from geopy.geocoders import Nominatim
+        geocoder = Nominatim(user_agent=USER_AGENT)
+
+    longitude, latitude = centroid
+    for attempt in range(retries + 1):
+        with __requestLock__:
+            wait = __lastRequest__ + minDelay - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            __lastRequest__ = time.monotonic()
+
+        try:
+            return geocoder.reverse((latitude, longitude), exactly_one=True).raw['address']
+
+        except Exception as e:
+            if attempt == retries:
+                raise apexception.GeoCodingError(f"GeoCoding lookup failed: {e}")
+
+            time.sleep(minDelay * 2 ** (attempt + 1))
+
+
+def geocodeFields(fields: list,
+                  cache: GeoCodeCache = None,
+                  geocoder=None,
+                  minDelay: float = GEOCODE_DELAY,
+                  saveEvery: int = 50) -> dict:
+    """ *A function that reverse geocodes the centroids of a batch of Fields.*
+
+    Fields whose rounded centroids match share a single lookup, and centroids that are already cached are not
+    looked up at all. The remaining lookups are made one at a time under the rate limit and cached, and the
+    cache is saved every saveEvery lookups so an interrupted batch resumes where it stopped.
+
+    Args:
+        fields:     A list of Field objects.
+        cache:      A GeoCodeCache. Defaults to the process-wide cache persisted in ~/.apgis/geocodes.json.
+        geocoder:   A geopy Nominatim geocoder, like one pointed at a LocalNominatimServer.
+                    Defaults to the public Nominatim service.
+        minDelay:   The minimum delay between requests in seconds. Defaults to 1.
+        saveEvery:  The number of lookups between cache saves. Defaults to 50.
+    Returns:
+        dict:       A dictionary with the apfieldIDs and the addresses of the Fields as key-value pairs.
+    Raises:
+        GeoCodingError:     Occurs if a lookup fails. The addresses found until then stay cached.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Geocoding the fields of a project:*\n
+    ``>> addresses = geocodeFields(fields=fields)``\n
+    ``>> districts = {apfieldID: address.get("state_district") for apfieldID, address in addresses.items()}``
+    """
+    cache = cache if cache is not None else defaultCache()
+
+    centroids = {}
+    for field in fields:
+        centroids.setdefault(cache.key(field.centroid), field.centroid)
+
+    missing = [centroid for centroid in centroids.values() if cache.get(centroid) is None]
+    if missing and geocoder is None:
+        from geopy.geocoders import Nominatim
+        geocoder = Nominatim(user_agent=USER_AGENT)
+
+    try:
+        for i, centroid in enumerate(missing, start=1):
+            cache.put(centroid, reverseGeocode(centroid=centroid, geocoder=geocoder, minDelay=minDelay))
+            if i % saveEvery == 0:
+                cache.save()
+
+    finally:
+        if missing:
+            cache.save()
+
+    return {field.apfieldID: cache.get(field.centroid) for field in fields}
+
+
+class LocalNominatimServer:
+    """
+    *Class for a local HTTP stand-in of the Nominatim reverse geocoding endpoint.*
+
+    **Class Attributes:**\n
+    - ``domain:``       The host and port of the server, for the domain of a geopy Nominatim geocoder.
+    - ``latency:``      The delay in seconds before each response.
+    - ``minInterval:``  The minimum interval in seconds between requests, below which requests fail with a 429.
+    - ``requests:``     The number of requests served.
+    - ``rateLimited:``  The number of requests rejected with a 429.
+
+    Answers ``/reverse`` requests in the JSON format of Nominatim with a synthetic address derived from the
+    coordinates, and rejects requests that come faster than minInterval like the public service rate limits
+    them. Use it as a context manager and pass it a geopy geocoder with
+    ``Nominatim(user_agent=USER_AGENT, domain=server.domain, scheme="http")``.
+
+    Examples:
+        Some example uses of this class are:\n
+    *Geocoding fields against the stand-in:*\n
+    ``>> with LocalNominatimServer(minInterval=0.05) as server:``\n
+    ``>>     geocoder = Nominatim(user_agent=USER_AGENT, domain=server.domain, scheme="http")``\n
+    ``>>     addresses = geocodeFields(fields=fields, cache=GeoCodeCache(), geocoder=geocoder, minDelay=0.05)``
+    """
+
+    def __init__(self, latency: float = 0.0, minInterval: float = 0.0):
+        """ **Constructor Method**\n
+        Yields a ``LocalNominatimServer`` object.
+
+        Args:
+            latency:        The delay in seconds before each response. Defaults to 0.
+            minInterval:    The minimum interval in seconds between requests. Defaults to 0.
+        """
+        self.domain = None
+        self.latency = latency
+        self.minInterval = minInterval
+        self.requests = 0
+        self.rateLimited = 0
+
+        self.__last__ = None
+        self.__lock__ = threading.Lock()
+        self.__server__ = None
+        self.__thread__ = None
+
+    @staticmethod
+    def synthetic(latitude: float, longitude: float) -> dict:
+        """ A staticmethod that returns the synthetic address of a coordinate, the same for a 0.01 degree cell. """
+        return {"village": f"Village {latitude:.2f} {longitude:.2f}", "state_district": f"District {latitude:.0f}",
+                "state": "Tamil Nadu", "country": "India", "country_code": "in"}
+
+    def start(self) -> None:
+        """ A method that starts the server on a free local port in a background thread. """
+        import http.server
+
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            """ A request handler that answers reverse geocoding requests. """
+
+            def do_GET(self):
+                with server.__lock__:
+                    server.requests += 1
+                    now = time.monotonic()
+                    limited = server.__last__ is not None and now - server.__last__ < server.minInterval
+                    server.__last__ = now
+                    server.rateLimited += limited
+
+                time.sleep(server.latency)
+                url = urllib.parse.urlparse(self.path)
+                query = dict(urllib.parse.parse_qsl(url.query))
+
+                if limited:
+                    self.send_error(429, "Too Many Requests")
+                elif url.path.rstrip("/") != "/reverse" or "lat" not in query or "lon" not in query:
+                    self.send_error(400, "Bad Request")
+                else:
+                    latitude, longitude = float(query["lat"]), float(query["lon"])
+                    content = json.dumps({"lat": query["lat"], "lon": query["lon"],
+                                          "display_name": f"{latitude}, {longitude}",
+                                          "address": server.synthetic(latitude, longitude)}).encode("utf-8")
+
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(content)))
+                    self.end_headers()
+                    self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        self.__server__ = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.domain = f"127.0.0.1:{self.__server__.server_address[1]}"
+        self.__thread__ = threading.Thread(target=self.__server__.serve_forever, daemon=True)
+        self.__thread__.start()
+
+    def stop(self) -> None:
+        """ A method that stops the server. """
+        if self.__server__ is not None:
+            self.__server__.shutdown()
+            self.__server__.server_close()
+            self.__server__ = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
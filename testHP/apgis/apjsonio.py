@@ -146,10 +146,44 @@ def geojsonRead(filename: pathString) -> dict:
 
 
 def geojsonWrite(dictData: dict,
-                 filename: pathString):
-    """ Function implementation currently in progress. """
-    # TODO: Implement GeoJSON Write Capabilities.
-    raise NotImplementedError("Function is currently unavailable: GeoJSON Write")
+                 filename: pathString) -> None:
+    """ *A function that writes a GeoJSON file.*
+
+    The function accepts a python dictionary to write to a GeoJSON and the path to write it to.
+    Adds a '.geojson' extension to the filename if it doesn't already end with one.
+    Uses geojson.dump() with compact separators to write the dictionary into a GeoJSON file.
+
+    Args:
+        dictData:   A dictionary containing the contents to be written into a GeoJSON.
+        filename:   A pathlike string to the GeoJSON file to be written.
+    Returns:
+        None
+    Raises:
+        TypeError:      Occurs if the dictData is not a dictionary or if the filename is not a pathlike string.
+        GeoJSONError:   Occurs if GeoJSON writing fails.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Writing a GeoJSON:*\n
+    ``>> geojsonWrite(dictData: data, filename: "./output.geojson")``
+    """
+    if not isinstance(dictData, dict):
+        raise TypeError("GeoJSON Write Failed @ dict check: dictData must be a dictionary")
+
+    if not isinstance(filename, str):
+        raise TypeError("GeoJSON Write Failed @ pathString check: filename must be a pathLike string")
+
+    try:
+        if not filename.endswith(GEOJSON_EXT):
+            filename = filename + GEOJSON_EXT
+
+        with open(filename, "w") as filePointer:
+            geojson.dump(dictData, filePointer, separators=(",", ":"))
+
+        return None
+
+    except Exception as e:
+        raise apexception.GeoJSONError(f"GeoJSON Write Failed @ GeoJSON dumping: {e}")
 
 
 def topojsonRead():
@@ -0,0 +1,314 @@
+"""
+Class module that implements the class *ExportManifest*.
+
+The ExportManifest class is a persistent store of the exports that have been generated.
+Each export is identified by a content address, a stable hash of its export parameters and its
+serialized Earth Engine image graph, so an identical export request always maps to the same entry.
+The Export classes consult the manifest to skip exports that are already complete or in flight. With an
+existence check, the outputs in the Drive or the bucket are checked as well.
+
+************************************************************************
+Copyrights (c) 2020 ANTPOD Designs Private Limited. All Rights Reserved.
+************************************************************************
+"""
+import os
+import json
+import hashlib
+import datetime
+import typing
+
+import apgis.apjsonio as jsonio
+import apgis.apexception as apexception
+
+MANIFEST_VERSION = 1
+
+LIVE_STATES = ("READY", "RUNNING", "COMPLETED")
+TERMINAL_STATES = ("COMPLETED", "FAILED", "CANCELLED")
+
+
+def _canonical(value):
+    """ A function that converts Earth Engine objects into a JSON serializable form for hashing. """
+    if hasattr(value, "serialize"):
+        return json.loads(value.serialize())
+
+    if hasattr(value, "tolist"):
+        return value.tolist()
+
+    return str(value)
+
+
+class ExportManifest:
+    """
+    *Class for a persistent, content-addressed manifest of generated exports.*
+
+    **Class Methods:**\n
+    - ``exportKey:``    *A staticmethod that returns the content address of an export request.*
+    - ``storageCheck:`` *A staticmethod that returns an existence check of export outputs in the Drive or a bucket.*
+    - ``lookup:``       *A method that returns the manifest entry of an export.*
+    - ``isLive:``       *A method that checks whether an export is complete or in flight.*
+    - ``record:``       *A method that records a generated export task.*
+    - ``refresh:``      *A method that updates the state of the recorded exports from their tasks.*
+    - ``save:``         *A method that writes the manifest to its file.*
+
+    **Class Attributes:**\n
+    - ``filename:``     The path to the JSON file the manifest is persisted in.
+    - ``entries:``      A dictionary of manifest entries keyed by content address.
+    - ``exists:``       The function that checks whether the output of an export exists, or None.
+
+    Every export request is hashed along with its serialized image graph into a content address.
+    Two requests for the same field geometry, sensor, product, date, scale, crs and destination produce the
+    same address, whatever order they are made in or whichever run they are made from.\n
+    Exports recorded in the manifest whose state is READY, RUNNING or COMPLETED are skipped by the
+    Export classes. Entries are recorded as UNSUBMITTED and their state is updated with refresh()
+    once the tasks have been started, so exports that are never started or that fail are regenerated.\n
+    The task state alone does not tell whether the output is still there. With an existence check, like
+    storageCheck(), a COMPLETED export whose output has been deleted is regenerated, and an export whose output
+    is already in the Drive or the bucket is skipped and recorded as COMPLETED, even if it is not in the manifest.
+    """
+
+    def __init__(self, filename: str = None, exists: typing.Callable = None):
+        """ **Constructor Method**\n
+        Yields an ``ExportManifest`` object.
+
+        Args:
+            filename:   A pathlike string to the JSON file to persist the manifest in. The manifest is loaded
+                        from it if it exists. Defaults to None (in-memory manifest).
+            exists:     A function called with the destination, location and fileNamePrefix of an export that
+                        returns whether its output exists, or None if it cannot tell, like the function of
+                        storageCheck(). Defaults to None (the task states are trusted).
+        Raises:
+            TypeError:      Occurs if the filename is not a pathlike string.
+            JSONError:      Occurs if the manifest file cannot be read.
+        """
+        if filename is not None and not isinstance(filename, str):
+            raise TypeError("ExportManifest Construction Failed @ type check: filename must be a pathlike string")
+
+        if filename is not None and not filename.endswith(jsonio.JSON_EXT):
+            filename = filename + jsonio.JSON_EXT
+
+        self.filename = filename
+        self.exists = exists
+        self.entries = {}
+        self.__tasks__ = {}
+
+        if filename is not None and os.path.isfile(filename):
+            manifest = jsonio.jsonRead(filename=filename)
+            if manifest.get("version") != MANIFEST_VERSION:
+                raise apexception.JSONError(f"ExportManifest Construction Failed @ version check: "
+                                            f"{filename} is not a version {MANIFEST_VERSION} manifest")
+
+            self.entries = manifest.get("entries", {})
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key: str):
+        return key in self.entries
+
+    @staticmethod
+    def exportKey(image=None, **params) -> str:
+        """ *A staticmethod that returns the content address of an export request.*
+
+        The parameters are serialized as canonical JSON along with the serialized graph of the image,
+        and hashed with SHA-256. Earth Engine objects among the parameters, like regions, are serialized too.
+
+        Args:
+            image:      The ee.Image to be exported. Defaults to None.
+            **params:   The export parameters, like the destination, fileNamePrefix, scale and crs.
+        Returns:
+            str:        The hexadecimal content address of the export.
+
+        Examples:
+            Some example uses of this method are:\n
+        *Generating the address of an export:*\n
+        ``>> key = ExportManifest.exportKey(image=image, destination="Cloud", scale=10, crs="EPSG:4326")``
+        """
+        try:
+            content = {
+                "params": params,
+                "graph": None if image is None else json.loads(image.serialize())
+            }
+            canonical = json.dumps(content, sort_keys=True, separators=(",", ":"), default=_canonical)
+            return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+        except Exception as e:
+            raise apexception.EEExportError(f"Export Key Generation Failed @ Serialization: {e}")
+
+    @staticmethod
+    def storageCheck(storage=None, drive=None) -> typing.Callable:
+        """ *A staticmethod that returns an existence check of export outputs in the Drive or a bucket.*
+
+        Cloud exports are looked up with CloudStorage.listBlobs() under their fileNamePrefix, and Drive exports
+        in the listing of their folder with Drive.traverseDrive(), which is cached for all the exports of the
+        folder. Outputs sharded by Earth Engine are found by their fileNamePrefix as well. Exports to other
+        buckets or to a destination without a client cannot be checked.
+
+        Args:
+            storage:    A CloudStorage object of the exports bucket. Defaults to None.
+            drive:      A Drive object. Defaults to None.
+        Returns:
+            function:   An existence check for an ExportManifest.
+
+        Examples:
+            Some example uses of this method are:\n
+        *Skipping the exports that are already in the bucket:*\n
+        ``>> manifest = ExportManifest("manifest", exists=ExportManifest.storageCheck(storage=CloudStorage()))``
+        """
+        def exists(destination, location, fileNamePrefix):
+            if destination == "Cloud" and storage is not None:
+                if getattr(storage.bucket, "name", location) != location:
+                    return None
+
+                return bool(storage.listBlobs(prefixes=fileNamePrefix)[fileNamePrefix])
+
+            if destination == "Drive" and drive is not None:
+                from apgis.apcloud import DrivePath
+
+                try:
+                    files = drive.traverseDrive(drivepath=DrivePath(f"root/{location}/{fileNamePrefix}.tif"))
+                except apexception.DriveError:
+                    return False
+
+                return any(file['title'].startswith(fileNamePrefix) for file in files)
+
+            return None
+
+        return exists
+
+    def lookup(self, key: str) -> dict:
+        """ *A method that returns the manifest entry of an export or None if it has not been recorded.*
+
+        Args:
+            key:    The content address of the export.
+        Returns:
+            dict:   The manifest entry with the fileNamePrefix, destination, location, taskID, state,
+                    created and updated keys.
+        """
+        return self.entries.get(key)
+
+    def isLive(self, key: str, fileNamePrefix: str = None, destination: str = None, location: str = None) -> bool:
+        """ *A method that checks whether an export is complete or in flight and should not be regenerated.*
+
+        Exports whose tasks were generated in this session and have not failed are live as well,
+        so duplicate requests within a run reuse the first task.\n
+        If the manifest has an existence check and the fileNamePrefix is given, an export that is not in flight
+        is complete only if its output exists. An output that exists is recorded as COMPLETED.
+
+        Args:
+            key:            The content address of the export.
+            fileNamePrefix: The filename prefix of the export. Defaults to None (the output is not checked).
+            destination:    The export destination, "Drive" or "Cloud". Defaults to None.
+            location:       The Drive folder or the Cloud Storage bucket of the export. Defaults to None.
+        Returns:
+            bool:   True if the export is READY or RUNNING, has a task from this session, or is COMPLETED or
+                    has an existing output.
+        Raises:
+            CloudStorageError:  Occurs if the bucket listing of the existence check fails.
+            DriveError:         Occurs if the Drive listing of the existence check fails.
+        """
+        entry = self.entries.get(key)
+        if entry is not None and (entry["state"] in ("READY", "RUNNING") or key in self.__tasks__):
+            return True
+
+        exists = None
+        if self.exists is not None and fileNamePrefix is not None:
+            exists = self.exists(destination, location, fileNamePrefix)
+
+        if exists is None:
+            return entry is not None and entry["state"] in LIVE_STATES
+
+        if exists and (entry is None or entry["state"] != "COMPLETED"):
+            now = datetime.datetime.utcnow().isoformat(timespec="seconds")
+            self.entries[key] = {
+                "fileNamePrefix": fileNamePrefix,
+                "destination": destination,
+                "location": location,
+                "taskID": entry["taskID"] if entry is not None else None,
+                "state": "COMPLETED",
+                "created": entry["created"] if entry is not None else now,
+                "updated": now
+            }
+
+        return exists
+
+    def record(self, key: str, task, fileNamePrefix: str, destination: str, location: str) -> None:
+        """ *A method that records a generated export task.*
+
+        The entry is recorded as UNSUBMITTED and holds on to the task so refresh() can update its state.
+
+        Args:
+            key:            The content address of the export.
+            task:           The unstarted export task.
+            fileNamePrefix: The filename prefix of the export.
+            destination:    The export destination, "Drive" or "Cloud".
+            location:       The Drive folder or the Cloud Storage bucket of the export.
+        """
+        now = datetime.datetime.utcnow().isoformat(timespec="seconds")
+        self.entries[key] = {
+            "fileNamePrefix": fileNamePrefix,
+            "destination": destination,
+            "location": location,
+            "taskID": None,
+            "state": "UNSUBMITTED",
+            "created": now,
+            "updated": now
+        }
+        self.__tasks__[key] = task
+
+    def refresh(self, statusQuery=None) -> dict:
+        """ *A method that updates the state of the recorded exports from their tasks and saves the manifest.*
+
+        Entries recorded in this session are matched with their tasks to pick up task IDs. The states of
+        all entries with a task ID that are not finished are then fetched with a single bulk status query.
+
+        Args:
+            statusQuery:    A function that returns a dictionary of task status dictionaries keyed by task ID.
+                            Defaults to a bulk Earth Engine task list query.
+        Returns:
+            dict:       A dictionary with the count of entries in each state.
+        Raises:
+            EERuntimeError:     Occurs if the status query fails.
+        """
+        for key, task in self.__tasks__.items():
+            if getattr(task, "id", None) and not self.entries[key]["taskID"]:
+                self.entries[key]["taskID"] = task.id
+
+        pending = {entry["taskID"]: entry for entry in self.entries.values()
+                   if entry["taskID"] and entry["state"] not in TERMINAL_STATES}
+
+        if pending:
+            try:
+                if statusQuery is None:
+                    from apgis.geetask import eeTaskStatuses
+                    statusQuery = eeTaskStatuses
+
+                statuses = statusQuery()
+
+            except Exception as e:
+                raise apexception.EERuntimeError(f"Manifest Refresh Failed @ Status Query: {e}")
+
+            now = datetime.datetime.utcnow().isoformat(timespec="seconds")
+            for taskID, entry in pending.items():
+                state = statuses.get(taskID, {}).get("state")
+                if state and state != entry["state"]:
+                    entry["state"] = state
+                    entry["updated"] = now
+
+        self.__tasks__ = {key: task for key, task in self.__tasks__.items()
+                          if self.entries[key]["state"] not in TERMINAL_STATES}
+        self.save()
+
+        states = {}
+        for entry in self.entries.values():
+            states[entry["state"]] = states.get(entry["state"], 0) + 1
+
+        return states
+
+    def save(self) -> None:
+        """ *A method that writes the manifest to its file. In-memory manifests are not written.*
+
+        Raises:
+            JSONError:      Occurs if the manifest file cannot be written.
+        """
+        if self.filename is not None:
+            jsonio.jsonWrite(dictData={"version": MANIFEST_VERSION, "entries": self.entries}, filename=self.filename)
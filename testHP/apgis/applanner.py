@@ -0,0 +1,235 @@
+"""
+Module for export cost estimation and pre-flight planning.
+
+Library of top-level functions that estimate the pixel counts, output bytes and task counts of a
+proposed Image or ImageCollection export from the Field geometry, the RequestList bands and the
+native band resolutions of the config, entirely locally and before any task is submitted.
+Exports that would exceed maxPixels and bands that would be oversampled by the export scale are
+flagged, and a shard size and file dimensions are recommended for the export.
+
+************************************************************************
+Copyrights (c) 2020 ANTPOD Designs Private Limited. All Rights Reserved.
+************************************************************************
+"""
+import math
+
+import apgis.geedownload as download
+import apgis.apraster as raster
+import apgis.geeindex as index
+
+from apgis.apconfig import Config
+from apgis.aprequestlist import RequestList
+from apgis.apfield import Field
+
+CONFIG = Config()
+
+MAX_PIXELS = 100000000
+POINT_BUFFER = 100
+SHARD_SIZES = (1024, 512, 256, 128, 64)
+MAX_SHARD_BYTES = 16 * 1024 * 1024
+MAX_FILE_BYTES = 1024 * 1024 * 1024
+
+
+def fieldBounds(field: Field) -> list:
+    """ *A function that returns the export bounding box of a Field.*
+
+    Polygon Fields are exported over their ROIBox and Point Fields over their 100m buffer, as with Field.eeROI.
+
+    Args:
+        field:      A Field object.
+    Returns:
+        list:       The bounding box as [minLongitude, minLatitude, maxLongitude, maxLatitude].
+    """
+    if field.ROIBox is not None:
+        return list(field.ROIBox)
+
+    longitude, latitude = field.centroid
+    dy = POINT_BUFFER / download.METRES_PER_DEGREE
+    dx = dy / math.cos(math.radians(latitude))
+    return [longitude - dx, latitude - dy, longitude + dx, latitude + dy]
+
+
+def bandResolution(requestList: RequestList, band: str) -> int:
+    """ *A function that returns the native resolution in metres of a band of a RequestList sensor.*
+
+    Bands take their resolution from the Band Details in the config and indices that of their coarsest input
+    band in geeindex.INDEX_BANDS. Other bands, like the QA bands, take the finest resolution of the sensor.
+
+    Args:
+        requestList:    A RequestList object.
+        band:           A band name of the sensor.
+    Returns:
+        int:        The native resolution in metres.
+    """
+    resolutions = CONFIG.getBandResolutions(sensor=requestList.sensor)
+    finest = min(resolutions.values())
+
+    inputs = index.INDEX_BANDS.get(requestList.sat, {}).get(band)
+    if inputs:
+        return max(resolutions.get(inputBand, finest) for inputBand in inputs)
+
+    return resolutions.get(band, finest)
+
+
+def nativeScale(requestList: RequestList, bands: list) -> int:
+    """ *A function that returns the finest native resolution in metres among a list of bands of a RequestList.*
+
+    Args:
+        requestList:    A RequestList object.
+        bands:          A list of band names of the sensor.
+    Returns:
+        int:        The native resolution in metres.
+    """
+    return min(bandResolution(requestList=requestList, band=band) for band in bands)
+
+
+def resolutionGroups(requestList: RequestList, bands: list) -> dict:
+    """ *A function that groups a list of bands of a RequestList by their native resolution.*
+
+    Args:
+        requestList:    A RequestList object.
+        bands:          A list of band names of the sensor.
+    Returns:
+        dict:       A dictionary with the resolutions in metres, finest first, and the lists of their bands in the
+                    order of the bands as key-value pairs.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Grouping the water index bands of Sentinel-2 L2A:*\n
+    ``>> resolutionGroups(requestList=RequestList(["WI"], "L2A"), bands=["NDMI", "NDWI"])``\n
+    ``{10: ['NDWI'], 20: ['NDMI']}``
+    """
+    groups = {}
+    for band in bands:
+        groups.setdefault(bandResolution(requestList=requestList, band=band), []).append(band)
+
+    return dict(sorted(groups.items()))
+
+
+def recommendSharding(width: int, height: int, bandCount: int, bytesPerPixel: int = 4) -> dict:
+    """ *A function that recommends the shardSize and fileDimensions of an export.*
+
+    The shardSize is the smallest power of two from 64 to 1024 that covers the image in a single shard, or the
+    largest one otherwise, among those whose shards stay under 16 MiB. The fileDimensions split the export into
+    square files under 1 GiB that are a multiple of the shardSize, or are None if the export fits in a single file.
+
+    Args:
+        width:          The width of the export in pixels.
+        height:         The height of the export in pixels.
+        bandCount:      The number of bands of the export.
+        bytesPerPixel:  The bytes per pixel of each band. Defaults to 4 (float).
+    Returns:
+        dict:       A dictionary with the recommended shardSize and fileDimensions.
+    """
+    pixelBytes = bandCount * bytesPerPixel
+
+    sizes = [size for size in SHARD_SIZES if size * size * pixelBytes <= MAX_SHARD_BYTES] or [min(SHARD_SIZES)]
+    covering = [size for size in sizes if size >= max(width, height)]
+    shardSize = min(covering) if covering else max(sizes)
+
+    fileDimensions = None
+    if width * height * pixelBytes > MAX_FILE_BYTES:
+        side = int(math.sqrt(MAX_FILE_BYTES / pixelBytes))
+        fileDimensions = max(side // shardSize, 1) * shardSize
+
+    return {"shardSize": shardSize, "fileDimensions": fileDimensions}
+
+
+def planExport(requestList: RequestList,
+               fields,
+               scale: float = 10,
+               images: int = 1,
+               multiband: bool = False,
+               maxPixels: int = MAX_PIXELS,
+               bytesPerPixel: int = 4) -> dict:
+    """ *A function that estimates the cost of a proposed export before anything is submitted.*
+
+    For each Field and product, the pixel grid of the export is computed at the export scale, along with
+    the grids of its bands at their native resolution, as exported with nativeScale. An export is flagged if
+    its grid exceeds maxPixels, which fails the task after it is queued, and a product is flagged as
+    oversampled if the export scale is finer than the native resolution of any of its bands, which spends
+    quota on interpolated pixels. Multi-band exports hold all the products in a single task.
+
+    Args:
+        requestList:    A RequestList object with the products to be exported.
+        fields:         A Field object or a list of Field objects.
+        scale:          The export scale in metres. Defaults to 10.
+        images:         The number of images exported per Field, the size of an ImageCollection. Defaults to 1.
+        multiband:      A bool for a single multi-band export of all the products. Defaults to False.
+        maxPixels:      The maxPixels of the export. Defaults to 100000000.
+        bytesPerPixel:  The bytes per pixel of each band. Defaults to 4 (float).
+    Returns:
+        dict:       A dictionary with the tasks, pixels, bytes, nativeTasks, nativePixels and nativeBytes totals, the
+                    recommended shardSize and fileDimensions for the largest export, a list of products with the
+                    bands, nativeScale, recommendedScale, pixels and bytes of each, and a list of warnings.
+    Raises:
+        TypeError:      Occurs if the parameter type checks fail.
+        ValueError:     Occurs if the scale or images are invalid.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Planning an NDVI and RGB export of a field for a year of acquisitions:*\n
+    ``>> plan = planExport(requestList=RequestList(["VI", "RGB"], "L2A"), fields=field, images=73)``\n
+    ``>> print(plan["tasks"], plan["bytes"], plan["warnings"])``
+    """
+    fields = [fields] if isinstance(fields, Field) else list(fields)
+
+    if not isinstance(requestList, RequestList):
+        raise TypeError("Export Planning Failed @ type check: requestList must be RequestList object")
+
+    if not all(isinstance(field, Field) for field in fields):
+        raise TypeError("Export Planning Failed @ type check: fields must be Field objects")
+
+    if scale <= 0 or images < 1:
+        raise ValueError("Export Planning Failed @ parameter check: scale and images must be positive")
+
+    if multiband:
+        groups = {raster.MULTIBAND_SEPARATOR.join(requestList.products): requestList.exportBands}
+    else:
+        groups = {product: requestList.sensorProducts[product] for product in requestList.products}
+
+    plan = {"tasks": 0, "pixels": 0, "bytes": 0, "nativeTasks": 0, "nativePixels": 0, "nativeBytes": 0,
+            "shardSize": None, "fileDimensions": None, "products": [], "warnings": []}
+    largest = (0, 0, 1)
+
+    for product, bands in groups.items():
+        native = nativeScale(requestList=requestList, bands=bands)
+        bandGroups = resolutionGroups(requestList=requestList, bands=bands)
+        entry = {"product": product, "bands": len(bands), "nativeScale": native,
+                 "recommendedScale": max(scale, native), "pixels": 0, "bytes": 0, "nativePixels": 0}
+
+        for field in fields:
+            bounds = fieldBounds(field)
+            grid = download.computeGrid(bounds=bounds, scale=scale)
+
+            gridPixels = grid["width"] * grid["height"]
+            if gridPixels > maxPixels:
+                plan["warnings"].append(f"{field.apfieldID} {product}: {gridPixels} pixels exceed maxPixels "
+                                        f"{maxPixels}")
+
+            if gridPixels > largest[0] * largest[1]:
+                largest = (grid["width"], grid["height"], len(bands))
+
+            entry["pixels"] += gridPixels * len(bands) * images
+            for resolution, groupBands in bandGroups.items():
+                nativeGrid = download.computeGrid(bounds=bounds, scale=max(scale, resolution))
+                entry["nativePixels"] += nativeGrid["width"] * nativeGrid["height"] * len(groupBands) * images
+
+        entry["bytes"] = entry["pixels"] * bytesPerPixel
+        coarse = [f"{resolution}m" for resolution in bandGroups if resolution > scale]
+        if coarse:
+            plan["warnings"].append(f"{product}: scale {scale}m oversamples {', '.join(coarse)} bands, "
+                                    f"{entry['pixels'] / max(entry['nativePixels'], 1):.1f}x the native pixels")
+
+        plan["products"].append(entry)
+        plan["tasks"] += len(fields) * images
+        plan["nativeTasks"] += len(fields) * images * len(bandGroups)
+        plan["pixels"] += entry["pixels"]
+        plan["nativePixels"] += entry["nativePixels"]
+
+    plan["bytes"] = plan["pixels"] * bytesPerPixel
+    plan["nativeBytes"] = plan["nativePixels"] * bytesPerPixel
+    plan.update(recommendSharding(width=largest[0], height=largest[1], bandCount=largest[2],
+                                  bytesPerPixel=bytesPerPixel))
+
+    return plan
@@ -0,0 +1,405 @@
+"""
+Module for local raster handling of exported GeoTIFFs.
+
+Library of top-level functions to read, split and manipulate the GeoTIFF files that are exported
+by the Earth Engine batch system once they are available on the local file system.
+Requires the rasterio library which is imported when the functions are called.
+
+************************************************************************
+Copyrights (c) 2020 ANTPOD Designs Private Limited. All Rights Reserved.
+************************************************************************
+"""
+import os
+import pathlib
+
+import apgis.apexception as apexception
+
+from apgis.aprequestlist import RequestList
+
+import typing
+pathString = typing.Union[str, pathlib.Path]
+
+TIFF_EXT = ".tif"
+MULTIBAND_SEPARATOR = "_"
+
+QUANTIZED_DTYPE = "int16"
+QUANTIZED_NODATA = -32768
+QUANTIZED_LIMIT = 32767
+QUANTIZED_SCALE = 0.0001
+QUANTIZED_OFFSET = 0.0
+QUANTIZED_INDICES = ("NDVI", "SAVI", "ARVI", "GNDVI", "NDCI", "NPCRI", "PSRI", "BSI",
+                     "NDWI", "NDMI", "NDGI", "NDSI", "NBRI")
+
+
+def quantization(band: str) -> tuple:
+    """ *A function that returns the scale and offset of a quantized index band.*
+
+    Indices are stored as ``round((value - offset) / scale)`` in int16, so a scale of 0.0001 holds indices in
+    [-3.2767, 3.2767]. Only the indices of QUANTIZED_INDICES, the normalized differences and the ratios of
+    bounded magnitude, fit that range. Indices computed from the raw reflectance counts, like AVI, EVI, SI and
+    MCARI, do not and are never quantized.
+
+    Args:
+        band:       The index band name.
+    Returns:
+        tuple:      The (scale, offset) of the band.
+    Raises:
+        ValueError:     Occurs if the band is not a quantizable index.
+    """
+    if band not in QUANTIZED_INDICES:
+        raise ValueError(f"Quantization Failed @ index check: {band} is not a quantizable index")
+
+    return QUANTIZED_SCALE, QUANTIZED_OFFSET
+
+
+def splitProducts(filename: pathString,
+                  requestList: RequestList,
+                  outputDir: pathString = None) -> list:
+    """ *A function that splits a multi-band export into a GeoTIFF for each product.*
+
+    Multi-band exports hold the bands of all the products of a RequestList in a single GeoTIFF, in the
+    order of RequestList.exportBands, and are named with the product IDs joined by "_" in place of the
+    product ID. Each product is written to its own GeoTIFF with the bands of that product, named with the
+    usual ``apfieldID-sensor-product-date`` scheme, with the profile of the multi-band file.
+    Band descriptions in the file are used to locate the bands if present.
+
+    Args:
+        filename:       A pathlike string to the multi-band GeoTIFF.
+        requestList:    The RequestList the multi-band export was generated with.
+        outputDir:      A pathlike string to the directory to write the product GeoTIFFs into.
+                        Defaults to the directory of the multi-band GeoTIFF.
+    Returns:
+        list:       A list of the paths of the product GeoTIFFs, in product order.
+    Raises:
+        TypeError:      Occurs if the parameter type checks fail.
+        FileNotFoundError:      Occurs if the GeoTIFF cannot be found.
+        ValueError:     Occurs if the filename or the bands do not match the requestList.
+        RasterError:    Occurs if the raster reading or writing fails.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Splitting a multi-band export of the VI and RGB products:*\n
+    ``>> requestList = RequestList(productList=["VI", "RGB"], sensor="L2A")``\n
+    ``>> files = splitProducts(filename="f-01-L2A-VI_RGB-2020-06-14.tif", requestList=requestList)``
+    """
+    if not isinstance(filename, (str, pathlib.Path)):
+        raise TypeError("Product Split Failed @ type check: filename must be a pathlike string")
+
+    if not isinstance(requestList, RequestList):
+        raise TypeError("Product Split Failed @ type check: requestList must be a RequestList object")
+
+    if not os.path.isfile(filename):
+        raise FileNotFoundError(f"Product Split Failed @ isfile check: {filename} could not be found")
+
+    filename = pathlib.Path(filename)
+    parts = filename.stem.split("-")
+    compound = MULTIBAND_SEPARATOR.join(requestList.products)
+
+    if compound not in parts:
+        raise ValueError(f"Product Split Failed @ filename check: {filename.name} is not a multi-band "
+                         f"export of {requestList.products}")
+
+    outputDir = pathlib.Path(outputDir) if outputDir is not None else filename.parent
+    position = len(parts) - 1 - parts[::-1].index(compound)
+
+    try:
+        import rasterio
+
+        with rasterio.open(filename) as source:
+            bands = requestList.exportBands
+            descriptions = list(source.descriptions)
+
+            if any(descriptions):
+                if not set(bands) <= set(descriptions):
+                    raise ValueError(f"bands {bands} are not all in {descriptions}")
+                bandIndex = {band: descriptions.index(band) + 1 for band in bands}
+            else:
+                if source.count != len(bands):
+                    raise ValueError(f"{source.count} bands found but {len(bands)} expected")
+                bandIndex = {band: i + 1 for i, band in enumerate(bands)}
+
+            profile = source.profile
+            os.makedirs(outputDir, exist_ok=True)
+
+            outputs = []
+            for product in requestList.products:
+                productBands = requestList.sensorProducts[product]
+                data = source.read([bandIndex[band] for band in productBands])
+
+                productName = "-".join(parts[:position] + [product] + parts[position + 1:]) + TIFF_EXT
+                output = outputDir / productName
+
+                profile.update(count=len(productBands))
+                with rasterio.open(output, "w", **profile) as sink:
+                    sink.write(data)
+                    for i, band in enumerate(productBands):
+                        sink.set_band_description(i + 1, band)
+
+                outputs.append(str(output))
+
+        return outputs
+
+    except ValueError as e:
+        raise ValueError(f"Product Split Failed @ band check: {e}")
+    except Exception as e:
+        raise apexception.RasterError(f"Product Split Failed @ Raster I/O: {e}")
+
+
+def writeGeoTIFF(array,
+                 transform: list,
+                 filename: pathString,
+                 crs: str = "EPSG:4326",
+                 bandNames: list = None,
+                 nodata: float = None) -> str:
+    """ *A function that writes a NumPy array as a GeoTIFF.*
+
+    Adds a '.tif' extension to the filename if it doesn't already end with one.
+    The GeoTIFF is DEFLATE compressed, and tiled if it is at least 256 pixels across.
+
+    Args:
+        array:      A NumPy array of shape (bands, height, width) or (height, width).
+        transform:  The affine transform of the array as [a, b, c, d, e, f].
+        filename:   A pathlike string to the GeoTIFF to be written.
+        crs:        The coordinate reference system of the array. Defaults to 'EPSG:4326'.
+        bandNames:  A list of band names written as the band descriptions. Defaults to None.
+        nodata:     The nodata value of the GeoTIFF. Defaults to None.
+    Returns:
+        str:        The path of the written GeoTIFF.
+    Raises:
+        ValueError:     Occurs if the array is not 2D or 3D or the bandNames do not match the bands.
+        RasterError:    Occurs if the raster writing fails.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Writing an NDVI array:*\n
+    ``>> writeGeoTIFF(array=ndvi, transform=transform, filename="f-01-L2A-NDVI-2020-06-14", bandNames=["NDVI"])``
+    """
+    import numpy as np
+
+    array = np.asarray(array)
+    if array.ndim == 2:
+        array = array[np.newaxis]
+
+    if array.ndim != 3:
+        raise ValueError("GeoTIFF Write Failed @ array check: array must be 2D or 3D")
+
+    if bandNames is not None and len(bandNames) != array.shape[0]:
+        raise ValueError("GeoTIFF Write Failed @ bandNames check: a name is required for each band")
+
+    filename = str(filename)
+    if not filename.endswith(TIFF_EXT):
+        filename = filename + TIFF_EXT
+
+    try:
+        import rasterio
+
+        profile = {
+            "driver": "GTiff",
+            "count": array.shape[0],
+            "height": array.shape[1],
+            "width": array.shape[2],
+            "dtype": array.dtype.name,
+            "crs": crs,
+            "transform": rasterio.Affine(*transform[:6]),
+            "nodata": nodata,
+            "compress": "deflate",
+            "tiled": array.shape[1] >= 256 and array.shape[2] >= 256
+        }
+
+        with rasterio.open(filename, "w", **profile) as sink:
+            sink.write(array)
+            for i, band in enumerate(bandNames or []):
+                sink.set_band_description(i + 1, band)
+
+        return filename
+
+    except Exception as e:
+        raise apexception.RasterError(f"GeoTIFF Write Failed @ Raster I/O: {e}")
+
+
+def cropFields(filename: pathString,
+               group: dict,
+               outputDir: pathString = None) -> list:
+    """ *A function that crops a grouped export into a GeoTIFF for each of the Fields of the group.*
+
+    Grouped exports from Export.Image.toCloudGrouped() cover the bounding box of a group of Fields and are named
+    with the groupID in place of the apfieldID. Each Field is cropped to the pixels that cover its bounding box
+    and written with the usual ``apfieldID-sensor-product-date`` name, with the profile of the grouped export.
+
+    Args:
+        filename:       A pathlike string to the grouped export GeoTIFF.
+        group:          The group dictionary of the export from the plan of Export.Image.toCloudGrouped().
+        outputDir:      A pathlike string to the directory to write the Field GeoTIFFs into.
+                        Defaults to the directory of the grouped export.
+    Returns:
+        list:       A list of the paths of the Field GeoTIFFs.
+    Raises:
+        TypeError:      Occurs if the parameter type checks fail.
+        FileNotFoundError:      Occurs if the GeoTIFF cannot be found.
+        ValueError:     Occurs if the filename does not match the group.
+        RasterError:    Occurs if the raster reading or writing fails.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Cropping a grouped export of the VI product:*\n
+    ``>> files = cropFields(filename="GRP1A2B3C4D5E-L2A-VI-2020-08-23.tif", group=plan["groups"][0])``
+    """
+    if not isinstance(filename, (str, pathlib.Path)):
+        raise TypeError("Field Crop Failed @ type check: filename must be a pathlike string")
+
+    if not isinstance(group, dict) or "groupID" not in group or "fields" not in group:
+        raise TypeError("Field Crop Failed @ type check: group must be a group dictionary")
+
+    if not os.path.isfile(filename):
+        raise FileNotFoundError(f"Field Crop Failed @ isfile check: {filename} could not be found")
+
+    filename = pathlib.Path(filename)
+    parts = filename.stem.split("-")
+
+    if parts[0] != group["groupID"]:
+        raise ValueError(f"Field Crop Failed @ filename check: {filename.name} is not an export of {group['groupID']}")
+
+    outputDir = pathlib.Path(outputDir) if outputDir is not None else filename.parent
+
+    try:
+        import math
+        import rasterio
+        from rasterio.windows import Window
+
+        with rasterio.open(filename) as source:
+            profile = source.profile
+            inverse = ~source.transform
+            os.makedirs(outputDir, exist_ok=True)
+
+            outputs = []
+            for apfieldID, (minX, minY, maxX, maxY) in group["fields"].items():
+                colStart, rowStart = inverse * (minX, maxY)
+                colStop, rowStop = inverse * (maxX, minY)
+
+                colStart, rowStart = max(math.floor(colStart), 0), max(math.floor(rowStart), 0)
+                colStop, rowStop = min(math.ceil(colStop), source.width), min(math.ceil(rowStop), source.height)
+                if colStop <= colStart or rowStop <= rowStart:
+                    continue
+
+                window = Window(colStart, rowStart, colStop - colStart, rowStop - rowStart)
+                data = source.read(window=window)
+
+                profile.update(width=window.width, height=window.height, transform=source.window_transform(window))
+                if profile.get("tiled") and (window.width < 256 or window.height < 256):
+                    profile.update(tiled=False, blockxsize=None, blockysize=None)
+
+                output = outputDir / ("-".join([apfieldID] + parts[1:]) + TIFF_EXT)
+                with rasterio.open(output, "w", **profile) as sink:
+                    sink.write(data)
+                    sink.scales, sink.offsets = source.scales, source.offsets
+                    for i, description in enumerate(source.descriptions):
+                        if description:
+                            sink.set_band_description(i + 1, description)
+
+                outputs.append(str(output))
+
+        return outputs
+
+    except Exception as e:
+        raise apexception.RasterError(f"Field Crop Failed @ Raster I/O: {e}")
+
+
+def tagQuantized(filename: pathString, bands: list = None) -> list:
+    """ *A function that records the scale, offset and nodata of a quantized index export in its GeoTIFF metadata.*
+
+    Quantized exports from the Export methods with quantize set hold their index bands as int16, but Earth Engine
+    does not write the scale and offset into the GeoTIFF. They are written as the GDAL scale and offset of each
+    int16 band, along with the nodata sentinel, so GDAL based readers decode the bands as well as readDecoded().
+    Bands that are not int16 quantizable indices, like the RGB bands, are left as is.
+
+    Args:
+        filename:   A pathlike string to the downloaded GeoTIFF.
+        bands:      A list of the band names of the GeoTIFF. Defaults to the band descriptions.
+    Returns:
+        list:       A list of the names of the tagged bands.
+    Raises:
+        TypeError:      Occurs if the parameter type checks fail.
+        FileNotFoundError:      Occurs if the GeoTIFF cannot be found.
+        ValueError:     Occurs if the band names are missing or do not match the bands.
+        RasterError:    Occurs if the raster update fails.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Tagging a quantized VI export:*\n
+    ``>> tagQuantized(filename="f-01-L2A-WI-2020-06-14.tif", bands=["NDMI", "NDWI"])``
+    """
+    if not isinstance(filename, (str, pathlib.Path)):
+        raise TypeError("Quantization Tagging Failed @ type check: filename must be a pathlike string")
+
+    if not os.path.isfile(filename):
+        raise FileNotFoundError(f"Quantization Tagging Failed @ isfile check: {filename} could not be found")
+
+    try:
+        import rasterio
+
+        with rasterio.open(filename, "r+") as sink:
+            bands = list(bands) if bands is not None else list(sink.descriptions)
+            if len(bands) != sink.count or not all(bands):
+                raise ValueError(f"a name is required for each of the {sink.count} bands, found {bands}")
+
+            scales, offsets = list(sink.scales), list(sink.offsets)
+            tagged = []
+            for i, band in enumerate(bands):
+                sink.set_band_description(i + 1, band)
+                if sink.dtypes[i] == QUANTIZED_DTYPE and band in QUANTIZED_INDICES:
+                    scales[i], offsets[i] = quantization(band)
+                    tagged.append(band)
+
+            if tagged:
+                sink.scales, sink.offsets = scales, offsets
+                sink.nodata = QUANTIZED_NODATA
+
+        return tagged
+
+    except ValueError as e:
+        raise ValueError(f"Quantization Tagging Failed @ band check: {e}")
+    except Exception as e:
+        raise apexception.RasterError(f"Quantization Tagging Failed @ Raster I/O: {e}")
+
+
+def readDecoded(source, band=1, window=None, out_shape=None):
+    """ *A function that reads a band of an open raster as float32, decoding quantized index bands.*
+
+    Bands with a GDAL scale or offset are decoded as ``value * scale + offset`` while they are read, so quantized
+    exports stay int16 on disk and only the pixels that are read are decoded. Nodata pixels are masked.\n
+    Earth Engine does not write the scale and offset of quantized exports, so untagged int16 bands named after a
+    quantizable index are decoded with quantization() and their QUANTIZED_NODATA pixels are masked. Exports read
+    straight from Drive, a bucket or a remote COG are thus decoded without running tagQuantized() first.
+
+    Args:
+        source:     An open rasterio dataset.
+        band:       The 1-based index or the description of the band to be read. Defaults to 1.
+        window:     A rasterio Window to read. Defaults to the whole band.
+        out_shape:  The (height, width) to resample the band to on read. Defaults to the window shape.
+    Returns:
+        numpy.ma.MaskedArray:   The float32 values of the band.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Reading the NDVI band of a quantized VI export:*\n
+    ``>> with rasterio.open("f-01-L2A-VI-2020-06-14.tif") as source:``\n
+    ``>>     ndvi = readDecoded(source=source, band="NDVI")``
+    """
+    import numpy as np
+
+    if isinstance(band, str):
+        band = list(source.descriptions).index(band) + 1
+
+    data = source.read(band, window=window, out_shape=out_shape, masked=True)
+    scale, offset = source.scales[band - 1], source.offsets[band - 1]
+
+    name = source.descriptions[band - 1]
+    if scale == 1 and offset == 0 and source.dtypes[band - 1] == QUANTIZED_DTYPE and name in QUANTIZED_INDICES:
+        scale, offset = quantization(name)
+        data = np.ma.masked_equal(data, QUANTIZED_NODATA)
+
+    data = data.astype(np.float32)
+    if scale != 1 or offset != 0:
+        data = data * np.float32(scale) + np.float32(offset)
+
+    return data
@@ -0,0 +1,488 @@
+"""
+Module for range-read access to remote cloud-optimized GeoTIFFs.
+
+Library of top-level functions that read a window of a remote GeoTIFF, like a regional export in a bucket,
+without downloading the whole file. The raster is opened with rasterio over a *RangeReader*, which fetches
+only the byte ranges that GDAL reads, the header and the internal tiles that overlap the window, with HTTP
+range requests. Fetched bytes are kept in a block cache, and the ranges of adjacent tiles are coalesced
+into a single request while the remaining requests are made in parallel.
+Contains the class *LocalRangeServer*, a local HTTP stand-in for a bucket that serves byte ranges of local
+files for testing and benchmarking.
+Requires the rasterio library, version 1.4 or later, which is imported when the functions are called.
+
+************************************************************************
+Copyrights (c) 2020 ANTPOD Designs Private Limited. All Rights Reserved.
+************************************************************************
+"""
+import re
+import time
+import pathlib
+import threading
+import collections
+import urllib.error
+import urllib.request
+
+import apgis.apraster as raster
+import apgis.apexception as apexception
+
+import typing
+pathString = typing.Union[str, pathlib.Path]
+
+BLOCK_SIZE = 16 * 1024
+CACHE_BYTES = 64 * 1024 * 1024
+COALESCE_GAP = 64 * 1024
+
+
+def fetchRange(url: str, start: int, end: int, timeout: float = 60, retries: int = 3) -> tuple:
+    """ *A function that fetches the bytes start to end, inclusive, of a URL with an HTTP range request.*
+
+    Requests that fail with a server error, a rate limit or a connection error are retried with an exponential
+    delay.
+
+    Args:
+        url:        The URL of the file.
+        start:      The offset of the first byte.
+        end:        The offset of the last byte.
+        timeout:    The request timeout in seconds. Defaults to 60.
+        retries:    The number of retries. Defaults to 3.
+    Returns:
+        tuple:      The bytes of the range and the size of the whole file.
+    Raises:
+        RasterError:    Occurs if the range cannot be fetched or the server does not support range requests.
+    """
+    request = urllib.request.Request(url, headers={"Range": f"bytes={start}-{end}"})
+
+    for attempt in range(retries + 1):
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                if response.status != 206:
+                    raise apexception.RasterError(f"Range Fetch Failed @ HTTP Request: {url} ignored the range")
+
+                content = response.read()
+                total = re.search(r"/(\d+)$", response.headers.get("Content-Range", ""))
+                return content, int(total.group(1)) if total else None
+
+        except apexception.RasterError:
+            raise
+        except urllib.error.HTTPError as e:
+            if (e.code != 429 and e.code < 500) or attempt == retries:
+                raise apexception.RasterError(f"Range Fetch Failed @ HTTP Request: {e.code} {e.reason}")
+        except Exception as e:
+            if attempt == retries:
+                raise apexception.RasterError(f"Range Fetch Failed @ HTTP Request: {e}")
+
+        time.sleep(0.5 * 2 ** attempt)
+
+
+class RangeReader:
+    """
+    *Class for a block cached reader of a remote file over byte range requests.*
+
+    **Class Methods:**\n
+    - ``fromURL:``      *A classmethod that returns a reader of a URL that supports HTTP range requests.*
+    - ``readRanges:``   *A method that reads a list of byte ranges of the file.*
+    - ``open:``         *A method that opens the file as a rasterio dataset.*
+
+    **Class Attributes:**\n
+    - ``name:``         The name of the file.
+    - ``size:``         The size of the file in bytes.
+    - ``requests:``     The number of range requests made.
+    - ``bytesTransferred:``     The number of bytes fetched.
+
+    The file is read in blocks of 16 KiB, which are kept in an LRU cache of up to 64 MiB, so the many small reads
+    of the TIFF header by GDAL cost a single request. The missing blocks of a batch of ranges are merged into
+    runs, joining the runs that are less than 64 KiB apart, and the runs are fetched concurrently. GDAL reads
+    the tiles of a window as such a batch, so adjacent tiles are fetched with a single request.
+    """
+
+    def __init__(self,
+                 fetch: typing.Callable,
+                 size: int,
+                 name: str = "remote.tif",
+                 blockSize: int = BLOCK_SIZE,
+                 cacheBytes: int = CACHE_BYTES,
+                 maxWorkers: int = 8):
+        """ **Constructor Method**\n
+        Yields a ``RangeReader`` object.
+
+        Args:
+            fetch:      A function called with the offsets of the first and last bytes of a range, which returns
+                        the bytes of the range, like CloudStorage.readRange.
+            size:       The size of the file in bytes.
+            name:       The name of the file, whose extension selects the GDAL driver. Defaults to "remote.tif".
+            blockSize:  The size of the cached blocks in bytes. Defaults to 16 KiB.
+            cacheBytes: The size of the block cache in bytes. Defaults to 64 MiB.
+            maxWorkers: The maximum number of concurrent range requests. Defaults to 8.
+
+        Examples:
+            Some example uses of this class are:\n
+        *Reading an export from the exports bucket:*\n
+        ``>> gcs = CloudStorage()``\n
+        ``>> name = "GRP1A2B3C4D5E-L2A-VI-2020-08-23.tif"``\n
+        ``>> size = gcs.listBlobs(prefixes=name)[name][0]["size"]``\n
+        ``>> reader = RangeReader(fetch=lambda start, end: gcs.readRange(name, start, end), size=size, name=name)``
+        """
+        self.name = name
+        self.size = size
+        self.requests = 0
+        self.bytesTransferred = 0
+
+        self.__fetch__ = fetch
+        self.__blockSize__ = blockSize
+        self.__cacheBlocks__ = max(cacheBytes // blockSize, 1)
+        self.__maxWorkers__ = maxWorkers
+        self.__blocks__ = collections.OrderedDict()
+        self.__lock__ = threading.Lock()
+
+    @classmethod
+    def fromURL(cls, url: str, timeout: float = 60, retries: int = 3, **kwargs):
+        """ *A classmethod that returns a reader of a URL that supports HTTP range requests.*
+
+        The first block of the file is fetched to find its size, and is kept in the cache.
+
+        Args:
+            url:        The URL of the file.
+            timeout:    The request timeout in seconds. Defaults to 60.
+            retries:    The number of retries of a failed request. Defaults to 3.
+            **kwargs:   The blockSize, cacheBytes and maxWorkers of the reader.
+        Returns:
+            RangeReader:    The reader of the URL.
+        Raises:
+            RasterError:    Occurs if the first block cannot be fetched.
+
+        Examples:
+            Some example uses of this method are:\n
+        *Reading a field from a regional export:*\n
+        ``>> reader = RangeReader.fromURL(url="https://storage.googleapis.com/bucket/GRP1A2B3C4D5E-L2A-VI.tif")``\n
+        ``>> array, transform = readWindow(reader=reader, bounds=field, band="NDVI")``
+        """
+        def fetch(start, end):
+            return fetchRange(url=url, start=start, end=end, timeout=timeout, retries=retries)[0]
+
+        blockSize = kwargs.get("blockSize", BLOCK_SIZE)
+        content, size = fetchRange(url=url, start=0, end=blockSize - 1, timeout=timeout, retries=retries)
+
+        reader = cls(fetch=fetch, size=size, name=url.split("?")[0].rsplit("/", 1)[-1], **kwargs)
+        reader.requests, reader.bytesTransferred = 1, len(content)
+        for i in range(0, len(content), blockSize):
+            reader.__blocks__[i // blockSize] = content[i:i + blockSize]
+
+        return reader
+
+    def __fetch_run__(self, first: int, last: int) -> None:
+        """ A method that fetches the blocks first to last, inclusive, with a single request into the cache. """
+        start = first * self.__blockSize__
+        content = self.__fetch__(start, min((last + 1) * self.__blockSize__, self.size) - 1)
+
+        with self.__lock__:
+            self.requests += 1
+            self.bytesTransferred += len(content)
+            for block in range(first, last + 1):
+                self.__blocks__[block] = content[(block - first) * self.__blockSize__:
+                                                 (block - first + 1) * self.__blockSize__]
+                self.__blocks__.move_to_end(block)
+
+            while len(self.__blocks__) > self.__cacheBlocks__:
+                self.__blocks__.popitem(last=False)
+
+    def readRanges(self, offsets: list, sizes: list) -> list:
+        """ *A method that reads a list of byte ranges of the file.*
+
+        Args:
+            offsets:    The offsets of the ranges.
+            sizes:      The sizes of the ranges in bytes.
+        Returns:
+            list:       The bytes of each range.
+        Raises:
+            RasterError:    Occurs if a range fetch fails.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        ranges = [(offset, min(offset + size, self.size)) for offset, size in zip(offsets, sizes)]
+        needed = sorted({block for start, stop in ranges if stop > start
+                         for block in range(start // self.__blockSize__, (stop - 1) // self.__blockSize__ + 1)})
+
+        with self.__lock__:
+            missing = [block for block in needed if block not in self.__blocks__]
+
+        gap = COALESCE_GAP // self.__blockSize__
+        runs = []
+        for block in missing:
+            if runs and block - runs[-1][1] <= gap + 1:
+                runs[-1][1] = block
+            else:
+                runs.append([block, block])
+
+        try:
+            if len(runs) == 1:
+                self.__fetch_run__(*runs[0])
+            elif runs:
+                with ThreadPoolExecutor(max_workers=min(self.__maxWorkers__, len(runs))) as pool:
+                    list(pool.map(lambda run: self.__fetch_run__(*run), runs))
+
+        except Exception as e:
+            raise apexception.RasterError(f"Range Read Failed @ Range Fetch: {e}")
+
+        results = []
+        with self.__lock__:
+            blocks = {}
+            for block in needed:
+                if block not in self.__blocks__:
+                    raise apexception.RasterError("Range Read Failed @ Block Cache: the cache is smaller than "
+                                                  "the ranges of a single read")
+                self.__blocks__.move_to_end(block)
+                blocks[block] = self.__blocks__[block]
+
+        for start, stop in ranges:
+            first, last = start // self.__blockSize__, (stop - 1) // self.__blockSize__
+            content = b"".join(blocks[block] for block in range(first, last + 1)) if stop > start else b""
+            results.append(content[start - first * self.__blockSize__:stop - first * self.__blockSize__])
+
+        return results
+
+    def open(self):
+        """ *A method that opens the file as a rasterio dataset, read through the reader.*
+
+        Returns:
+            rasterio.DatasetReader:     The dataset, to be closed by the caller or used as a context manager.
+        Raises:
+            RasterError:    Occurs if the dataset cannot be opened.
+        """
+        import rasterio
+        from rasterio.abc import MultiByteRangeResourceContainer
+
+        reader = self
+
+        class Handle:
+            """ A file object over the reader with its own position. """
+
+            def __init__(self):
+                self.position = 0
+
+            def read(self, size=-1):
+                size = reader.size - self.position if size is None or size < 0 else size
+                content = reader.readRanges([self.position], [size])[0]
+                self.position += len(content)
+                return content
+
+            def get_byte_ranges(self, offsets, sizes):
+                return reader.readRanges(list(offsets), list(sizes))
+
+            def seek(self, offset, whence=0):
+                self.position = [offset, self.position + offset, reader.size + offset][whence]
+                return self.position
+
+            def tell(self):
+                return self.position
+
+            def close(self):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                pass
+
+        class Container(MultiByteRangeResourceContainer):
+            """ A container of the single file of the reader. """
+
+            def open(self, path, mode="r", **kwargs):
+                return Handle()
+
+            def size(self, path):
+                return reader.size
+
+            def isfile(self, path):
+                return pathlib.PurePosixPath(path).name == reader.name
+
+            def isdir(self, path):
+                return False
+
+            def ls(self, path):
+                return []
+
+            def mtime(self, path):
+                return 0
+
+            def rm(self, path):
+                raise PermissionError(f"{path} is read-only")
+
+        try:
+            with rasterio.Env(GDAL_DISABLE_READDIR_ON_OPEN="EMPTY_DIR"):
+                return rasterio.open(reader.name, opener=Container())
+
+        except Exception as e:
+            raise apexception.RasterError(f"Remote Raster Open Failed @ rasterio: {e}")
+
+
+def readWindow(reader: RangeReader, bounds, band=1) -> tuple:
+    """ *A function that reads the window of a remote raster that covers a Field or a bounding box.*
+
+    Only the header and the internal tiles that overlap the window are fetched, and quantized exports are
+    decoded with apraster.readDecoded().
+
+    Args:
+        reader:     A RangeReader of the raster.
+        bounds:     A Field, whose export bounding box is read, or a bounding box as
+                    [minLongitude, minLatitude, maxLongitude, maxLatitude].
+        band:       The 1-based index or the description of the band to be read. Defaults to 1.
+    Returns:
+        tuple:      The masked float32 array of the window and its affine transform.
+    Raises:
+        ValueError:     Occurs if the bounds do not overlap the raster.
+        RasterError:    Occurs if the raster reading fails.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Reading the NDVI of a field from a regional export:*\n
+    ``>> with LocalRangeServer(root="exports") as server:``\n
+    ``>>     reader = RangeReader.fromURL(url=server.url("GRP1A2B3C4D5E-L2A-VI-2020-08-23.tif"))``\n
+    ``>>     ndvi, transform = readWindow(reader=reader, bounds=field, band="NDVI")``
+    """
+    import math
+    from rasterio.warp import transform_bounds
+    from rasterio.windows import Window
+
+    if not isinstance(bounds, (list, tuple)):
+        import apgis.applanner as planner
+        bounds = planner.fieldBounds(field=bounds)
+
+    with reader.open() as source:
+        try:
+            minX, minY, maxX, maxY = transform_bounds("EPSG:4326", source.crs, *bounds)
+            inverse = ~source.transform
+            colStart, rowStart = inverse * (minX, maxY)
+            colStop, rowStop = inverse * (maxX, minY)
+
+            colStart, rowStart = max(math.floor(colStart), 0), max(math.floor(rowStart), 0)
+            colStop, rowStop = min(math.ceil(colStop), source.width), min(math.ceil(rowStop), source.height)
+
+        except Exception as e:
+            raise apexception.RasterError(f"Remote Window Read Failed @ Window Computation: {e}")
+
+        if colStop <= colStart or rowStop <= rowStart:
+            raise ValueError(f"Remote Window Read Failed @ bounds check: {bounds} does not overlap {reader.name}")
+
+        try:
+            window = Window(colStart, rowStart, colStop - colStart, rowStop - rowStart)
+            return raster.readDecoded(source=source, band=band, window=window), source.window_transform(window)
+
+        except Exception as e:
+            raise apexception.RasterError(f"Remote Window Read Failed @ Raster Read: {e}")
+
+
+class LocalRangeServer:
+    """
+    *Class for a local HTTP stand-in of a bucket that serves byte ranges.*
+
+    **Class Attributes:**\n
+    - ``root:``         The directory of the served files.
+    - ``latency:``      The delay in seconds before each response.
+    - ``requests:``     The number of requests served.
+    - ``bytesServed:``  The number of bytes served.
+    - ``peakConcurrency:``  The highest number of requests that were served at once.
+
+    Serves the files under a local directory, whole or by byte range like the public URLs of Cloud Storage,
+    so remote reads can be compared with full downloads on bytes and latency. Use it as a context manager.
+
+    Examples:
+        Some example uses of this class are:\n
+    *Reading a field from the stand-in:*\n
+    ``>> with LocalRangeServer(root="exports", latency=0.05) as server:``\n
+    ``>>     reader = RangeReader.fromURL(url=server.url("GRP1A2B3C4D5E-L2A-VI-2020-08-23.tif"))``\n
+    ``>>     ndvi, transform = readWindow(reader=reader, bounds=field)``
+    """
+
+    def __init__(self, root: pathString, latency: float = 0.0):
+        """ **Constructor Method**\n
+        Yields a ``LocalRangeServer`` object.
+
+        Args:
+            root:       The directory of the served files.
+            latency:    The delay in seconds before each response. Defaults to 0.
+        """
+        self.root = pathlib.Path(root)
+        self.latency = latency
+        self.requests = 0
+        self.bytesServed = 0
+        self.peakConcurrency = 0
+
+        self.__active__ = 0
+        self.__lock__ = threading.Lock()
+        self.__server__ = None
+        self.__thread__ = None
+
+    def url(self, name: str) -> str:
+        """ A method that returns the URL of a file under the root. """
+        return f"http://127.0.0.1:{self.__server__.server_address[1]}/{urllib.request.quote(name)}"
+
+    def start(self) -> None:
+        """ A method that starts the server on a free local port in a background thread. """
+        import http.server
+
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            """ A request handler that serves files and byte ranges. """
+
+            def do_GET(self):
+                with server.__lock__:
+                    server.requests += 1
+                    server.__active__ += 1
+                    server.peakConcurrency = max(server.peakConcurrency, server.__active__)
+
+                try:
+                    time.sleep(server.latency)
+                    path = server.root / urllib.request.unquote(self.path.lstrip("/").split("?")[0])
+
+                    if not path.is_file():
+                        self.send_error(404, "File not found")
+                        return
+
+                    size = path.stat().st_size
+                    match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+                    start = int(match.group(1)) if match else 0
+                    end = min(int(match.group(2)), size - 1) if match and match.group(2) else size - 1
+
+                    if start >= size:
+                        self.send_error(416, "Range Not Satisfiable")
+                        return
+
+                    with open(path, "rb") as file:
+                        file.seek(start)
+                        content = file.read(end - start + 1)
+
+                    self.send_response(206 if match else 200)
+                    if match:
+                        self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+                    self.send_header("Content-Length", str(len(content)))
+                    self.end_headers()
+                    self.wfile.write(content)
+
+                    with server.__lock__:
+                        server.bytesServed += len(content)
+                finally:
+                    with server.__lock__:
+                        server.__active__ -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self.__server__ = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.__thread__ = threading.Thread(target=self.__server__.serve_forever, daemon=True)
+        self.__thread__.start()
+
+    def stop(self) -> None:
+        """ A method that stops the server. """
+        if self.__server__ is not None:
+            self.__server__.shutdown()
+            self.__server__.server_close()
+            self.__server__ = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
@@ -24,6 +24,7 @@ class RequestList:
     - ``sensor:``       The Sensor ID associated with the productList.
     - ``sat:``      The Satellite ID.
     - ``reqBands:``     A list of product IDs that need to be generated.
+    - ``exportBands:``  A list of the unique bands of all the products, in product order.
 
     The RequestList class wraps a list of request products after validating them.
     It also holds additional context attributes like the Sat and Sensor ID associated with the product list.
@@ -87,3 +88,8 @@ class RequestList:
 
         except Exception as e:
             raise RuntimeError(f"RequestList ReqBand Generation Failed: {e}")
+
+    @property
+    def exportBands(self) -> list:
+        """ The unique bands of all the products in product order, as written by multi-band exports. """
+        return list(dict.fromkeys(band for product in self.products for band in self.sensorProducts[product]))
@@ -0,0 +1,227 @@
+"""
+Module for local table handling of exported FeatureCollections.
+
+Library of top-level functions to read the CSV table exports of the Earth Engine batch system into
+NumPy columns and to convert them into a compact columnar format once they are available on the
+local file system. Geometry columns are decoded for the whole column at once into flat coordinate
+arrays with offsets, without parsing the GeoJSON of each feature.
+Requires the numpy library, and the pandas library for DataFrames, which are imported when the functions are called.
+
+************************************************************************
+Copyrights (c) 2020 ANTPOD Designs Private Limited. All Rights Reserved.
+************************************************************************
+"""
+import os
+import re
+import csv
+import pathlib
+
+import apgis.apexception as apexception
+
+import typing
+pathString = typing.Union[str, pathlib.Path]
+
+CSV_EXT = ".csv"
+COLUMNAR_EXT = ".npz"
+
+GEO_COLUMN = ".geo"
+GEO_KEYS = ("geo.coordinates", "geo.ringOffsets", "geo.featureOffsets")
+
+_NUMBER = r"-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?"
+_PAIR = rf"\[\s*{_NUMBER}\s*,\s*{_NUMBER}\s*\]"
+_RING = re.compile(rf"\[\s*({_PAIR}(?:\s*,\s*{_PAIR})*)\s*\]|\"coordinates\"\s*:\s*({_PAIR})")
+_NUMBERS = re.compile(_NUMBER)
+
+
+def _column(values: list):
+    """ A function that converts a list of CSV strings into an int, float or string NumPy array. """
+    import numpy as np
+
+    # float() reads underscores as digit separators, so IDs like system:index '0_1' stay strings.
+    if any("_" in value for value in values):
+        return np.array(values, dtype=np.str_)
+
+    try:
+        array = np.array([value if value != "" else "nan" for value in values], dtype=np.float64)
+    except ValueError:
+        return np.array(values, dtype=np.str_)
+
+    if array.size and np.isfinite(array).all() and (array == np.round(array)).all() and \
+            all("." not in value and "e" not in value.lower() for value in values):
+        return array.astype(np.int64)
+
+    return array
+
+
+def decodeGeometry(geoColumn: list) -> dict:
+    """ *A function that decodes a column of GeoJSON geometry strings into flat coordinate arrays.*
+
+    The column is scanned as a single string for its coordinate rings, so no feature is parsed as JSON.
+    Each Point is a ring of one coordinate, each LineString a ring and each Polygon or MultiPolygon
+    a sequence of rings. Features without a geometry have no rings.
+
+    Args:
+        geoColumn:      A list of GeoJSON geometry strings, like the '.geo' column of a CSV export.
+    Returns:
+        dict:       A dictionary with the 'geo.coordinates' array of shape (coordinates, 2), the 'geo.ringOffsets'
+                    array of the coordinate offset of each ring and the 'geo.featureOffsets' array of the ring
+                    offset of each feature. Ring i spans coordinates ringOffsets[i]:ringOffsets[i + 1] and feature
+                    j spans rings featureOffsets[j]:featureOffsets[j + 1].
+
+    Examples:
+        Some example uses of this method are:\n
+    *Decoding the geometry of a render table:*\n
+    ``>> geometry = decodeGeometry(geoColumn=['{"type":"Point","coordinates":[80.1,12.9]}'])``
+    """
+    import numpy as np
+
+    blob = "\n".join(geoColumn)
+    rowStarts = np.cumsum([0] + [len(geo) + 1 for geo in geoColumn[:-1]])
+
+    ringStarts, ringTexts = [], []
+    for match in _RING.finditer(blob):
+        ringStarts.append(match.start())
+        ringTexts.append(match.group(1) or match.group(2))
+
+    numbers = _NUMBERS.findall(" ".join(ringTexts))
+    coordinates = np.array(numbers, dtype=np.float64).reshape(-1, 2)
+
+    ringSizes = [text.count("[") or 1 for text in ringTexts]
+    ringOffsets = np.concatenate([[0], np.cumsum(ringSizes, dtype=np.int64)]).astype(np.int64)
+
+    featureOf = np.searchsorted(rowStarts, ringStarts, side="right") - 1
+    ringCounts = np.bincount(featureOf, minlength=len(geoColumn)) if len(ringStarts) else np.zeros(len(geoColumn))
+    featureOffsets = np.concatenate([[0], np.cumsum(ringCounts)]).astype(np.int64)
+
+    return dict(zip(GEO_KEYS, (coordinates, ringOffsets, featureOffsets)))
+
+
+def readTable(filename: pathString, columns: list = None) -> dict:
+    """ *A function that reads a table export into a dictionary of NumPy columns.*
+
+    CSV exports are read column-wise, with numeric columns as int or float arrays and the others as string
+    arrays. The '.geo' column, if present, is decoded with decodeGeometry().
+    Columnar '.npz' tables written by toColumnar() are read as is, loading only the requested columns.
+
+    Args:
+        filename:   A pathlike string to a '.csv' export or a '.npz' columnar table.
+        columns:    A list of the columns to be read, '.geo' for the geometry. Defaults to all the columns.
+    Returns:
+        dict:       A dictionary of NumPy arrays keyed by column name.
+    Raises:
+        TypeError:      Occurs if the parameter type checks fail.
+        FileNotFoundError:      Occurs if the table cannot be found.
+        FileTypeError:  Occurs if the table is not a '.csv' or a '.npz' file.
+        KeyError:       Occurs if a requested column is not in the table.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Reading the raw NDVI values of a field:*\n
+    ``>> table = readTable(filename="APX000-01-RawData-2020-08-23.csv")``\n
+    ``>> ndvi, longitude, latitude = table["NDVI"], table["longitude"], table["latitude"]``
+    """
+    import numpy as np
+
+    if not isinstance(filename, (str, pathlib.Path)):
+        raise TypeError("Table Read Failed @ type check: filename must be a pathlike string")
+
+    if not os.path.isfile(filename):
+        raise FileNotFoundError(f"Table Read Failed @ isfile check: {filename} could not be found")
+
+    extension = pathlib.Path(filename).suffix.lower()
+
+    if extension == COLUMNAR_EXT:
+        with np.load(filename, allow_pickle=False) as table:
+            keys = list(table.keys())
+            if columns is not None:
+                keys = [key for column in columns for key in (GEO_KEYS if column == GEO_COLUMN else [column])]
+                missing = [key for key in keys if key not in table]
+                if missing:
+                    raise KeyError(f"Table Read Failed @ column check: {missing} not in {filename}")
+
+            return {key: table[key] for key in keys}
+
+    if extension != CSV_EXT:
+        raise apexception.FileTypeError(f"Table Read Failed @ extension check: {filename} is not a "
+                                        f"{CSV_EXT} or {COLUMNAR_EXT} table")
+
+    csv.field_size_limit(2 ** 31 - 1)
+    with open(filename, newline="", encoding="utf-8") as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        rows = list(reader)
+
+    columns = header if columns is None else columns
+    missing = [column for column in columns if column not in header]
+    if missing:
+        raise KeyError(f"Table Read Failed @ column check: {missing} not in {filename}")
+
+    position = {column: i for i, column in enumerate(header)}
+    table = {}
+    for column in columns:
+        values = [row[position[column]] for row in rows]
+        if column == GEO_COLUMN:
+            table.update(decodeGeometry(geoColumn=values))
+        else:
+            table[column] = _column(values)
+
+    return table
+
+
+def toColumnar(filename: pathString, output: pathString = None, columns: list = None) -> str:
+    """ *A function that converts a CSV table export into a compact columnar '.npz' table.*
+
+    Each column is stored as a compressed NumPy array, and the geometry as the flat coordinate arrays of
+    decodeGeometry(), so the table can be read back with readTable() one column at a time.
+
+    Args:
+        filename:   A pathlike string to the '.csv' export.
+        output:     A pathlike string to the '.npz' table to be written. Defaults to the filename with a '.npz'
+                    extension.
+        columns:    A list of the columns to be kept. Defaults to all the columns.
+    Returns:
+        str:        The path of the written columnar table.
+    Raises:
+        TypeError:      Occurs if the parameter type checks fail.
+        FileNotFoundError:      Occurs if the table cannot be found.
+        FileTypeError:  Occurs if the table is not a '.csv' file.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Converting a StressZone render table:*\n
+    ``>> toColumnar(filename="APX000-01-SZRender-2020-08-23.csv")``
+    """
+    import numpy as np
+
+    if pathlib.Path(str(filename)).suffix.lower() != CSV_EXT:
+        raise apexception.FileTypeError(f"Columnar Conversion Failed @ extension check: {filename} is not a "
+                                        f"{CSV_EXT} table")
+
+    table = readTable(filename=filename, columns=columns)
+    output = str(output) if output is not None else str(pathlib.Path(filename).with_suffix(COLUMNAR_EXT))
+    if not output.endswith(COLUMNAR_EXT):
+        output = output + COLUMNAR_EXT
+
+    np.savez_compressed(output, **table)
+    return output
+
+
+def toDataFrame(table: dict):
+    """ *A function that converts a table read with readTable() into a pandas DataFrame.*
+
+    The geometry arrays are not feature aligned and are left out.
+
+    Args:
+        table:      A dictionary of NumPy columns from readTable().
+    Returns:
+        pandas.DataFrame:   The DataFrame of the feature columns.
+    Raises:
+        DataFrameError:     Occurs if the DataFrame construction fails.
+    """
+
+    try:
+        import pandas as pd
+        return pd.DataFrame({key: value for key, value in table.items() if key not in GEO_KEYS})
+
+    except Exception as e:
+        raise apexception.DataFrameError(f"DataFrame Construction Failed @ pandas: {e}")
@@ -0,0 +1,259 @@
+"""
+Module for local XYZ map tile generation from exported index rasters.
+
+Library of top-level functions that cut exported index GeoTIFFs into a web mercator XYZ pyramid of
+palette PNG tiles, coloured with the lookup table of an Earth Engine visualisation parameter dictionary
+like the palettes in geevisual. The raster is reprojected once onto the tile grid of the highest zoom
+level, from which the overviews of the lower zoom levels are built by averaging. Empty tiles are
+skipped, tiles are encoded in parallel and tiles whose content is unchanged are reused from an
+earlier pyramid of the field instead of being encoded again.
+Requires the rasterio library which is imported when the functions are called.
+
+************************************************************************
+Copyrights (c) 2020 ANTPOD Designs Private Limited. All Rights Reserved.
+************************************************************************
+"""
+import os
+import math
+import zlib
+import shutil
+import struct
+import pathlib
+import hashlib
+
+import numpy as np
+
+import apgis.apjsonio as jsonio
+import apgis.apraster as raster
+import apgis.apexception as apexception
+import apgis.aptimelapse as timelapse
+
+import typing
+pathString = typing.Union[str, pathlib.Path]
+
+PNG_EXT = ".png"
+TILE_SIZE = 256
+TILE_INDEX = "tiles.json"
+MERCATOR_EXTENT = 20037508.342789244
+MERCATOR_MAX_LATITUDE = 85.0511287798066
+
+
+def tileResolution(zoom: int) -> float:
+    """ *A function that returns the pixel size of a web mercator tile in metres at a zoom level.*
+
+    Args:
+        zoom:       The zoom level.
+    Returns:
+        float:      The pixel size in web mercator metres.
+    """
+    return 2 * MERCATOR_EXTENT / (TILE_SIZE * 2 ** zoom)
+
+
+def tileRange(bounds: list, zoom: int) -> tuple:
+    """ *A function that returns the range of the XYZ tiles that cover a bounding box at a zoom level.*
+
+    Args:
+        bounds:     A bounding box as [minLongitude, minLatitude, maxLongitude, maxLatitude].
+        zoom:       The zoom level.
+    Returns:
+        tuple:      The (minX, minY, maxX, maxY) tile indices, inclusive, with y increasing southwards.
+    """
+    def tile(longitude, latitude):
+        latitude = math.radians(max(min(latitude, MERCATOR_MAX_LATITUDE), -MERCATOR_MAX_LATITUDE))
+        x = (longitude + 180) / 360 * 2 ** zoom
+        y = (1 - math.log(math.tan(latitude) + 1 / math.cos(latitude)) / math.pi) / 2 * 2 ** zoom
+        return min(int(x), 2 ** zoom - 1), min(int(y), 2 ** zoom - 1)
+
+    minX, minY = tile(bounds[0], bounds[3])
+    maxX, maxY = tile(bounds[2], bounds[1])
+    return minX, minY, maxX, maxY
+
+
+def encodePNG(indices: np.ndarray, lut: np.ndarray) -> bytes:
+    """ *A function that encodes an array of lookup table indices as a palette PNG.*
+
+    The nodata index of the lookup table is transparent.
+
+    Args:
+        indices:    A 2D uint8 array of lookup table indices.
+        lut:        A lookup table from aptimelapse.buildLUT().
+    Returns:
+        bytes:      The PNG file contents.
+    """
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    height, width = indices.shape
+    alpha = bytes(0 if i == timelapse.NODATA_INDEX else 255 for i in range(len(lut)))
+    rows = np.hstack([np.zeros((height, 1), dtype=np.uint8), indices.astype(np.uint8)])
+
+    return b"\x89PNG\r\n\x1a\n" + \
+        chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0)) + \
+        chunk(b"PLTE", lut.tobytes()) + \
+        chunk(b"tRNS", alpha) + \
+        chunk(b"IDAT", zlib.compress(rows.tobytes(), 6)) + \
+        chunk(b"IEND", b"")
+
+
+def _downsample(level: np.ndarray, origin: tuple) -> tuple:
+    """ A function that averages a tile aligned level into the level below, ignoring NaN pixels. """
+    x, y = origin
+    left, top = (x % 2) * TILE_SIZE, (y % 2) * TILE_SIZE
+    height, width = level.shape[0] + top, level.shape[1] + left
+    bottom, right = (-height) % (2 * TILE_SIZE), (-width) % (2 * TILE_SIZE)
+
+    level = np.pad(level, ((top, bottom), (left, right)), constant_values=np.nan)
+    blocks = level.reshape(level.shape[0] // 2, 2, level.shape[1] // 2, 2)
+
+    valid = np.isfinite(blocks)
+    total = np.where(valid, blocks, 0).sum(axis=(1, 3))
+    count = valid.sum(axis=(1, 3))
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(count > 0, total / count, np.nan), (x // 2, y // 2)
+
+
+def buildPyramid(filename: pathString,
+                 outputDir: pathString,
+                 visParam: dict,
+                 minZoom: int = 12,
+                 maxZoom: int = None,
+                 band=1,
+                 previous: pathString = None,
+                 maxWorkers: int = 8) -> dict:
+    """ *A function that generates a web mercator XYZ pyramid of PNG tiles from an exported index raster.*
+
+    The raster is reprojected once onto the tile grid of maxZoom, which defaults to the lowest zoom level whose
+    pixels are at least as fine as the raster, and quantized exports are decoded with apraster.readDecoded().
+    The overview of each lower zoom level is the 2x2 average of the one above it. Tiles are written as
+    ``outputDir/z/x/y.png`` and tiles without any data are skipped.\n
+    The content hash of every tile is stored in ``outputDir/tiles.json``. Tiles whose hash matches the index of
+    outputDir or of the previous pyramid are kept or copied instead of being encoded again, so regenerating a field
+    for a new date only encodes the tiles that changed.
+
+    Args:
+        filename:   A pathlike string to the exported raster.
+        outputDir:  A pathlike string to the directory of the pyramid.
+        visParam:   A visualisation parameter dictionary with a palette, like geevisual.ndviVis.
+        minZoom:    The lowest zoom level of the pyramid. Defaults to 12.
+        maxZoom:    The highest zoom level of the pyramid. Defaults to the native zoom level of the raster.
+        band:       The 1-based index or the description of the band to be rendered. Defaults to 1.
+        previous:   A pathlike string to an earlier pyramid of the same field to reuse tiles from. Defaults to None.
+        maxWorkers: The maximum number of threads encoding tiles. Defaults to 8.
+    Returns:
+        dict:       A dictionary with the minZoom, maxZoom and the count of written, reused and skipped tiles.
+    Raises:
+        FileNotFoundError:      Occurs if the raster cannot be found.
+        ValueError:     Occurs if the zoom levels are invalid.
+        RasterError:    Occurs if the raster reading, reprojection or tile writing fails.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Generating the NDVI tiles of a field:*\n
+    ``>> buildPyramid(filename="APX000-01-L2A-NDVI-2020-08-23.tif", outputDir="tiles/2020-08-23",``
+    ``visParam=visual.ndviVis)``\n
+    *Regenerating the field for a new date:*\n
+    ``>> buildPyramid(filename="APX000-01-L2A-NDVI-2020-09-02.tif", outputDir="tiles/2020-09-02",``
+    ``visParam=visual.ndviVis, previous="tiles/2020-08-23")``
+    """
+    if not os.path.isfile(filename):
+        raise FileNotFoundError(f"Tile Pyramid Failed @ isfile check: {filename} could not be found")
+
+    lut = timelapse.buildLUT(visParam=visParam)
+
+    try:
+        import rasterio
+        from rasterio.warp import reproject, transform_bounds, Resampling
+
+        with rasterio.open(filename) as source:
+            data = raster.readDecoded(source=source, band=band).filled(np.nan)
+            bounds = transform_bounds(source.crs, "EPSG:4326", *source.bounds)
+
+            if maxZoom is None:
+                left, bottom, right, top = transform_bounds(source.crs, "EPSG:3857", *source.bounds)
+                pixel = min((right - left) / source.width, (top - bottom) / source.height)
+                maxZoom = max(int(math.ceil(math.log2(2 * MERCATOR_EXTENT / (TILE_SIZE * pixel)))), 0)
+
+            if not 0 <= minZoom <= maxZoom:
+                raise ValueError(f"minZoom {minZoom} and maxZoom {maxZoom} must satisfy 0 <= minZoom <= maxZoom")
+
+            minX, minY, maxX, maxY = tileRange(bounds=bounds, zoom=maxZoom)
+            resolution = tileResolution(zoom=maxZoom)
+            tileSpan = TILE_SIZE * resolution
+            level = np.full(((maxY - minY + 1) * TILE_SIZE, (maxX - minX + 1) * TILE_SIZE), np.nan, dtype=np.float32)
+
+            reproject(source=data, destination=level, src_transform=source.transform, src_crs=source.crs,
+                      src_nodata=np.nan, dst_nodata=np.nan,
+                      dst_transform=rasterio.Affine(resolution, 0, minX * tileSpan - MERCATOR_EXTENT,
+                                                    0, -resolution, MERCATOR_EXTENT - minY * tileSpan),
+                      dst_crs="EPSG:3857", resampling=Resampling.nearest)
+
+    except ValueError as e:
+        raise ValueError(f"Tile Pyramid Failed @ zoom check: {e}")
+    except Exception as e:
+        raise apexception.RasterError(f"Tile Pyramid Failed @ Raster Reprojection: {e}")
+
+    outputDir = pathlib.Path(outputDir)
+    indexFile = outputDir / TILE_INDEX
+    current = jsonio.jsonRead(str(indexFile)) if indexFile.is_file() else {}
+
+    reusable = {}
+    if previous is not None and (pathlib.Path(previous) / TILE_INDEX).is_file():
+        for tile, digest in jsonio.jsonRead(str(pathlib.Path(previous) / TILE_INDEX)).items():
+            reusable.setdefault(digest, pathlib.Path(previous) / (tile + PNG_EXT))
+
+    index, report = {}, {"minZoom": minZoom, "maxZoom": maxZoom, "written": 0, "reused": 0, "skipped": 0}
+
+    def writeTile(tile, indices, digest):
+        """ A function that keeps, copies or encodes a tile and returns how it was produced. """
+        path = outputDir / (tile + PNG_EXT)
+        if current.get(tile) == digest and path.is_file():
+            return "reused"
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if digest in reusable and reusable[digest].is_file():
+            shutil.copyfile(reusable[digest], path)
+            return "reused"
+
+        path.write_bytes(encodePNG(indices=indices, lut=lut))
+        return "written"
+
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=maxWorkers) as pool:
+            futures = []
+            origin = (minX, minY)
+
+            for zoom in range(maxZoom, minZoom - 1, -1):
+                indices = timelapse.indexFrame(array=level, visParam=visParam)
+
+                for row in range(indices.shape[0] // TILE_SIZE):
+                    for col in range(indices.shape[1] // TILE_SIZE):
+                        tileIndices = indices[row * TILE_SIZE:(row + 1) * TILE_SIZE,
+                                              col * TILE_SIZE:(col + 1) * TILE_SIZE]
+
+                        if (tileIndices == timelapse.NODATA_INDEX).all():
+                            report["skipped"] += 1
+                            continue
+
+                        tile = f"{zoom}/{origin[0] + col}/{origin[1] + row}"
+                        digest = hashlib.sha1(lut.tobytes() + tileIndices.tobytes()).hexdigest()
+                        index[tile] = digest
+                        futures.append(pool.submit(writeTile, tile, tileIndices, digest))
+
+                if zoom > minZoom:
+                    level, origin = _downsample(level=level, origin=origin)
+
+            for future in futures:
+                report[future.result()] += 1
+
+        for tile in set(current) - set(index):
+            (outputDir / (tile + PNG_EXT)).unlink(missing_ok=True)
+
+        outputDir.mkdir(parents=True, exist_ok=True)
+        jsonio.jsonWrite(dictData=index, filename=str(indexFile))
+        return report
+
+    except Exception as e:
+        raise apexception.RasterError(f"Tile Pyramid Failed @ Tile Writing: {e}")
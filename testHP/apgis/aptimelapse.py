@@ -0,0 +1,281 @@
+"""
+Module for local timelapse assembly from exported index rasters.
+
+Library of top-level functions that render a date-ordered series of exported index GeoTIFFs into an
+animated GIF. Index values are mapped to colours with a lookup table precomputed from an Earth Engine
+visualisation parameter dictionary, like the palettes in geevisual, and the frames are rendered and
+LZW encoded in parallel worker processes. Frames are streamed into the GIF in date order as they
+are encoded, so the stack of rasters is never held in memory.
+Requires the rasterio library which is imported when the functions are called.
+
+************************************************************************
+Copyrights (c) 2020 ANTPOD Designs Private Limited. All Rights Reserved.
+************************************************************************
+"""
+import os
+import pathlib
+import datetime
+import collections
+
+import numpy as np
+
+import apgis.apraster as raster
+import apgis.apexception as apexception
+
+import typing
+pathString = typing.Union[str, pathlib.Path]
+
+GIF_EXT = ".gif"
+LUT_SIZE = 256
+NODATA_INDEX = LUT_SIZE - 1
+NODATA_COLOUR = (0, 0, 0)
+
+MAX_CODE = 4096
+
+
+def buildLUT(visParam: dict) -> np.ndarray:
+    """ *A function that precomputes the colour lookup table of an Earth Engine visualisation parameter dictionary.*
+
+    The palette is stretched linearly over the lookup table, as Earth Engine stretches it between min and max.
+    The last entry of the table is reserved for nodata pixels.
+
+    Args:
+        visParam:   A visualisation parameter dictionary with a 'palette' of hex colours and optional 'min' and 'max',
+                    like geevisual.ndviVis.
+    Returns:
+        np.ndarray:     A uint8 array of shape (256, 3) with the RGB colour of each lookup table index.
+    Raises:
+        ValueError:     Occurs if the visParam has no palette.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Building the NDVI lookup table:*\n
+    ``>> lut = buildLUT(visParam=visual.ndviVis)``
+    """
+    palette = visParam.get("palette")
+    if not palette:
+        raise ValueError("LUT Build Failed @ palette check: visParam must have a palette")
+
+    colours = np.array([[int(colour.lstrip("#")[i:i + 2], 16) for i in (0, 2, 4)] for colour in palette],
+                       dtype=np.float64)
+
+    stops = np.linspace(0, 1, len(colours))
+    positions = np.linspace(0, 1, NODATA_INDEX)
+
+    lut = np.empty((LUT_SIZE, 3), dtype=np.uint8)
+    for channel in range(3):
+        lut[:NODATA_INDEX, channel] = np.round(np.interp(positions, stops, colours[:, channel]))
+    lut[NODATA_INDEX] = NODATA_COLOUR
+
+    return lut
+
+
+def indexFrame(array, visParam: dict) -> np.ndarray:
+    """ *A function that maps index values to lookup table indices.*
+
+    Values are clamped to the visParam min and max, which default to 0 and 1. Masked and NaN values are
+    mapped to the nodata index.
+
+    Args:
+        array:      A 2D array or masked array of index values.
+        visParam:   The visualisation parameter dictionary of the lookup table.
+    Returns:
+        np.ndarray:     A uint8 array of lookup table indices.
+    """
+    low, high = visParam.get("min", 0), visParam.get("max", 1)
+
+    values = np.ma.filled(np.ma.asarray(array, dtype=np.float64), np.nan)
+    nodata = ~np.isfinite(values)
+
+    scaled = (np.nan_to_num(values) - low) / (high - low) * (NODATA_INDEX - 1)
+    indices = np.clip(np.round(scaled), 0, NODATA_INDEX - 1).astype(np.uint8)
+    indices[nodata] = NODATA_INDEX
+
+    return indices
+
+
+def lzwEncode(indices: bytes, minCodeSize: int = 8) -> bytes:
+    """ *A function that LZW compresses a string of colour indices into GIF image data sub-blocks.*
+
+    Args:
+        indices:        The colour indices of the frame in row order.
+        minCodeSize:    The minimum code size, the bit depth of the colour table. Defaults to 8.
+    Returns:
+        bytes:      The minimum code size byte, followed by the compressed data in sub-blocks and the block terminator.
+    """
+    clear, end = 1 << minCodeSize, (1 << minCodeSize) + 1
+    output = bytearray()
+    buffer, bits = 0, 0
+
+    def emit(code, size):
+        nonlocal buffer, bits
+        buffer |= code << bits
+        bits += size
+        while bits >= 8:
+            output.append(buffer & 0xFF)
+            buffer >>= 8
+            bits -= 8
+
+    codeSize = minCodeSize + 1
+    table = {bytes([i]): i for i in range(clear)}
+    nextCode = end + 1
+    emit(clear, codeSize)
+
+    prefix = b""
+    for byte in indices:
+        word = prefix + bytes([byte])
+        if word in table:
+            prefix = word
+            continue
+
+        emit(table[prefix], codeSize)
+        if nextCode < MAX_CODE:
+            table[word] = nextCode
+            if nextCode == 1 << codeSize:
+                codeSize += 1
+            nextCode += 1
+        else:
+            emit(clear, codeSize)
+            table = {bytes([i]): i for i in range(clear)}
+            nextCode, codeSize = end + 1, minCodeSize + 1
+        prefix = bytes([byte])
+
+    if prefix:
+        emit(table[prefix], codeSize)
+    emit(end, codeSize)
+    if bits:
+        output.append(buffer & 0xFF)
+
+    blocks = bytearray([minCodeSize])
+    for i in range(0, len(output), 255):
+        chunk = output[i:i + 255]
+        blocks.append(len(chunk))
+        blocks.extend(chunk)
+    blocks.append(0)
+
+    return bytes(blocks)
+
+
+def frameDate(filename: pathString) -> datetime.date:
+    """ *A function that returns the acquisition date of an export from its ``apfieldID-...-YYYY-MM-DD`` filename.*
+
+    Args:
+        filename:   A pathlike string to an exported raster.
+    Returns:
+        datetime.date:  The acquisition date of the export.
+    Raises:
+        ValueError:     Occurs if the filename does not end with a date.
+    """
+    stem = pathlib.Path(filename).stem
+    try:
+        return datetime.datetime.strptime(stem[-10:], "%Y-%m-%d").date()
+
+    except ValueError:
+        raise ValueError(f"Frame Date Failed @ filename check: {stem} does not end with a YYYY-MM-DD date")
+
+
+def _renderFrame(filename: str, band, shape: tuple, visParam: dict, delay: int) -> bytes:
+    """ A function that reads, colour indexes and encodes a raster as a GIF frame. Runs in a worker process. """
+    import rasterio
+
+    with rasterio.open(filename) as source:
+        array = raster.readDecoded(source=source, band=band, out_shape=shape)
+
+    indices = indexFrame(array=array, visParam=visParam)
+
+    # Frames are restored to the transparent background before the next, so nodata never shows older frames.
+    control = b"\x21\xF9\x04" + bytes([0x09]) + delay.to_bytes(2, "little") + bytes([NODATA_INDEX, 0])
+    descriptor = b"\x2C" + (0).to_bytes(4, "little") + shape[1].to_bytes(2, "little") + \
+        shape[0].to_bytes(2, "little") + b"\x00"
+
+    return control + descriptor + lzwEncode(indices=indices.tobytes())
+
+
+def writeTimelapse(filenames: list,
+                   filename: pathString,
+                   visParam: dict,
+                   band=1,
+                   scale: int = 1,
+                   frameDuration: int = 500,
+                   loop: int = 0,
+                   sortByDate: bool = True,
+                   maxWorkers: int = None) -> str:
+    """ *A function that streams a series of exported index rasters into an animated GIF timelapse.*
+
+    Each raster is a frame, read at the size of the first raster times the scale with nearest neighbour
+    resampling. The frames are colour indexed through the lookup table of the visParam and encoded in a pool of
+    worker processes. Encoded frames are written to the GIF in order as they complete, with at most twice
+    the number of workers in flight, so memory use does not grow with the number of frames.
+    Nodata pixels are transparent and quantized exports are decoded with apraster.readDecoded().\n
+    Adds a '.gif' extension to the filename if it doesn't already end with one.
+
+    Args:
+        filenames:      A list of pathlike strings to the exported rasters.
+        filename:       A pathlike string to the GIF to be written.
+        visParam:       A visualisation parameter dictionary with a palette, like geevisual.ndviVis.
+        band:           The 1-based index or the description of the band to be rendered. Defaults to 1.
+        scale:          An integer upscaling factor of the frames. Defaults to 1.
+        frameDuration:  The duration of each frame in milliseconds. Defaults to 500.
+        loop:           The number of times the GIF loops, 0 to loop forever. Defaults to 0.
+        sortByDate:     A bool to order the frames by the date in their filenames. Defaults to True.
+        maxWorkers:     The number of worker processes. Defaults to the number of CPUs.
+    Returns:
+        str:        The path of the written GIF.
+    Raises:
+        ValueError:     Occurs if there are no rasters, the scale is invalid or a filename has no date.
+        FileNotFoundError:      Occurs if a raster cannot be found.
+        RasterError:    Occurs if the raster reading or GIF writing fails.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Building an NDVI timelapse of a field:*\n
+    ``>> files = glob.glob("exports/APX000-01-L2A-NDVI-*.tif")``\n
+    ``>> writeTimelapse(filenames=files, filename="APX000-01-NDVI-timelapse", visParam=visual.ndviVis, scale=4)``
+    """
+    if not filenames:
+        raise ValueError("Timelapse Write Failed @ filenames check: at least one raster is required")
+
+    if not isinstance(scale, int) or scale < 1:
+        raise ValueError("Timelapse Write Failed @ scale check: scale must be a positive integer")
+
+    for path in filenames:
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"Timelapse Write Failed @ isfile check: {path} could not be found")
+
+    filenames = sorted(filenames, key=frameDate) if sortByDate else list(filenames)
+    lut = buildLUT(visParam=visParam)
+
+    filename = str(filename)
+    if not filename.endswith(GIF_EXT):
+        filename = filename + GIF_EXT
+
+    try:
+        import rasterio
+        from concurrent.futures import ProcessPoolExecutor
+
+        with rasterio.open(filenames[0]) as source:
+            shape = (source.height * scale, source.width * scale)
+
+        header = b"GIF89a" + shape[1].to_bytes(2, "little") + shape[0].to_bytes(2, "little") + b"\xF7\x00\x00"
+        netscape = b"\x21\xFF\x0BNETSCAPE2.0\x03\x01" + loop.to_bytes(2, "little") + b"\x00"
+        delay = max(int(round(frameDuration / 10)), 1)
+
+        maxWorkers = maxWorkers or os.cpu_count() or 1
+        with open(filename, "wb") as sink, ProcessPoolExecutor(max_workers=maxWorkers) as pool:
+            sink.write(header + lut.tobytes() + netscape)
+
+            pending = collections.deque()
+            for path in filenames:
+                pending.append(pool.submit(_renderFrame, str(path), band, shape, visParam, delay))
+                if len(pending) >= 2 * maxWorkers:
+                    sink.write(pending.popleft().result())
+
+            while pending:
+                sink.write(pending.popleft().result())
+
+            sink.write(b"\x3B")
+
+        return filename
+
+    except Exception as e:
+        raise apexception.RasterError(f"Timelapse Write Failed @ Frame Encoding: {e}")
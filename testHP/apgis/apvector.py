@@ -0,0 +1,823 @@
+"""
+Module for local raster-to-vector conversion.
+
+Library of top-level functions that polygonize quantized render rasters (such as the NDVI/NDMI
+render layers and StressZone layers) locally at their native resolution. This is the local
+counterpart of the Earth Engine ``reduceToVectors`` calls in geespatial.\n
+Pixel boundaries are traced from run-length encoded edge runs so that every ring vertex is a
+pixel corner rather than a unit step, and rings can optionally be simplified such that the
+boundaries shared between adjacent layers stay coincident.
+
+************************************************************************
+Copyrights (c) 2020 ANTPOD Designs Private Limited. All Rights Reserved.
+************************************************************************
+"""
+import numpy as np
+
+import apgis.apexception as apexception
+import apgis.apjsonio as jsonio
+
+import pathlib
+import typing
+pathString = typing.Union[str, pathlib.Path]
+Transform = typing.Sequence[float]
+
+NODATA_LABEL = np.iinfo(np.int64).min
+
+
+def _labelGrid(renderArray, nodata) -> np.ndarray:
+    """ A function that returns the render array as an int64 label grid padded with a nodata border. """
+    renderArray = np.ma.asarray(renderArray)
+    if renderArray.ndim != 2:
+        raise ValueError("renderArray must be a 2D array")
+
+    values = np.ma.getdata(renderArray)
+    invalid = np.ma.getmaskarray(renderArray).copy()
+
+    if np.issubdtype(values.dtype, np.floating):
+        invalid |= ~np.isfinite(values)
+        values = np.rint(np.where(invalid, 0, values))
+
+    if nodata is not None:
+        invalid |= (values == nodata)
+
+    labels = np.where(invalid, NODATA_LABEL, values.astype(np.int64))
+
+    grid = np.full((labels.shape[0] + 2, labels.shape[1] + 2), NODATA_LABEL, dtype=np.int64)
+    grid[1:-1, 1:-1] = labels
+    return grid
+
+
+def _edgeRuns(valid: np.ndarray, own: np.ndarray, other: np.ndarray):
+    """ A function that run-length encodes unit boundary edges along each line of a boundary mask.
+
+    A run is broken wherever the boundary stops or the label on either side of it changes, so every
+    run is a maximal straight edge shared by exactly one pair of labels.
+    Returns the line, first position, position past the end, owner label and other label of each run.
+    """
+    same = valid[:, 1:] & valid[:, :-1] & (own[:, 1:] == own[:, :-1]) & (other[:, 1:] == other[:, :-1])
+
+    starts = valid.copy()
+    starts[:, 1:] &= ~same
+    ends = valid.copy()
+    ends[:, :-1] &= ~same
+
+    lines, first = np.nonzero(starts)
+    _, last = np.nonzero(ends)
+    return lines, first, last + 1, own[lines, first], other[lines, first]
+
+
+def _traceEdges(grid: np.ndarray) -> dict:
+    """ A function that returns the directed boundary runs of every label in a padded label grid.
+
+    Runs are directed such that the owner label lies on the right hand side in pixel coordinates
+    (x towards increasing columns and y towards increasing rows) and the returned vertices are
+    in the unpadded pixel-corner lattice. Returns a dictionary of label to an (N, 4) array of
+    [x0, y0, x1, y1] runs.
+    """
+    # Horizontal lattice lines between padded rows y-1 and y, across the interior columns.
+    above, below = grid[:-1, 1:-1], grid[1:, 1:-1]
+    # Vertical lattice lines between padded columns x-1 and x, across the interior rows.
+    left, right = grid[1:-1, :-1].T, grid[1:-1, 1:].T
+
+    runs = []
+    for ownerSide, otherSide, horizontal, forward in ((below, above, True, True),
+                                                      (above, below, True, False),
+                                                      (left, right, False, True),
+                                                      (right, left, False, False)):
+        valid = (ownerSide != otherSide) & (ownerSide != NODATA_LABEL)
+        lines, first, end, owner, _ = _edgeRuns(valid, ownerSide, otherSide)
+
+        # Line and position indices of the sliced grids are already unpadded lattice coordinates.
+        start, stop = (first, end) if forward else (end, first)
+        if horizontal:
+            segment = np.stack([start, lines, stop, lines], axis=1)
+        else:
+            segment = np.stack([lines, start, lines, stop], axis=1)
+        runs.append((owner, segment))
+
+    owners = np.concatenate([owner for owner, _ in runs])
+    segments = np.concatenate([segment for _, segment in runs])
+
+    edges = {}
+    for label in np.unique(owners):
+        edges[int(label)] = segments[owners == label]
+
+    return edges
+
+
+def _direction(x0, y0, x1, y1) -> tuple:
+    """ A function that returns the unit direction of an axis aligned run. """
+    return (x1 > x0) - (x1 < x0), (y1 > y0) - (y1 < y0)
+
+
+def _chainRings(segments: np.ndarray) -> list:
+    """ A function that chains the directed boundary runs of a single label into closed rings.
+
+    Where a vertex has two outgoing runs (diagonally touching pixels) the right turn is taken,
+    which keeps diagonally touching regions as separate, non self-intersecting rings.
+    """
+    outgoing = {}
+    for i, (x0, y0, _, _) in enumerate(segments.tolist()):
+        outgoing.setdefault((x0, y0), []).append(i)
+
+    segmentList = segments.tolist()
+    used = [False] * len(segmentList)
+    rings = []
+
+    for first in range(len(segmentList)):
+        if used[first]:
+            continue
+
+        ring = []
+        current = first
+        while True:
+            used[current] = True
+            x0, y0, x1, y1 = segmentList[current]
+            ring.append((x0, y0))
+
+            candidates = [i for i in outgoing[(x1, y1)] if not used[i] or i == first]
+            if len(candidates) > 1:
+                dx, dy = _direction(x0, y0, x1, y1)
+                for i in candidates:
+                    if _direction(*segmentList[i]) == (-dy, dx):
+                        candidates = [i]
+                        break
+
+            current = candidates[0]
+            if current == first:
+                break
+
+        rings.append(ring)
+
+    return rings
+
+
+def _signedArea(ring) -> float:
+    """ A function that returns the shoelace signed area of a ring of vertices. """
+    coords = np.asarray(ring, dtype=np.float64)
+    x, y = coords[:, 0], coords[:, 1]
+    return float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y)) / 2
+
+
+def _containsPoint(ring, point) -> bool:
+    """ A function that tests whether a point lies inside a ring with an even-odd ray cast. """
+    coords = np.asarray(ring, dtype=np.float64)
+    x, y = coords[:, 0], coords[:, 1]
+    nx, ny = np.roll(x, -1), np.roll(y, -1)
+    px, py = point
+
+    crosses = (y > py) != (ny > py)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xCross = x + (py - y) * (nx - x) / (ny - y)
+
+    return bool(np.count_nonzero(crosses & (px < xCross)) % 2)
+
+
+def _assemblePolygons(rings: list) -> list:
+    """ A function that groups the traced rings of a single label into polygons.
+
+    Returns a list of polygons, each a list of ring indices with the exterior first and its holes after.
+    Holes are assigned to the smallest exterior that contains the pixel just inside the hole.
+    """
+    exteriors, holes = [], []
+    for i, ring in enumerate(rings):
+        area = _signedArea(ring)
+        (exteriors if area > 0 else holes).append((abs(area), i))
+
+    exteriors.sort()
+    polygons = [[i] for _, i in exteriors]
+    if not holes:
+        return polygons
+
+    bounds = np.array([[*np.min(rings[i], axis=0), *np.max(rings[i], axis=0)] for _, i in exteriors])
+
+    for _, hole in holes:
+        # The pixel to the left of the first run lies inside the hole.
+        (x0, y0), (x1, y1) = rings[hole][0], rings[hole][1]
+        dx, dy = _direction(x0, y0, x1, y1)
+        px, py = x0 + 0.5 * dx + 0.5 * dy, y0 + 0.5 * dy - 0.5 * dx
+
+        candidates = np.nonzero((bounds[:, 0] < px) & (px < bounds[:, 2]) &
+                                (bounds[:, 1] < py) & (py < bounds[:, 3]))[0]
+        for candidate in candidates:
+            if _containsPoint(rings[polygons[candidate][0]], (px, py)):
+                polygons[candidate].append(hole)
+                break
+
+    return polygons
+
+
+def _nodeMask(grid: np.ndarray) -> np.ndarray:
+    """ A function that marks the pixel corners at which a shared boundary ends.
+
+    A corner is a node when three or more labels meet around it or when two labels meet in a
+    diagonal (checkerboard) arrangement. Returns a boolean (rows + 1, columns + 1) array.
+    """
+    tl, tr, bl, br = grid[:-1, :-1], grid[:-1, 1:], grid[1:, :-1], grid[1:, 1:]
+
+    distinct = (1 + (tr != tl) + ((bl != tl) & (bl != tr)) +
+                ((br != tl) & (br != tr) & (br != bl)))
+    diagonal = (distinct == 2) & (tl == br) & (tr == bl) & (tl != tr)
+
+    return (distinct >= 3) | diagonal
+
+
+def _douglasPeuckerMask(coords: np.ndarray, tolerance: float) -> np.ndarray:
+    """ A function that simplifies an open polyline with the Douglas-Peucker algorithm.
+
+    The endpoints are always kept. Distances are measured to each chord segment, and the
+    farthest vertex of a span is found with a single vectorised pass over that span.
+    Returns a boolean mask of the vertices to keep.
+    """
+    count = len(coords)
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+
+        start, end = coords[first], coords[last]
+        offset = coords[first + 1:last] - start
+        chord = end - start
+        lengthSq = chord[0] ** 2 + chord[1] ** 2
+
+        if lengthSq > 0:
+            t = np.clip((offset[:, 0] * chord[0] + offset[:, 1] * chord[1]) / lengthSq, 0, 1)
+            offset = offset - t[:, None] * chord
+        distance = np.hypot(offset[:, 0], offset[:, 1])
+
+        farthest = int(np.argmax(distance))
+        if distance[farthest] > tolerance:
+            split = first + 1 + farthest
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+
+    return keep
+
+
+def _visvalingamMask(coords: np.ndarray, tolerance: float) -> np.ndarray:
+    """ A function that simplifies an open polyline with the Visvalingam-Whyatt algorithm.
+
+    Vertices are eliminated in order of the area of the triangle they form with their neighbours
+    until every remaining triangle has an area of at least tolerance squared. The endpoints are
+    always kept. Returns a boolean mask of the vertices to keep.
+    """
+    import heapq
+
+    count = len(coords)
+    keep = np.ones(count, dtype=bool)
+    if count < 3:
+        return keep
+
+    def triangleArea(a, b, c):
+        """ A function that returns the area of the triangle formed by three vertices. """
+        return abs((coords[b, 0] - coords[a, 0]) * (coords[c, 1] - coords[a, 1]) -
+                   (coords[c, 0] - coords[a, 0]) * (coords[b, 1] - coords[a, 1])) / 2
+
+    previous = list(range(-1, count - 1))
+    following = list(range(1, count + 1))
+
+    ab = coords[1:-1] - coords[:-2]
+    ac = coords[2:] - coords[:-2]
+    areas = [0.0] + (np.abs(ab[:, 0] * ac[:, 1] - ac[:, 0] * ab[:, 1]) / 2).tolist() + [0.0]
+
+    heap = [(areas[i], i) for i in range(1, count - 1)]
+    heapq.heapify(heap)
+    threshold = tolerance ** 2
+
+    while heap:
+        area, i = heapq.heappop(heap)
+        if not keep[i] or area != areas[i]:
+            continue
+
+        if area >= threshold:
+            break
+
+        keep[i] = False
+        before, after = previous[i], following[i]
+        following[before], previous[after] = after, before
+
+        for j in (before, after):
+            if 0 < j < count - 1:
+                # Effective areas never decrease, so a vertex is not eliminated before its neighbours.
+                areas[j] = max(triangleArea(previous[j], j, following[j]), area)
+                heapq.heappush(heap, (areas[j], j))
+
+    return keep
+
+
+SIMPLIFIERS = {
+    "DP": _douglasPeuckerMask,
+    "VW": _visvalingamMask
+}
+
+
+def _deviation(coords: np.ndarray, keep: np.ndarray) -> float:
+    """ A function that returns the largest distance of any vertex from the simplified polyline. """
+    if np.all(keep):
+        return 0.0
+
+    kept = np.flatnonzero(keep)
+    segment = np.clip(np.searchsorted(kept, np.arange(len(coords)), side="right") - 1, 0, len(kept) - 2)
+    start, end = coords[kept[segment]], coords[kept[segment + 1]]
+
+    chord = end - start
+    lengthSq = np.einsum("ij,ij->i", chord, chord)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.clip(np.einsum("ij,ij->i", coords - start, chord) / lengthSq, 0, 1)
+    t = np.where(lengthSq == 0, 0, t)
+
+    offset = coords - (start + t[:, None] * chord)
+    return float(np.max(np.hypot(offset[:, 0], offset[:, 1])))
+
+
+def _simplifyArc(coords: np.ndarray, tolerance: float, method: str):
+    """ A function that simplifies an open or closed arc. Closed arcs are split at their farthest vertex.
+
+    Returns the simplified coordinates and the largest distance of a removed vertex from them.
+    """
+    simplifier = SIMPLIFIERS[method]
+
+    if len(coords) < 3:
+        return coords, 0.0
+
+    if len(coords) > 3 and np.array_equal(coords[0], coords[-1]):
+        farthest = int(np.argmax(np.hypot(coords[:, 0] - coords[0, 0], coords[:, 1] - coords[0, 1])))
+        keep = np.concatenate([simplifier(coords[:farthest + 1], tolerance),
+                               simplifier(coords[farthest:], tolerance)[1:]])
+    else:
+        keep = simplifier(coords, tolerance)
+
+    return coords[keep], _deviation(coords, keep)
+
+
+def _canonicalArc(arc: list, closed: bool):
+    """ A function that returns an arc in a direction independent form along with a reversal flag.
+
+    Both rings that share a boundary traverse it in opposite directions. Canonicalising the arc
+    makes both of them simplify the identical vertex sequence.
+    """
+    if closed:
+        start = arc.index(min(arc))
+        arc = arc[start:] + arc[:start]
+        forward = arc[1] <= arc[-1]
+        arc = (arc if forward else [arc[0]] + arc[:0:-1]) + [arc[0]]
+        return tuple(arc), (not forward)
+
+    forward = arc[0] < arc[-1] or (arc[0] == arc[-1] and arc[1] <= arc[-2])
+    return (tuple(arc), False) if forward else (tuple(arc[::-1]), True)
+
+
+def _splitArcs(ring: list, flags: list) -> list:
+    """ A function that splits a ring into arcs between the vertices flagged as nodes. """
+    if not any(flags):
+        return [(ring, True)]
+
+    start = flags.index(True)
+    ring = ring[start:] + ring[:start]
+    flags = flags[start:] + flags[:start]
+
+    arcs, current = [], [ring[0]]
+    for vertex, isNode in zip(ring[1:], flags[1:]):
+        current.append(vertex)
+        if isNode:
+            arcs.append((current, False))
+            current = [vertex]
+
+    current.append(ring[0])
+    arcs.append((current, False))
+    return arcs
+
+
+def _junctionFlags(rings: list) -> list:
+    """ A function that flags the vertices at which a boundary stops being shared by the same rings.
+
+    A vertex is a junction when its neighbours across every ring that visits it number more than two,
+    which is where shared boundaries between adjacent polygons start and end.
+    """
+    neighbours = {}
+    for ring in rings:
+        for i, vertex in enumerate(ring):
+            neighbours.setdefault(vertex, set()).update((ring[i - 1], ring[(i + 1) % len(ring)]))
+
+    return [[len(neighbours[vertex]) > 2 for vertex in ring] for ring in rings]
+
+
+def _simplifySharedRings(rings: list, flags: list, tolerance: float, method: str = "DP"):
+    """ A function that simplifies a list of rings without opening gaps between neighbouring rings.
+
+    Every ring is split into arcs at its flagged node vertices and each distinct arc is simplified exactly
+    once, so the rings on either side of a boundary reuse the same simplified arc. Arcs of rings that would
+    collapse below three vertices are left unsimplified for every ring that shares them.
+    Rings are lists of vertex tuples without the closing vertex. Returns the simplified rings and the
+    largest distance of a removed vertex from the simplified arcs.
+    """
+    ringArcs = [[_canonicalArc(arc, closed) for arc, closed in _splitArcs(ring, ringFlags)]
+                for ring, ringFlags in zip(rings, flags)]
+
+    simplified, locked = {}, set()
+
+    def rebuild(arcs):
+        """ A function that rebuilds a ring from its canonical arcs. """
+        ring = []
+        for key, reverse in arcs:
+            if key in locked:
+                coords = key
+            else:
+                if key not in simplified:
+                    coords, deviation = _simplifyArc(np.asarray(key, dtype=np.float64), tolerance, method)
+                    simplified[key] = (tuple(map(tuple, coords.tolist())), deviation)
+                coords = simplified[key][0]
+
+            coords = coords[::-1] if reverse else coords
+            ring.extend(coords[:-1])
+        return ring
+
+    while True:
+        result, collapsed = [], set()
+        for arcs in ringArcs:
+            ring = rebuild(arcs)
+            if len(set(ring)) < 3 or _signedArea(ring) == 0:
+                collapsed.update(key for key, _ in arcs if key not in locked)
+            result.append(ring)
+
+        if not collapsed:
+            deviations = [deviation for key, (_, deviation) in simplified.items() if key not in locked]
+            return result, max(deviations, default=0.0)
+
+        locked.update(collapsed)
+
+
+def _toGeographic(ring: list, transform: Transform, exterior: bool) -> list:
+    """ A function that transforms a pixel-corner ring into a closed, RFC 7946 oriented coordinate ring. """
+    a, b, c, d, e, f = transform[:6]
+    coords = np.asarray(ring, dtype=np.float64)
+    x = a * coords[:, 0] + b * coords[:, 1] + c
+    y = d * coords[:, 0] + e * coords[:, 1] + f
+
+    geoRing = np.stack([x, y], axis=1)
+    # Exteriors are counterclockwise and holes clockwise.
+    if (_signedArea(geoRing) > 0) != exterior:
+        geoRing = geoRing[::-1]
+
+    geoRing = np.concatenate([geoRing, geoRing[:1]])
+    return geoRing.tolist()
+
+
+def polygonize(renderArray,
+               transform: Transform,
+               nodata=None,
+               tolerance: float = None,
+               mergeLayers: bool = True,
+               method: str = "DP") -> dict:
+    """ *A function that polygonizes a quantized render raster into a GeoJSON FeatureCollection.*
+
+    The function traces the boundaries of every distinct pixel value of a render raster at its native
+    resolution and returns a GeoJSON FeatureCollection dictionary in which each feature carries the pixel
+    value as its layerID. Pixels that are masked, non-finite or equal to nodata are left out.\n
+    If mergeLayers is set, each layerID is a single MultiPolygon feature, matching the *-NDVIRender.geojson
+    exports. Otherwise each connected region is its own Polygon feature, matching the *-SZRender.geojson
+    exports. Regions that only touch diagonally are separate polygons.\n
+    If tolerance is set, rings are simplified with the Douglas-Peucker ("DP") or Visvalingam-Whyatt ("VW")
+    algorithm using a tolerance in pixels. The simplification is topology-preserving: boundaries shared by
+    two layers are simplified once and stay coincident, so no gaps or overlaps are introduced between layers.
+
+    Args:
+        renderArray:    A 2D integer array (or masked array) of render layer values.
+        transform:      The affine transform of the raster as (a, b, c, d, e, f), in the same order as
+                        a rasterio dataset transform.
+        nodata:         A pixel value to treat as nodata. Defaults to None.
+        tolerance:      The simplification tolerance in pixels. Defaults to None (no simplification).
+        mergeLayers:    A bool to merge all the polygons of a layer into one feature. Defaults to True.
+        method:         The simplification algorithm, "DP" or "VW". Defaults to "DP".
+    Returns:
+        dict:       A dictionary of a GeoJSON FeatureCollection.
+    Raises:
+        TypeError:      Occurs if the parameter type checks fail.
+        ValueError:     Occurs if the renderArray is not 2D, the tolerance is negative or the method is invalid.
+        GeometryError:  Occurs if the boundary tracing or polygon assembly fails.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Polygonizing an NDVI render raster:*\n
+    ``>> ndviRender = polygonize(renderArray=render, transform=dataset.transform)``
+
+    *Polygonizing StressZones with a one pixel simplification tolerance:*\n
+    ``>> szRender = polygonize(renderArray=sz, transform=dataset.transform, tolerance=1, mergeLayers=False)``
+    """
+    if not isinstance(transform, (typing.Sequence, np.ndarray)) or len(transform) < 6:
+        raise TypeError("Polygonization Failed @ type check: transform must be a sequence of 6 affine coefficients")
+
+    if tolerance is not None:
+        if not isinstance(tolerance, (int, float)):
+            raise TypeError("Polygonization Failed @ type check: tolerance must be an int or float")
+
+        if tolerance < 0:
+            raise ValueError("Polygonization Failed @ tolerance check: tolerance must not be negative")
+
+    if method not in SIMPLIFIERS:
+        raise ValueError(f"Polygonization Failed @ method check: {method} is not a supported simplification method")
+
+    try:
+        grid = _labelGrid(renderArray, nodata)
+
+    except ValueError as e:
+        raise ValueError(f"Polygonization Failed @ array check: {e}")
+    except Exception as e:
+        raise TypeError(f"Polygonization Failed @ array check: {e}")
+
+    try:
+        rings = {label: _chainRings(segments) for label, segments in _traceEdges(grid).items()}
+        polygons = {label: _assemblePolygons(labelRings) for label, labelRings in rings.items()}
+
+        if tolerance:
+            nodes = _nodeMask(grid)
+            labels = [label for label in rings for _ in rings[label]]
+            flatRings = [ring for label in rings for ring in rings[label]]
+            flags = [[bool(nodes[y, x]) for x, y in ring] for ring in flatRings]
+
+            flatRings, _ = _simplifySharedRings(flatRings, flags, tolerance, method)
+            rings = {label: [] for label in rings}
+            for label, ring in zip(labels, flatRings):
+                rings[label].append(ring)
+
+    except Exception as e:
+        raise apexception.GeometryError(f"Polygonization Failed @ Boundary Tracing: {e}")
+
+    try:
+        features = []
+        for label in sorted(rings):
+            layer = [[_toGeographic(rings[label][ring], transform, exterior=(i == 0)) for i, ring in enumerate(polygon)]
+                     for polygon in polygons[label]]
+
+            if mergeLayers:
+                geometries = [{"type": "MultiPolygon", "coordinates": layer}]
+            else:
+                geometries = [{"type": "Polygon", "coordinates": polygon} for polygon in layer]
+
+            for geometry in geometries:
+                features.append({
+                    "type": "Feature",
+                    "id": str(len(features)),
+                    "geometry": geometry,
+                    "properties": {"layerID": label}
+                })
+
+        return {"type": "FeatureCollection", "features": features}
+
+    except Exception as e:
+        raise apexception.GeometryError(f"Polygonization Failed @ Polygon Assembly: {e}")
+
+
+def polygonizeRaster(filename: pathString,
+                     band: int = 1,
+                     tolerance: float = None,
+                     mergeLayers: bool = True,
+                     method: str = "DP") -> dict:
+    """ *A function that polygonizes a band of a render GeoTIFF into a GeoJSON FeatureCollection.*
+
+    The band is read with its nodata mask and its affine transform, and then polygonized with
+    polygonize(). See polygonize() for details on the layers and the simplification.
+
+    Args:
+        filename:       A pathlike string to a GeoTIFF that contains a render layer.
+        band:           The 1-based index of the band to polygonize. Defaults to 1.
+        tolerance:      The simplification tolerance in pixels. Defaults to None (no simplification).
+        mergeLayers:    A bool to merge all the polygons of a layer into one feature. Defaults to True.
+        method:         The simplification algorithm, "DP" or "VW". Defaults to "DP".
+    Returns:
+        dict:       A dictionary of a GeoJSON FeatureCollection.
+    Raises:
+        FileNotFoundError:  Occurs if the GeoTIFF cannot be found.
+        RasterError:    Occurs if reading the raster fails.
+        GeometryError:  Occurs if the polygonization fails.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Polygonizing an exported render GeoTIFF:*\n
+    ``>> ndviRender = polygonizeRaster(filename="APX000-01-L2A-NDVIR-2020-08-23.tif")``
+    """
+    import os
+    import rasterio as rio
+
+    if not os.path.isfile(filename):
+        raise FileNotFoundError(f"Raster Polygonization Failed @ isfile check: {filename} could not be found")
+
+    try:
+        with rio.open(filename) as dataset:
+            renderArray = dataset.read(band, masked=True)
+            transform = tuple(dataset.transform)[:6]
+
+    except Exception as e:
+        raise apexception.RasterError(f"Raster Polygonization Failed @ Raster Read: {e}")
+
+    return polygonize(renderArray=renderArray, transform=transform, tolerance=tolerance,
+                      mergeLayers=mergeLayers, method=method)
+
+
+def _geometryRings(geometry: dict) -> list:
+    """ A function that returns the coordinate rings or lines of a geometry as lists of lists of positions. """
+    geoType = geometry["type"]
+    coordinates = geometry["coordinates"]
+
+    if geoType in ("Polygon", "MultiLineString"):
+        return [coordinates]
+    if geoType == "MultiPolygon":
+        return coordinates
+    if geoType == "LineString":
+        return [[coordinates]]
+
+    return []
+
+
+def simplifyGeoJSON(geoDictionary: dict,
+                    tolerance: float = None,
+                    precision: int = None,
+                    method: str = "DP",
+                    topology: bool = True):
+    """ *A function that simplifies and quantizes the coordinates of a GeoJSON FeatureCollection.*
+
+    Coordinates are first rounded to the given number of decimal places and consecutive duplicates are
+    dropped. Polygon rings and lines are then simplified with the Douglas-Peucker ("DP") or
+    Visvalingam-Whyatt ("VW") algorithm with a tolerance in coordinate units. Point geometries are only
+    quantized.\n
+    If topology is set, boundaries shared by neighbouring polygons (like adjacent render layers) are detected
+    from their common vertices and simplified once, so they stay coincident after simplification.
+    Rings that would collapse are left unsimplified.\n
+    Returns a new FeatureCollection dictionary along with a report of the vertex counts and the error bound,
+    i.e the largest distance any original vertex can be from the output geometry in coordinate units.
+    For EPSG:4326 coordinates a precision of 6 decimal places is about 0.1 m.
+
+    Args:
+        geoDictionary:  A dictionary of a GeoJSON FeatureCollection.
+        tolerance:      The simplification tolerance in coordinate units. Defaults to None (no simplification).
+        precision:      The number of decimal places to round coordinates to. Defaults to None (no rounding).
+        method:         The simplification algorithm, "DP" or "VW". Defaults to "DP".
+        topology:       A bool to keep boundaries shared by polygons coincident. Defaults to True.
+    Returns:
+        dict:       A dictionary of the simplified GeoJSON FeatureCollection.
+        dict:       A dictionary with the inputVertices, outputVertices, simplificationError,
+                    quantizationError and errorBound of the simplification.
+    Raises:
+        TypeError:      Occurs if the parameter type checks fail.
+        ValueError:     Occurs if the tolerance or precision is negative or the method is invalid.
+        GeometryError:  Occurs if the simplification runtime fails.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Simplifying an exported render layer to 1 metre with 6 decimal places:*\n
+    ``>> renderData = jsonio.geojsonRead("karayambedu2_S-TestExportAcq-NDVIRender.geojson")``\n
+    ``>> simplified, report = simplifyGeoJSON(geoDictionary=renderData, tolerance=1e-5, precision=6)``
+
+    *Simplifying a GeoDataFrame of per-date zonal statistics:*\n
+    ``>> simplified, report = simplifyGeoJSON(geoDictionary=gdf.__geo_interface__, tolerance=1e-5, precision=6)``\n
+    ``>> gdf = gpd.GeoDataFrame.from_features(simplified)``
+    """
+    import copy
+
+    if not isinstance(geoDictionary, dict):
+        raise TypeError("GeoJSON Simplification Failed @ type check: geoDictionary must be a dictionary")
+
+    if tolerance is not None and (not isinstance(tolerance, (int, float)) or tolerance < 0):
+        raise ValueError("GeoJSON Simplification Failed @ tolerance check: tolerance must be a non-negative number")
+
+    if precision is not None and (not isinstance(precision, int) or precision < 0):
+        raise ValueError("GeoJSON Simplification Failed @ precision check: precision must be a non-negative int")
+
+    if method not in SIMPLIFIERS:
+        raise ValueError(f"GeoJSON Simplification Failed @ method check: {method} is not a supported method")
+
+    try:
+        geoDictionary = copy.deepcopy(geoDictionary)
+        geometries = [feature["geometry"] for feature in geoDictionary["features"] if feature.get("geometry")]
+
+        def quantize(coords):
+            """ A function that rounds positions and drops consecutive duplicates. """
+            coords = np.asarray(coords, dtype=np.float64)[:, :2]
+            if precision is not None:
+                coords = np.round(coords, precision)
+            if len(coords) > 1:
+                coords = coords[np.concatenate([[True], np.any(coords[1:] != coords[:-1], axis=1)])]
+            return [tuple(position) for position in coords.tolist()]
+
+        rings, lines, targets = [], [], []
+        inputVertices = 0
+        for geometry in geometries:
+            if geometry["type"] == "Point":
+                inputVertices += 1
+                geometry["coordinates"] = list(quantize([geometry["coordinates"]])[0])
+                continue
+
+            if geometry["type"] == "MultiPoint":
+                inputVertices += len(geometry["coordinates"])
+                geometry["coordinates"] = [list(position) for position in quantize(geometry["coordinates"])]
+                continue
+
+            isPolygon = geometry["type"] in ("Polygon", "MultiPolygon")
+            for part in _geometryRings(geometry):
+                for i, coords in enumerate(part):
+                    inputVertices += len(coords)
+                    coords = quantize(coords)
+                    if isPolygon:
+                        if len(coords) > 1 and coords[0] == coords[-1]:
+                            coords = coords[:-1]
+                        targets.append((part, i, True, len(rings)))
+                        rings.append(coords)
+                    else:
+                        targets.append((part, i, False, len(lines)))
+                        lines.append(coords)
+
+    except Exception as e:
+        raise apexception.GeometryError(f"GeoJSON Simplification Failed @ Quantization: {e}")
+
+    try:
+        simplificationError = 0.0
+        if tolerance:
+            valid = [i for i, ring in enumerate(rings) if len(ring) >= 3]
+            validRings = [rings[i] for i in valid]
+
+            if topology:
+                flags = _junctionFlags(validRings)
+            else:
+                # Pinning the first vertex keeps each ring independent of its neighbours.
+                flags = [[True] + [False] * (len(ring) - 1) for ring in validRings]
+
+            validRings, simplificationError = _simplifySharedRings(validRings, flags, tolerance, method)
+            for i, ring in zip(valid, validRings):
+                rings[i] = ring
+
+            for i, line in enumerate(lines):
+                if len(line) >= 3:
+                    coords, deviation = _simplifyArc(np.asarray(line, dtype=np.float64), tolerance, method)
+                    lines[i] = [tuple(position) for position in coords.tolist()]
+                    simplificationError = max(simplificationError, deviation)
+
+        outputVertices = 0
+        for part, i, isPolygon, index in targets:
+            coords = [list(position) for position in (rings[index] if isPolygon else lines[index])]
+            if isPolygon and coords:
+                coords.append(list(coords[0]))
+            part[i] = coords
+            outputVertices += len(coords)
+
+        outputVertices += sum(1 if geometry["type"] == "Point" else len(geometry["coordinates"])
+                              for geometry in geometries if geometry["type"] in ("Point", "MultiPoint"))
+
+    except Exception as e:
+        raise apexception.GeometryError(f"GeoJSON Simplification Failed @ Simplification: {e}")
+
+    quantizationError = 0.0 if precision is None else float(np.hypot(0.5, 0.5) * 10.0 ** -precision)
+    report = {
+        "inputVertices": inputVertices,
+        "outputVertices": outputVertices,
+        "simplificationError": simplificationError,
+        "quantizationError": quantizationError,
+        "errorBound": simplificationError + quantizationError
+    }
+
+    return geoDictionary, report
+
+
+def writeRenderVector(renderVector: dict,
+                      filename: pathString,
+                      tolerance: float = None,
+                      precision: int = None,
+                      method: str = "DP"):
+    """ *A function that writes a polygonized render FeatureCollection as a compact GeoJSON file.*
+
+    If tolerance or precision are set, the FeatureCollection is simplified and quantized with
+    simplifyGeoJSON() in topology mode before it is written.
+
+    Args:
+        renderVector:   A dictionary of a GeoJSON FeatureCollection returned by polygonize().
+        filename:       A pathlike string to the GeoJSON file to be written.
+        tolerance:      The simplification tolerance in coordinate units. Defaults to None (no simplification).
+        precision:      The number of decimal places to round coordinates to. Defaults to None (no rounding).
+        method:         The simplification algorithm, "DP" or "VW". Defaults to "DP".
+    Returns:
+        dict:       The simplification report from simplifyGeoJSON(), or None if nothing was simplified.
+    Raises:
+        TypeError:      Occurs if the renderVector is not a dictionary.
+        GeometryError:  Occurs if the simplification fails.
+        GeoJSONError:   Occurs if GeoJSON writing fails.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Writing an NDVI render layer:*\n
+    ``>> writeRenderVector(renderVector=ndviRender, filename="karayambedu2_S-NDVIRender.geojson")``
+
+    *Writing an NDVI render layer quantized to 6 decimal places:*\n
+    ``>> report = writeRenderVector(renderVector=ndviRender, filename="ndviRender.geojson", precision=6)``
+    """
+    report = None
+    if tolerance is not None or precision is not None:
+        renderVector, report = simplifyGeoJSON(geoDictionary=renderVector, tolerance=tolerance,
+                                               precision=precision, method=method, topology=True)
+
+    jsonio.geojsonWrite(dictData=renderVector, filename=filename)
+    return report
@@ -22,6 +22,25 @@ DateRange = typing.Tuple[Date, Date]
 
 CONFIG = Config()
 
+METADATA_MAP = {
+    "S2": {
+        "L2A": {
+            "idKey": "PRODUCT_ID",
+            "idValue": "S2X_MSIL2A"
+        },
+        "L1C": {
+            "idKey": "PRODUCT_ID",
+            "idValue": "S2X_MSIL1C"
+        }
+    },
+    "L8": {
+        "L8SR": {
+            "idKey": "LANDSAT_ID",
+            "idValue": "LC08_L1TP"
+        }
+    }
+}
+
 
 def verifyImage(image: ee.Image,
                 mode: str) -> bool:
@@ -371,24 +390,7 @@ def fixMetadata(image: ee.Image,
     *Fixing a Sentinel-2 L2A Image, setting a pixelType and a footprint:*\n
     ``>> newImage = fixMetadata(image=image, sensor="L2A", aqDate=aqDate, precision="float", footprint=aoi)``
     """
-    mapper = {
-        "S2": {
-            "L2A": {
-                "idKey": "PRODUCT_ID",
-                "idValue": "S2X_MSIL2A"
-            },
-            "L1C": {
-                "idKey": "PRODUCT_ID",
-                "idValue": "S2X_MSIL1C"
-            }
-        },
-        "L8": {
-            "L8SR": {
-                "idKey": "LANDSAT_ID",
-                "idValue": "LC08_L1TP"
-            }
-        }
-    }
+    mapper = METADATA_MAP
     if not isinstance(image, ee.Image):
         raise TypeError("Image Metadata Rebuild Failed @ type check: image must be an ee.Image")
 
@@ -509,7 +511,9 @@ def generateMosaicCollection(imageCol: ee.ImageCollection,
 
     The function generates an ImageCollection which contains a collection of
     mosaic Images for each date in a datelist containing ISO dateStrings which
-    is generated from all the unique acquisition dates in the ImageCollection.
+    is generated from all the unique acquisition dates in the ImageCollection.\n
+    The datelist is the only value fetched from the server. The mosaics are generated and their metadata
+    rebuilt by mapping over the datelist on the server, so no requests are made per date.
 
     Args:
         imageCol:       The ImageCollection for which to generate mosaic Images.
@@ -552,16 +556,22 @@ def generateMosaicCollection(imageCol: ee.ImageCollection,
 
     try:
         sat = CONFIG.getSatfromSensor(sensor=sensor)
+        checkField = METADATA_MAP[sat][sensor]
         dateList = temporal.generateDateList(imageCol=imageCol)
 
-        mosaicList = []
-        for date in dateList:
-            date = Date(date)
-            mosaicImage = generateMosaicImage(imageCol=imageCol, date=date, sensor=sensor)
-            mosaicList.append(mosaicImage)
-
-        count = len(mosaicList)
-        mosaicCol = ee.ImageCollection(mosaicList).set({"product_tags": mapper[sat][sensor]["tags"]})
+        # noinspection PyUnresolvedReferences
+        def algoMosaic(dtString):
+            """ A mapping algorithm that mosaics the Images of a date and rebuilds the mosaic metadata. """
+            date = ee.Date(dtString)
+            mosaicImage = imageCol.filterDate(date, date.advance(1, "day")).mosaic()
+            return mosaicImage.set({
+                "system:time_start": date.millis(),
+                checkField["idKey"]: checkField["idValue"]
+            })
+
+        count = len(dateList)
+        mosaicCol = ee.ImageCollection(ee.List(dateList).map(algoMosaic))
+        mosaicCol = mosaicCol.set({"product_tags": mapper[sat][sensor]["tags"]})
 
         return mosaicCol, dateList, count
 
@@ -0,0 +1,359 @@
+"""
+Module for synchronous Earth Engine pixel downloads.
+
+Library of top-level functions that fetch the pixels of an Image directly from the Earth Engine
+download endpoint instead of the batch export system. The pixel grid of a region is split into
+tiles under the request size limit, the tiles are fetched in parallel on a bounded thread pool
+and stitched into a single NumPy array.
+Contains the class *LocalTileServer*, a local HTTP stand-in for the download endpoint that serves
+synthetic tiles for testing and benchmarking.
+
+************************************************************************
+Copyrights (c) 2020 ANTPOD Designs Private Limited. All Rights Reserved.
+************************************************************************
+"""
+import io
+import math
+import time
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+
+import numpy as np
+
+import apgis.apexception as apexception
+
+METRES_PER_DEGREE = 111319.49079327357
+MAX_REQUEST_BYTES = 32 * 1024 * 1024
+MAX_GRID_DIMENSION = 10000
+BYTES_PER_PIXEL = 4
+
+
+def computeGrid(bounds: list, scale: float) -> dict:
+    """ *A function that computes the EPSG:4326 pixel grid of a bounding box at a scale in metres.*
+
+    The grid is anchored on the top left corner of the bounding box and covers the whole box.
+    Pixel sizes are converted to degrees at the equator, as Earth Engine does for EPSG:4326.
+
+    Args:
+        bounds:     A bounding box as [minLongitude, minLatitude, maxLongitude, maxLatitude].
+        scale:      The pixel size in metres.
+    Returns:
+        dict:       A dictionary with the grid transform [xScale, 0, xOrigin, 0, -yScale, yOrigin],
+                    width and height.
+    Raises:
+        ValueError:     Occurs if the bounds or scale are invalid.
+    """
+    if len(bounds) != 4 or bounds[2] <= bounds[0] or bounds[3] <= bounds[1]:
+        raise ValueError("Grid Computation Failed @ bounds check: bounds must be [minX, minY, maxX, maxY]")
+
+    if scale <= 0:
+        raise ValueError("Grid Computation Failed @ scale check: scale must be positive")
+
+    size = scale / METRES_PER_DEGREE
+    width = max(int(math.ceil((bounds[2] - bounds[0]) / size)), 1)
+    height = max(int(math.ceil((bounds[3] - bounds[1]) / size)), 1)
+
+    return {"transform": [size, 0, bounds[0], 0, -size, bounds[3]], "width": width, "height": height}
+
+
+def tileGrid(grid: dict,
+             bandCount: int,
+             maxBytes: int = MAX_REQUEST_BYTES,
+             maxDimension: int = MAX_GRID_DIMENSION) -> list:
+    """ *A function that splits a pixel grid into square tiles under the download request limits.*
+
+    Args:
+        grid:           A grid dictionary returned by computeGrid().
+        bandCount:      The number of bands to be downloaded.
+        maxBytes:       The maximum size of a tile in bytes. Defaults to 32 MiB.
+        maxDimension:   The maximum width or height of a tile in pixels. Defaults to 10000.
+    Returns:
+        list:       A list of tile dictionaries with the row and col offsets in the grid, the width, the height
+                    and the transform of the tile.
+    """
+    # A margin is left for the NPY header and structure padding.
+    side = int(math.sqrt(0.9 * maxBytes / (bandCount * BYTES_PER_PIXEL)))
+    side = max(min(side, maxDimension), 1)
+
+    xScale, _, xOrigin, _, yScale, yOrigin = grid["transform"]
+
+    tiles = []
+    for row in range(0, grid["height"], side):
+        for col in range(0, grid["width"], side):
+            tiles.append({
+                "row": row,
+                "col": col,
+                "width": min(side, grid["width"] - col),
+                "height": min(side, grid["height"] - row),
+                "transform": [xScale, 0, xOrigin + col * xScale, 0, yScale, yOrigin + row * yScale]
+            })
+
+    return tiles
+
+
+def eeDownloadURL(image, bands: list, tile: dict, crs: str) -> str:
+    """ *A function that requests an Earth Engine download URL for a tile of an Image in NPY format.* """
+    return image.getDownloadURL({
+        "bands": bands,
+        "crs": crs,
+        "crs_transform": tile["transform"],
+        "dimensions": [tile["width"], tile["height"]],
+        "format": "NPY"
+    })
+
+
+def fetchTile(url: str, bands: list, timeout: float = 60, retries: int = 3) -> np.ndarray:
+    """ *A function that fetches a tile in NPY format and returns it as a (bands, height, width) float array.*
+
+    Requests that fail with a server error or a rate limit are retried with an exponential delay.
+
+    Args:
+        url:        The download URL of the tile.
+        bands:      The band names, which are the field names of the structured NPY array.
+        timeout:    The request timeout in seconds. Defaults to 60.
+        retries:    The number of retries. Defaults to 3.
+    Returns:
+        np.ndarray:     A float32 array of the tile.
+    Raises:
+        EERuntimeError:     Occurs if the tile cannot be fetched or parsed.
+    """
+    for attempt in range(retries + 1):
+        try:
+            with urllib.request.urlopen(url, timeout=timeout) as response:
+                content = response.read()
+            break
+
+        except urllib.error.HTTPError as e:
+            if (e.code != 429 and e.code < 500) or attempt == retries:
+                raise apexception.EERuntimeError(f"Tile Fetch Failed @ HTTP Request: {e.code} {e.reason}")
+        except Exception as e:
+            if attempt == retries:
+                raise apexception.EERuntimeError(f"Tile Fetch Failed @ HTTP Request: {e}")
+
+        time.sleep(0.5 * 2 ** attempt)
+
+    try:
+        data = np.load(io.BytesIO(content), allow_pickle=False)
+        return np.stack([data[band].astype(np.float32) for band in bands])
+
+    except Exception as e:
+        raise apexception.EERuntimeError(f"Tile Fetch Failed @ NPY Parsing: {e}")
+
+
+def downloadImage(image,
+                  bounds: list,
+                  bands: list,
+                  scale: float = 10,
+                  crs: str = "EPSG:4326",
+                  maxWorkers: int = 8,
+                  maxBytes: int = MAX_REQUEST_BYTES,
+                  urlFunction=None,
+                  retries: int = 3,
+                  timeout: float = 60):
+    """ *A function that downloads the pixels of an Image over a bounding box into a NumPy array.*
+
+    The pixel grid of the bounding box is split into tiles under the request size limit. The tiles are
+    fetched in parallel on a thread pool of at most maxWorkers threads and stitched into a single array.\n
+    The image must hold bands of a single data type, like a float image from a multi-band export.
+
+    Args:
+        image:          The ee.Image to download.
+        bounds:         A bounding box as [minLongitude, minLatitude, maxLongitude, maxLatitude].
+        bands:          The names of the bands to download.
+        scale:          The pixel size in metres. Defaults to 10.
+        crs:            The coordinate reference system. Only 'EPSG:4326' is supported. Defaults to 'EPSG:4326'.
+        maxWorkers:     The maximum number of concurrent tile requests. Defaults to 8.
+        maxBytes:       The maximum size of a tile request in bytes. Defaults to 32 MiB.
+        urlFunction:    A function (image, bands, tile, crs) that returns the download URL of a tile.
+                        Defaults to eeDownloadURL(). LocalTileServer.url can be passed for testing.
+        retries:        The number of retries of a failed tile request. Defaults to 3.
+        timeout:        The tile request timeout in seconds. Defaults to 60.
+    Returns:
+        np.ndarray:     A float32 array of shape (bands, height, width).
+        list:           The affine transform of the array as [a, b, c, d, e, f].
+    Raises:
+        ValueError:     Occurs if the parameter checks fail.
+        NotImplementedError:    Occurs if the crs is not EPSG:4326.
+        EERuntimeError:     Occurs if a tile cannot be fetched.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Downloading the NDVI of a field:*\n
+    ``>> array, transform = downloadImage(image=ndviImage, bounds=field.ROIBox, bands=["NDVI"])``
+    """
+    if crs != "EPSG:4326":
+        raise NotImplementedError("Image Download Failed @ crs check: only EPSG:4326 grids are supported")
+
+    if not bands:
+        raise ValueError("Image Download Failed @ bands check: at least one band is required")
+
+    if not isinstance(maxWorkers, int) or maxWorkers < 1:
+        raise ValueError("Image Download Failed @ maxWorkers check: maxWorkers must be a positive int")
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    grid = computeGrid(bounds=bounds, scale=scale)
+    tiles = tileGrid(grid=grid, bandCount=len(bands), maxBytes=maxBytes)
+    urlFunction = urlFunction or eeDownloadURL
+
+    def fetch(tile):
+        """ A function that fetches a single tile. """
+        try:
+            url = urlFunction(image, bands, tile, crs)
+
+        except Exception as e:
+            raise apexception.EERuntimeError(f"Tile Fetch Failed @ URL Generation: {e}")
+
+        return tile, fetchTile(url=url, bands=bands, timeout=timeout, retries=retries)
+
+    array = np.empty((len(bands), grid["height"], grid["width"]), dtype=np.float32)
+    with ThreadPoolExecutor(max_workers=min(maxWorkers, len(tiles))) as pool:
+        for tile, data in pool.map(fetch, tiles):
+            rows = slice(tile["row"], tile["row"] + tile["height"])
+            cols = slice(tile["col"], tile["col"] + tile["width"])
+            array[:, rows, cols] = data
+
+    return array, grid["transform"]
+
+
+class LocalTileServer:
+    """
+    *Class for a local HTTP stand-in of the Earth Engine download endpoint.*
+
+    **Class Attributes:**\n
+    - ``latency:``      The delay in seconds before each response.
+    - ``failureRate:``  The probability that a request fails with a 503 error.
+    - ``maxBytes:``     The tile size in bytes beyond which requests are rejected with a 400 error.
+    - ``requests:``     The number of tile requests served.
+    - ``peakConcurrency:``  The highest number of requests that were served at once.
+
+    Serves synthetic tiles in the NPY format of the download endpoint. The value of a pixel is given by
+    LocalTileServer.synthetic() from its centre coordinates and band index, so stitched downloads can be
+    compared with the expected array. Use it as a context manager and pass its url method as the
+    urlFunction of downloadImage() or Export.Image.toDisk().
+
+    Examples:
+        Some example uses of this class are:\n
+    *Downloading from the stand-in:*\n
+    ``>> with LocalTileServer(latency=0.1) as server:``\n
+    ``>>     array, transform = downloadImage(image=None, bounds=box, bands=["NDVI"], urlFunction=server.url)``
+    """
+
+    def __init__(self, latency: float = 0.0, failureRate: float = 0.0, maxBytes: int = MAX_REQUEST_BYTES,
+                 seed: int = None):
+        """ **Constructor Method**\n
+        Yields a ``LocalTileServer`` object.
+
+        Args:
+            latency:        The delay in seconds before each response. Defaults to 0.
+            failureRate:    The probability that a request fails with a 503 error. Defaults to 0.
+            maxBytes:       The tile size in bytes beyond which requests are rejected. Defaults to 32 MiB.
+            seed:           A seed for the random failures. Defaults to None.
+        """
+        import random
+
+        self.latency = latency
+        self.failureRate = failureRate
+        self.maxBytes = maxBytes
+        self.requests = 0
+        self.peakConcurrency = 0
+
+        self.__random__ = random.Random(seed)
+        self.__active__ = 0
+        self.__lock__ = threading.Lock()
+        self.__server__ = None
+        self.__thread__ = None
+
+    @staticmethod
+    def synthetic(lons: np.ndarray, lats: np.ndarray, bandIndex: int) -> np.ndarray:
+        """ A staticmethod that returns the synthetic pixel values for pixel centre coordinates and a band. """
+        return (np.sin(np.radians(lons) * 5000) + np.cos(np.radians(lats) * 5000) + bandIndex).astype(np.float32)
+
+    def __tile__(self, query: dict) -> bytes:
+        """ A method that builds the NPY content of a tile request. """
+        bands = query["bands"].split(",")
+        width, height = int(query["width"]), int(query["height"])
+        xScale, _, xOrigin, _, yScale, yOrigin = [float(value) for value in query["transform"].split(",")]
+
+        lons = xOrigin + (np.arange(width) + 0.5) * xScale
+        lats = yOrigin + (np.arange(height) + 0.5) * yScale
+        lons, lats = np.meshgrid(lons, lats)
+
+        data = np.zeros((height, width), dtype=[(band, np.float32) for band in bands])
+        for i, band in enumerate(bands):
+            data[band] = self.synthetic(lons, lats, i)
+
+        buffer = io.BytesIO()
+        np.save(buffer, data, allow_pickle=False)
+        return buffer.getvalue()
+
+    def start(self) -> None:
+        """ A method that starts the server on a free local port in a background thread. """
+        import http.server
+
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            """ A request handler that serves synthetic tiles. """
+
+            def do_GET(self):
+                with server.__lock__:
+                    server.requests += 1
+                    server.__active__ += 1
+                    server.peakConcurrency = max(server.peakConcurrency, server.__active__)
+                    fail = server.__random__.random() < server.failureRate
+
+                try:
+                    time.sleep(server.latency)
+                    query = dict(urllib.parse.parse_qsl(urllib.parse.urlparse(self.path).query))
+                    size = int(query["width"]) * int(query["height"]) * len(query["bands"].split(",")) * 4
+
+                    if fail:
+                        self.send_error(503, "Service Unavailable")
+                    elif size > server.maxBytes:
+                        self.send_error(400, f"Total request size ({size} bytes) must be less than or "
+                                             f"equal to {server.maxBytes} bytes.")
+                    else:
+                        content = server.__tile__(query)
+                        self.send_response(200)
+                        self.send_header("Content-Type", "application/octet-stream")
+                        self.send_header("Content-Length", str(len(content)))
+                        self.end_headers()
+                        self.wfile.write(content)
+                finally:
+                    with server.__lock__:
+                        server.__active__ -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self.__server__ = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.__thread__ = threading.Thread(target=self.__server__.serve_forever, daemon=True)
+        self.__thread__.start()
+
+    def stop(self) -> None:
+        """ A method that stops the server. """
+        if self.__server__ is not None:
+            self.__server__.shutdown()
+            self.__server__.server_close()
+            self.__server__ = None
+
+    def url(self, image, bands: list, tile: dict, crs: str) -> str:
+        """ A method that returns the URL of a tile on the stand-in. Matches the urlFunction signature. """
+        query = urllib.parse.urlencode({
+            "bands": ",".join(bands),
+            "width": tile["width"],
+            "height": tile["height"],
+            "transform": ",".join(repr(float(value)) for value in tile["transform"]),
+            "crs": crs
+        })
+        return f"http://127.0.0.1:{self.__server__.server_address[1]}/tile?{query}"
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
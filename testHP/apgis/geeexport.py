@@ -12,17 +12,34 @@ Contains unary and batch export process functions to the cloud, drive, local OS
 Copyrights (c) 2020 ANTPOD Designs Private Limited. All Rights Reserved.
 ************************************************************************
 """
+import os
+import math
+import hashlib
+import warnings
 import ee
 
 import apgis.geebase as gee
+import apgis.geedownload as download
+import apgis.apraster as raster
+import apgis.applanner as planner
 import apgis.geeindex as index
 import apgis.apexception as apexception
 
 from apgis.aprequestlist import RequestList
 from apgis.apfield import Field
 from apgis.apdate import Date
+from apgis.apmanifest import ExportManifest
 
 INSTANTIATION_ERROR = "This class cannot be instantiated"
+RESOLUTION_SUFFIX = "M"
+
+TABLE_FORMATS = ("CSV", "GeoJSON", "KML", "KMZ", "SHP", "TFRecord")
+TABLE_GEOMETRY = ("geo", "lonlat", "none")
+TABLE_PRODUCTS = {
+    "RawData": ("lonlat", None),
+    "NDVIRender": ("geo", ["layerID"]),
+    "SZRender": ("geo", ["layerID", "meanNDVI"])
+}
 
 
 class Export:
@@ -53,6 +70,184 @@ class Export:
         """ **Forbids Class instantiation** """
         raise AssertionError(INSTANTIATION_ERROR)
 
+    @staticmethod
+    def __manifest_export__(exportTask, taskConfig: dict, stdConfig: dict,
+                            manifest: ExportManifest = None, destination: str = None, location: str = None):
+        """ *A staticmethod that generates an export task unless the manifest holds a live export for it.*
+
+        The content address of the export is generated from its parameters and image or collection graph.
+        If the manifest has the export as READY, RUNNING or COMPLETED, no task is generated. Otherwise the task
+        is generated and recorded in the manifest. If the manifest has an existence check, the output in the
+        Drive folder or bucket is checked as well, see ExportManifest.isLive().
+
+        Args:
+            exportTask:     The ee.batch.Export function that generates the task.
+            taskConfig:     A dictionary of the task specific parameters like image or collection, description and
+                            fileNamePrefix.
+            stdConfig:      A dictionary of the export parameters shared by all tasks of the export.
+            manifest:       An ExportManifest. Defaults to None (tasks are always generated).
+            destination:    The export destination, "Drive" or "Cloud".
+            location:       The Drive folder or the Cloud Storage bucket of the export.
+        Returns:
+            ee.batch.Task:  An unstarted task or None if the export is live in the manifest.
+        """
+        if manifest is None:
+            return exportTask(**taskConfig, **stdConfig)
+
+        asset = taskConfig["image"] if "image" in taskConfig else taskConfig["collection"]
+        taskParams = {key: value for key, value in taskConfig.items()
+                      if key not in ("image", "collection", "description")}
+        key = manifest.exportKey(image=asset, destination=destination, **taskParams, **stdConfig)
+        if manifest.isLive(key=key, fileNamePrefix=taskConfig["fileNamePrefix"], destination=destination,
+                           location=location):
+            return None
+
+        task = exportTask(**taskConfig, **stdConfig)
+        manifest.record(key=key, task=task, fileNamePrefix=taskConfig["fileNamePrefix"],
+                        destination=destination, location=location)
+        return task
+
+    @staticmethod
+    def __format_options__(formatOptions: dict, fileFormat: str, quantize: bool = False) -> dict:
+        """ *A staticmethod that adds the nodata of quantized exports to the GeoTIFF format options.*
+
+        Quantized GeoTIFF exports are written with apraster.QUANTIZED_NODATA as their nodata value, so the masked
+        pixels of the quantized bands are flagged as nodata in the file. Other exports are left as is.
+
+        Args:
+            formatOptions:  The format options of the export.
+            fileFormat:     The file format of the export.
+            quantize:       A bool for quantized exports. Defaults to False.
+        Returns:
+            dict:       The format options of the export.
+        """
+        if not quantize or str(fileFormat).lower() not in ("geotiff", "tif", "tiff"):
+            return formatOptions
+
+        return dict(formatOptions or {}, noData=raster.QUANTIZED_NODATA)
+
+    @staticmethod
+    def __scale_exports__(exports: list, products: list, requestList: RequestList, scale,
+                          nativeScale: bool = False, multiband: bool = False) -> list:
+        """ *A staticmethod that pairs each processed export with its product name and export scale.*
+
+        Without nativeScale every export is at the export scale. With nativeScale the bands of each export are
+        grouped by their native resolution from the config Band Details, with indices at the resolution of their
+        coarsest input band, and each group is exported at its resolution, or the export scale if coarser.
+        Exports with bands at several resolutions are split into an export per resolution, named with the
+        resolution in metres appended to the product, like ``WI20M``, so the names stay alphanumeric and match the
+        export filename parsers like DrivePath.
+
+        Args:
+            exports:        The list of processed images of the export.
+            products:       The list of product names of the exports.
+            requestList:    The RequestList of the export.
+            scale:          The export scale in metres.
+            nativeScale:    A bool to export the bands at their native resolution. Defaults to False.
+            multiband:      A bool for multi-band exports holding all the products. Defaults to False.
+        Returns:
+            list:       A list of (image, product, scale) tuples.
+        """
+        if not nativeScale:
+            return [(export, product, scale) for export, product in zip(exports, products)]
+
+        scaled = []
+        for export, product in zip(exports, products):
+            bands = requestList.exportBands if multiband else requestList.sensorProducts[product]
+            groups = planner.resolutionGroups(requestList=requestList, bands=bands)
+
+            if len(groups) == 1:
+                scaled.append((export, product, max(scale or 0, *groups)))
+                continue
+
+            for resolution, groupBands in groups.items():
+                scaled.append((export.select(groupBands), f"{product}{resolution}{RESOLUTION_SUFFIX}",
+                               max(scale or 0, resolution)))
+
+        return scaled
+
+    @staticmethod
+    def groupFields(fields: list, maxGap: float = 500, maxExtent: float = 5000, minFill: float = 0.5) -> list:
+        """ *A staticmethod that clusters Fields by proximity into groups that can share a single export.*
+
+        Fields are visited from west to east and each is added to the group whose bounding box grows the least
+        by taking it in, among the groups within maxGap metres of it whose bounding box stays within maxExtent
+        metres across and at least minFill covered by the bounding boxes of its Fields. Otherwise the Field starts
+        a new group. The fill bound keeps scattered Fields from being exported over the empty land between them.
+        Point Fields are taken with their 100m export buffer.
+
+        Args:
+            fields:     A list of Field objects.
+            maxGap:     The maximum distance in metres between a Field and the bounding box of its group.
+                        Defaults to 500.
+            maxExtent:  The maximum width and height in metres of the bounding box of a group. Defaults to 5000.
+            minFill:    The minimum fraction of the bounding box of a group covered by the bounding boxes of its
+                        Fields. Defaults to 0.5.
+        Returns:
+            list:       A list of group dictionaries with the groupID, the bounds of the group and the fields
+                        dictionary of the bounds of each Field keyed by apfieldID.
+        Raises:
+            TypeError:      Occurs if the fields are not Field objects.
+            ValueError:     Occurs if two Fields share an apfieldID.
+
+        Examples:
+            Some example uses of this method are:\n
+        *Grouping the Fields of a village:*\n
+        ``>> groups = Export.groupFields(fields=fields, maxGap=1000)``
+        """
+        if not all(isinstance(field, Field) for field in fields):
+            raise TypeError("Field Grouping Failed @ type check: fields must be Field objects")
+
+        if len({field.apfieldID for field in fields}) != len(fields):
+            raise ValueError("Field Grouping Failed @ apfieldID check: apfieldIDs must be unique")
+
+        def metres(bounds):
+            scaleX = download.METRES_PER_DEGREE * math.cos(math.radians((bounds[1] + bounds[3]) / 2))
+            return (bounds[2] - bounds[0]) * scaleX, (bounds[3] - bounds[1]) * download.METRES_PER_DEGREE
+
+        def union(a, b):
+            return [min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])]
+
+        groups = []
+        for field in sorted(fields, key=lambda f: planner.fieldBounds(f)[0]):
+            bounds = planner.fieldBounds(field)
+
+            best, bestGrowth = None, None
+            for group in groups:
+                merged = union(group["bounds"], bounds)
+                width, height = metres(merged)
+                if width > maxExtent or height > maxExtent:
+                    continue
+
+                gapX = max(group["bounds"][0] - bounds[2], bounds[0] - group["bounds"][2], 0)
+                gapY = max(group["bounds"][1] - bounds[3], bounds[1] - group["bounds"][3], 0)
+                gapWidth, gapHeight = metres([0, bounds[1], gapX, bounds[1] + gapY])
+                if math.hypot(gapWidth, gapHeight) > maxGap:
+                    continue
+
+                fieldWidth, fieldHeight = metres(bounds)
+                if group["area"] + fieldWidth * fieldHeight < minFill * width * height:
+                    continue
+
+                groupWidth, groupHeight = metres(group["bounds"])
+                growth = width * height - groupWidth * groupHeight
+                if best is None or growth < bestGrowth:
+                    best, bestGrowth = group, growth
+
+            fieldWidth, fieldHeight = metres(bounds)
+            if best is None:
+                groups.append({"bounds": bounds, "fields": {field.apfieldID: bounds}, "area": fieldWidth * fieldHeight})
+            else:
+                best["bounds"] = union(best["bounds"], bounds)
+                best["fields"][field.apfieldID] = bounds
+                best["area"] += fieldWidth * fieldHeight
+
+        for group in groups:
+            digest = hashlib.sha1(",".join(sorted(group["fields"])).encode("utf-8")).hexdigest()
+            group["groupID"] = "GRP" + digest[:10].upper()
+
+        return [{"groupID": group["groupID"], "bounds": group["bounds"], "fields": group["fields"]} for group in groups]
+
     class Image:
         """
         *Class for ee.Image export processing, task generation and task execution.*
@@ -70,19 +265,27 @@ class Export:
 
         @staticmethod
         def __process_image_export__(image: ee.Image,
-                                     requestList: RequestList) -> list:
+                                     requestList: RequestList,
+                                     multiband: bool = False, quantize: bool = False) -> list:
             """ *A staticmethod to process and export request for Images.*
 
             All the bands that are required to be generated are created and added into a base image.
             The required bands are taken from the RequestList object. A Image is created for each product
             on the RequestList and then returned as a list of Images that are then processed by the
-            export method that invokes this method.
+            export method that invokes this method.\n
+            If multiband is set, a single Image of all the bands of all the products is returned instead.
+            The bands are cast to float since a GeoTIFF export requires all its bands to share a data type.
+            If quantize is set, the index bands of geeindex.quantizedBands() are generated as int16 with
+            geeindex.quantizeIndex(). Products with indices that cannot be quantized are generated as float,
+            with a warning.
 
             Args:
                 image:      The image to be processed for export.
                 requestList:    A RequestList object which contains in a list of strings, the products to be
                                 exported as independent images along with relevant context such as satellite
                                 and sensor names along with bands required to be generated.
+                multiband:  A bool to return a single Image with the bands of all products. Defaults to False.
+                quantize:   A bool to generate the index bands as int16. Defaults to False.
             Returns:
                 list:       A list of ee.Image objects for each product in the requestList
             Raises:
@@ -102,13 +305,23 @@ class Export:
                 raise ValueError(f"Image Export Processing Failed @ image validation: "
                                  f"image must be a {requestList.sensor} acquisition")
 
+            if quantize and multiband:
+                raise ValueError("Image Export Processing Failed @ parameter check: "
+                                 "quantize is not supported for float multi-band exports")
+
+            quantBands, floatProducts = index.quantizedBands(requestList=requestList) if quantize else ([], [])
+            if floatProducts:
+                warnings.warn(f"Image Export Processing @ quantization: the {', '.join(floatProducts)} "
+                              f"products cannot be quantized to int16 and are exported as float")
+
             try:
                 products = requestList.products
                 reqBands = requestList.reqBands
 
                 bandlist = []
                 for band in reqBands:
-                    indexBand = index.generateIndex(image=image, index=band, sensor=requestList.sensor)
+                    indexBand = index.generateIndex(image=image, index=band, sensor=requestList.sensor,
+                                                    quantize=band in quantBands)
                     bandlist.append(indexBand)
 
                 for band in bandlist:
@@ -118,6 +331,9 @@ class Export:
                 raise apexception.EEExportError(f"Image Export Processing Failed @ band generation: {e}")
 
             try:
+                if multiband:
+                    return [image.select(requestList.exportBands).toFloat()]
+
                 exportList = []
                 for product in products:
                     selection = requestList.sensorProducts[product]
@@ -138,7 +354,9 @@ class Export:
                     dimensions=None, region=None, scale=10,
                     crs='EPSG:4326', crsTransform=None, maxPixels=100000000,
                     shardSize=None, fileDimensions=None, skipEmptyTiles=True,
-                    fileFormat='GeoTIFF', formatOptions=None, *args, **kwargs):
+                    fileFormat='GeoTIFF', formatOptions=None,
+                    manifest: ExportManifest = None, multiband: bool = False, nativeScale: bool = False,
+                    quantize: bool = False, *args, **kwargs):
             """ *A method to export Earth Engine Image to Google Drive.*
 
             The method takes export parameters that are supported by the EE Batch Export System for
@@ -192,6 +410,22 @@ class Export:
                 fileFormat:     The string file format to which the image is exported. Currently only 'GeoTIFF'
                                 and 'TFRecord' are supported, defaults to 'GeoTIFF'.
                 formatOptions:  A dictionary of string keys to format specific options.
+                manifest:       An ExportManifest used to skip exports that are already complete or in flight.
+                                Generated tasks are recorded in it. Defaults to None.
+                multiband:      A bool to export all the products into a single float GeoTIFF with one task instead
+                                of a task per product. The product ID in the filename is replaced by the product
+                                IDs joined by "_". Use apraster.splitProducts() to split it locally.
+                                Defaults to False.
+                nativeScale:    A bool to export the bands at their native resolution from the config Band Details
+                                instead of the scale, which then acts as the finest scale. Products with bands at
+                                several resolutions get an export per resolution, named like ``WI20M``.
+                                Defaults to False.
+                quantize:       A bool to export the index bands as int16 instead of float, halving the export size.
+                                Indices are stored as ``round((value - offset) / scale)`` with the scale and offset
+                                of apraster.quantization() and masked pixels as apraster.QUANTIZED_NODATA, the
+                                nodata of the GeoTIFF. Only products of apraster.QUANTIZED_INDICES are quantized,
+                                the others are exported as float with a warning. apraster.readDecoded() decodes
+                                the downloaded GeoTIFF. Not supported for multiband exports. Defaults to False.
             Returns:
                 list:       A list of unstarted Tasks.
             Raises:
@@ -223,8 +457,6 @@ class Export:
                 if not region:
                     region = field.eeROI
 
-                # TODO: Implement dynamic scaling for different sensors.
-
                 # TODO: Acquire date from either the image or the requestList. or
                 #  cross verify and remove the argument parameter.
 
@@ -232,7 +464,6 @@ class Export:
                     "folder": folder,
                     "dimensions": dimensions,
                     "region": region,
-                    "scale": scale,
                     "crs": crs,
                     "crsTransform": crsTransform,
                     "maxPixels": maxPixels,
@@ -240,7 +471,8 @@ class Export:
                     "fileDimensions": fileDimensions,
                     "skipEmptyTiles": skipEmptyTiles,
                     "fileFormat": fileFormat,
-                    "formatOptions": formatOptions
+                    "formatOptions": Export.__format_options__(formatOptions=formatOptions, fileFormat=fileFormat,
+                                                               quantize=quantize)
                 }
 
             except Exception as e:
@@ -248,7 +480,9 @@ class Export:
 
             try:
                 products = requestList.products
-                exports = Export.Image.__process_image_export__(image=image, requestList=requestList)
+                products = [raster.MULTIBAND_SEPARATOR.join(products)] if multiband else products
+                exports = Export.Image.__process_image_export__(image=image, requestList=requestList,
+                                                                multiband=multiband, quantize=quantize)
 
                 if len(exports) != len(products):
                     raise AssertionError("Export & Request Lists Size Mismatch")
@@ -260,14 +494,24 @@ class Export:
                 filename = "-".join([field.apfieldID, requestList.sensor])
 
                 tasklist = []
-                for (export, product) in zip(exports, products):
+                scaledExports = Export.__scale_exports__(exports=exports, products=products,
+                                                         requestList=requestList, scale=scale,
+                                                         nativeScale=nativeScale, multiband=multiband)
+                for (export, product, taskScale) in scaledExports:
                     taskConfig = {
                         "image": export,
                         "description": f"Drive Image Export Task-{product}",
                         "fileNamePrefix": "-".join([filename, product, aqDate.dateString]),
+                        "scale": taskScale,
                     }
-                    task = ee.batch.Export.image.toDrive(**taskConfig, **stdConfig)
-                    tasklist.append(task)
+                    task = Export.__manifest_export__(exportTask=ee.batch.Export.image.toDrive,
+                                                      taskConfig=taskConfig, stdConfig=stdConfig, manifest=manifest,
+                                                      destination="Drive", location=folder)
+                    if task is not None:
+                        tasklist.append(task)
+
+                if manifest is not None:
+                    manifest.save()
 
                 return tasklist
 
@@ -283,7 +527,9 @@ class Export:
                     dimensions=None, region=None, scale=10,
                     crs='EPSG:4326', crsTransform=None, maxPixels=100000000,
                     shardSize=None, fileDimensions=None, skipEmptyTiles=True,
-                    fileFormat='GeoTIFF', formatOptions=None, *args, **kwargs):
+                    fileFormat='GeoTIFF', formatOptions=None,
+                    manifest: ExportManifest = None, multiband: bool = False, nativeScale: bool = False,
+                    quantize: bool = False, *args, **kwargs):
             """doc"""
             if not isinstance(image, ee.Image):
                 raise TypeError("Google Cloud Image Export Failed @ type check:"
@@ -309,8 +555,6 @@ class Export:
                 if not region:
                     region = field.eeROI
 
-                # TODO: Implement dynamic scaling for different sensors.
-
                 # TODO: Acquire date from either the image or the requestList. or
                 #  cross verify and remove the argument parameter.
 
@@ -318,7 +562,6 @@ class Export:
                     "bucket": bucket,
                     "dimensions": dimensions,
                     "region": region,
-                    "scale": scale,
                     "crs": crs,
                     "crsTransform": crsTransform,
                     "maxPixels": maxPixels,
@@ -326,7 +569,8 @@ class Export:
                     "fileDimensions": fileDimensions,
                     "skipEmptyTiles": skipEmptyTiles,
                     "fileFormat": fileFormat,
-                    "formatOptions": formatOptions
+                    "formatOptions": Export.__format_options__(formatOptions=formatOptions, fileFormat=fileFormat,
+                                                               quantize=quantize)
                 }
 
             except Exception as e:
@@ -334,7 +578,9 @@ class Export:
 
             try:
                 products = requestList.products
-                exports = Export.Image.__process_image_export__(image=image, requestList=requestList)
+                products = [raster.MULTIBAND_SEPARATOR.join(products)] if multiband else products
+                exports = Export.Image.__process_image_export__(image=image, requestList=requestList,
+                                                                multiband=multiband, quantize=quantize)
 
                 if len(exports) != len(products):
                     raise apexception.EEExportError("Export & Request Lists Size Mismatch")
@@ -346,29 +592,286 @@ class Export:
                 filename = "-".join([field.apfieldID, requestList.sensor])
 
                 tasklist = []
-                for (export, product) in zip(exports, products):
+                scaledExports = Export.__scale_exports__(exports=exports, products=products,
+                                                         requestList=requestList, scale=scale,
+                                                         nativeScale=nativeScale, multiband=multiband)
+                for (export, product, taskScale) in scaledExports:
                     taskConfig = {
                         "image": export,
                         "description": f"Cloud Image Export Task-{product}",
                         "fileNamePrefix": "-".join([filename, product, aqDate.dateString]),
+                        "scale": taskScale,
                     }
-                    task = ee.batch.Export.image.toCloudStorage(**taskConfig, **stdConfig)
-                    tasklist.append(task)
+                    task = Export.__manifest_export__(exportTask=ee.batch.Export.image.toCloudStorage,
+                                                      taskConfig=taskConfig, stdConfig=stdConfig, manifest=manifest,
+                                                      destination="Cloud", location=bucket)
+                    if task is not None:
+                        tasklist.append(task)
+
+                if manifest is not None:
+                    manifest.save()
 
                 return tasklist
 
             except Exception as e:
                 raise apexception.EEExportError(f"Google Cloud Image Export Failed @ Task Generation: {e}")
 
+        @staticmethod
+        def toCloudGrouped(image: ee.Image,
+                           requestList: RequestList,
+                           fields: list,
+                           aqDate: Date,
+                           bucket="antpod-apgis-exports",
+                           maxGap: float = 500, maxExtent: float = 5000, minFill: float = 0.5,
+                           scale=10, crs='EPSG:4326', maxPixels=100000000,
+                           skipEmptyTiles=True, fileFormat='GeoTIFF', formatOptions=None,
+                           manifest: ExportManifest = None, multiband: bool = False, quantize: bool = False,
+                           nativeScale: bool = False, *args, **kwargs) -> tuple:
+            """ *A method to export Earth Engine Image to Google Cloud Storage for many Fields at once.*
+
+            Neighbouring Fields are grouped with Export.groupFields() and each group is exported as a single image
+            over the bounding box of the group, instead of an export per Field over overlapping pixels. The exports
+            are named ``groupID-sensor-product-date``. Once downloaded, apraster.cropFields() crops each group
+            export into the usual ``apfieldID-sensor-product-date`` file of each Field.\n
+
+            The task count and pixel volume of the grouped exports are reported along with those of exporting
+            each Field on its own with Export.Image.toCloud(). The tasks are those generated, which leaves out
+            exports that are already live in the manifest, and the plannedTasks are all the exports of the groups.
+            Pixels are counted at the export scale.
+
+            Args:
+                fields:         A list of Field objects.
+                maxGap:         The maximum distance in metres between a Field and its group. Defaults to 500.
+                maxExtent:      The maximum width and height in metres of a group. Defaults to 5000.
+                minFill:        The minimum fraction of a group covered by its Fields. Defaults to 0.5.
+                nativeScale:    A bool to export the bands at their native resolution, as in Export.Image.toCloud().
+                                Defaults to False.
+                Others:         See Export.Image.toCloud().
+            Returns:
+                tuple:      The list of unstarted Tasks and the export plan, a dictionary with the groups of
+                            Export.groupFields() along with the fileNamePrefixes of their exports, and the report
+                            dictionary of the tasks and pixels of the grouped and per Field exports.
+            Raises:
+                TypeError:      Occurs if the parameter type checks fail.
+                ValueError:     Occurs if the image is not associated with Sensor ID in requestList.
+                EEExportError:  Occurs if export runtime fails.
+
+            Examples:
+                Some example uses of this method are:\n
+            *Exporting the fields of a village:*\n
+            ``>> tasks, plan = Export.Image.toCloudGrouped(image=image, requestList=requestList, fields=fields,``
+            ``aqDate=aqDate)``\n
+            ``>> jsonio.jsonWrite(dictData=plan, filename="plan-2020-08-23")``\n
+            *Cropping a downloaded group export:*\n
+            ``>> raster.cropFields(filename="GRP1A2B3C4D5E-L2A-VI-2020-08-23.tif", group=plan["groups"][0])``
+            """
+            if not isinstance(image, ee.Image):
+                raise TypeError("Google Cloud Grouped Image Export Failed @ type check:"
+                                "image must be an ee.Image")
+
+            if not isinstance(requestList, RequestList):
+                raise TypeError("Google Cloud Grouped Image Export Failed @ type check:"
+                                "requestList must be RequestList object")
+
+            if not isinstance(aqDate, Date):
+                raise TypeError("Google Cloud Grouped Image Export Failed @ type check:"
+                                "aqDate must be a Date object")
+
+            if not gee.verifyImage(image=image, mode=requestList.sensor):
+                raise ValueError(f"Google Cloud Grouped Image Export Failed @ image validation:"
+                                 f"image must be a {requestList.sensor} acquisition")
+
+            groups = Export.groupFields(fields=fields, maxGap=maxGap, maxExtent=maxExtent, minFill=minFill)
+
+            try:
+                products = requestList.products
+                products = [raster.MULTIBAND_SEPARATOR.join(products)] if multiband else products
+                exports = Export.Image.__process_image_export__(image=image, requestList=requestList,
+                                                                multiband=multiband, quantize=quantize)
+
+                if len(exports) != len(products):
+                    raise apexception.EEExportError("Export & Request Lists Size Mismatch")
+
+            except apexception.EEExportError as e:
+                raise apexception.EEExportError(f"Google Cloud Grouped Image Export Failed @ Export Processing: {e}")
+
+            try:
+                stdConfig = {
+                    "bucket": bucket,
+                    "crs": crs,
+                    "maxPixels": maxPixels,
+                    "skipEmptyTiles": skipEmptyTiles,
+                    "fileFormat": fileFormat,
+                    "formatOptions": Export.__format_options__(formatOptions=formatOptions, fileFormat=fileFormat,
+                                                               quantize=quantize)
+                }
+
+                tasklist = []
+                scaledExports = Export.__scale_exports__(exports=exports, products=products,
+                                                         requestList=requestList, scale=scale,
+                                                         nativeScale=nativeScale, multiband=multiband)
+                for group in groups:
+                    minX, minY, maxX, maxY = group["bounds"]
+                    region = ee.Geometry.Polygon([[minX, minY], [minX, maxY], [maxX, maxY], [maxX, minY]])
+                    filename = "-".join([group["groupID"], requestList.sensor])
+
+                    group["fileNamePrefixes"] = []
+                    for (export, product, taskScale) in scaledExports:
+                        taskConfig = {
+                            "image": export,
+                            "description": f"Cloud Grouped Image Export Task-{group['groupID']}-{product}",
+                            "fileNamePrefix": "-".join([filename, product, aqDate.dateString]),
+                            "region": region,
+                            "scale": taskScale
+                        }
+                        group["fileNamePrefixes"].append(taskConfig["fileNamePrefix"])
+
+                        task = Export.__manifest_export__(exportTask=ee.batch.Export.image.toCloudStorage,
+                                                          taskConfig=taskConfig, stdConfig=stdConfig,
+                                                          manifest=manifest, destination="Cloud", location=bucket)
+                        if task is not None:
+                            tasklist.append(task)
+
+                if manifest is not None:
+                    manifest.save()
+
+            except Exception as e:
+                raise apexception.EEExportError(f"Google Cloud Grouped Image Export Failed @ Task Generation: {e}")
+
+            def pixels(bounds):
+                grid = download.computeGrid(bounds=bounds, scale=scale)
+                return grid["width"] * grid["height"] * len(requestList.exportBands)
+
+            report = {
+                "fields": len(fields),
+                "groups": len(groups),
+                "tasks": len(tasklist),
+                "plannedTasks": len(groups) * len(scaledExports),
+                "baselineTasks": len(fields) * len(scaledExports),
+                "pixels": sum(pixels(group["bounds"]) for group in groups),
+                "baselinePixels": sum(pixels(bounds) for group in groups for bounds in group["fields"].values())
+            }
+
+            return tasklist, {"date": aqDate.dateString, "sensor": requestList.sensor, "groups": groups,
+                              "report": report}
+
         @staticmethod
         def toAsset(self):
             """doc"""
             raise NotImplementedError("Image Exports to EE Assets are unavailable at this time")
 
         @staticmethod
-        def toDisk(self):
-            """doc"""
-            raise NotImplementedError("Image Exports to Local Disk are unavailable at this time")
+        def toDisk(image: ee.Image,
+                   requestList: RequestList,
+                   field: Field,
+                   aqDate: Date,
+                   folder: str = "exports",
+                   region: list = None, scale=10, crs='EPSG:4326',
+                   multiband: bool = False, asArray: bool = False,
+                   maxWorkers: int = 8, urlFunction=None, *args, **kwargs) -> list:
+            """ *A method to export Earth Engine Image directly to the Local Disk.*
+
+            The pixels are fetched from the synchronous Earth Engine download endpoint rather than the batch
+            export system, so small fields are available in seconds instead of waiting for a batch task and
+            a Drive or Cloud Storage download.\n
+
+            Image is processed and all the bands that are required to be generated are created and added into
+            a base image. The bands of all the products are fetched at once as float pixels. The pixel grid is
+            split into tiles under the request size limit, which are fetched in parallel on a thread pool and
+            stitched together. A GeoTIFF is then written for each product (or a single one if multiband is set)
+            with the same filenames as the batch exports.
+
+            Args:
+                image:          The image to be exported.
+                requestList:    A RequestList object which contains in a list of strings, the products to be
+                                exported as independent images along with relevant context.
+                field:          A Field object containing parameters used to authenticate user and to construct
+                                the export filename.
+                aqDate:         The date of acquisition of the image to export. Used to construct the filename.
+                folder:         The local directory to write the GeoTIFFs into. Defaults to "exports".
+                region:         A bounding box as [minLongitude, minLatitude, maxLongitude, maxLatitude].
+                                Defaults to the field's ROIBox.
+                scale:          The resolution in meters per pixel. Defaults to 10.
+                crs:            The coordinate reference system. Only 'EPSG:4326' is supported.
+                multiband:      A bool to write all the products into a single GeoTIFF. Defaults to False.
+                asArray:        A bool to return the arrays instead of writing GeoTIFFs. Defaults to False.
+                maxWorkers:     The maximum number of concurrent tile requests. Defaults to 8.
+                urlFunction:    A function that returns the download URL of a tile. Defaults to the Earth Engine
+                                download URL. See geedownload.LocalTileServer for a local stand-in.
+            Returns:
+                list:       A list of the GeoTIFF paths, or of tuples of a (bands, height, width) float array
+                            and its affine transform if asArray is set, for each product.
+            Raises:
+                TypeError:      Occurs if the parameter type checks fail.
+                ValueError:     Occurs if the image is not associated with Sensor ID in requestList.
+                EEExportError:  Occurs if export runtime fails.
+
+            Examples:
+                Some example uses of this method are:\n
+            *Exporting the NDVI and RGB products of a field:*\n
+            ``>> files = Export.Image.toDisk(image=image, requestList=requestList, field=field, aqDate=aqDate)``
+            """
+            if not isinstance(image, ee.Image):
+                raise TypeError("Local Disk Image Export Failed @ type check:"
+                                "image must be an ee.Image")
+
+            if not isinstance(requestList, RequestList):
+                raise TypeError("Local Disk Image Export Failed @ type check:"
+                                "requestList must be RequestList object")
+
+            if not isinstance(field, Field):
+                raise TypeError("Local Disk Image Export Failed @ type check:"
+                                "field must be a Field object")
+
+            if not isinstance(aqDate, Date):
+                raise TypeError("Local Disk Image Export Failed @ type check:"
+                                "aqDate must be a Date object")
+
+            if not gee.verifyImage(image=image, mode=requestList.sensor):
+                raise ValueError(f"Local Disk Image Export Failed @ image validation:"
+                                 f"image must be a {requestList.sensor} acquisition")
+
+            try:
+                export = Export.Image.__process_image_export__(image=image, requestList=requestList,
+                                                               multiband=True)[0]
+
+            except apexception.EEExportError as e:
+                raise apexception.EEExportError(f"Local Disk Image Export Failed @ Export Processing: {e}")
+
+            try:
+                bands = requestList.exportBands
+                array, transform = download.downloadImage(image=export, bounds=region or field.ROIBox, bands=bands,
+                                                          scale=scale, crs=crs, maxWorkers=maxWorkers,
+                                                          urlFunction=urlFunction)
+
+            except Exception as e:
+                raise apexception.EEExportError(f"Local Disk Image Export Failed @ Pixel Download: {e}")
+
+            try:
+                if multiband:
+                    outputs = [(raster.MULTIBAND_SEPARATOR.join(requestList.products), bands, array)]
+                else:
+                    outputs = []
+                    for product in requestList.products:
+                        productBands = requestList.sensorProducts[product]
+                        outputs.append((product, productBands, array[[bands.index(band) for band in productBands]]))
+
+                if asArray:
+                    return [(productArray, transform) for _, _, productArray in outputs]
+
+                os.makedirs(folder, exist_ok=True)
+                filename = "-".join([field.apfieldID, requestList.sensor])
+
+                files = []
+                for product, productBands, productArray in outputs:
+                    path = os.path.join(folder, "-".join([filename, product, aqDate.dateString]))
+                    files.append(raster.writeGeoTIFF(array=productArray, transform=transform, filename=path,
+                                                     crs=crs, bandNames=productBands))
+
+                return files
+
+            except Exception as e:
+                raise apexception.EEExportError(f"Local Disk Image Export Failed @ GeoTIFF Writing: {e}")
 
     class ImageCollection:
         """
@@ -387,21 +890,31 @@ class Export:
 
         @staticmethod
         def __process_image_collection_export__(imageCol: ee.ImageCollection,
-                                                requestList: RequestList):
+                                                requestList: RequestList,
+                                                multiband: bool = False, quantize: bool = False):
             """ *A staticmethod to process and export request for ImageCollections.*
 
             All the bands that are required to be generated are created and added into
             each image in the collection. The required bands are taken from the RequestList object.
             The band generation math is mapped over the entire collection.\n
+            The mosaic generation and band generation are mapped on the server. The datelist is the only value
+            that is fetched, so the number of requests does not grow with the dates or the products.\n
             Collection exports are just iterative batch exports i.e an Image is created for each product
             on the RequestList for each Image in the ImageCollection and then returned as a list of list of
-            Images that are then processed by the export method that invokes this method.
+            Images that are then processed by the export method that invokes this method.\n
+            If multiband is set, each inner list holds a single float Image of all the bands of all the products.
+            If quantize is set, the index bands of geeindex.quantizedBands() are generated as int16 with
+            geeindex.quantizeIndex(). Products with indices that cannot be quantized are generated as float,
+            with a warning.
 
             Args:
                 imageCol:       The imageCollection to be processed for export.
                 requestList:    A RequestList object which contains in a list of strings, the products to be
                                 exported as independent images along with relevant context such as satellite
                                 and sensor names along with bands required to be generated.
+                multiband:      A bool to generate a single Image with the bands of all products for each date.
+                                Defaults to False.
+                quantize:       A bool to generate the index bands as int16. Defaults to False.
             Returns:
                 list:       A list containing a list of ee.Image objects for each Image in the Collection.
                 list:       The list of Images contains an Image for each product in the requestList
@@ -418,42 +931,51 @@ class Export:
                 raise TypeError("ImageCollection Export Processing Failed @ type check: "
                                 "requestList must be a RequestList object")
 
+            if quantize and multiband:
+                raise ValueError("ImageCollection Export Processing Failed @ parameter check: "
+                                 "quantize is not supported for float multi-band exports")
+
+            quantBands, floatProducts = index.quantizedBands(requestList=requestList) if quantize else ([], [])
+            if floatProducts:
+                warnings.warn(f"ImageCollection Export Processing @ quantization: the {', '.join(floatProducts)} "
+                              f"products cannot be quantized to int16 and are exported as float")
+
             try:
                 mosCol, datelist, count = gee.generateMosaicCollection(imageCol=imageCol, sensor=requestList.sensor)
 
-                if not gee.verifyCollection(imageCol=mosCol, mode=requestList.sensor):
-                    raise ValueError(f"ImageCollection Export Processing Failed @ collection validation: "
-                                     f"image must be a {requestList.sensor} acquisition")
-
             except Exception as e:
                 raise apexception.EEExportError(f"ImageCollection Export Processing Failed @ mosaic generation: {e}")
 
             try:
-                products = requestList.products
                 sat = requestList.sat
+                reqBands = requestList.reqBands
 
-                for product in products:
-                    imagelist = []
-                    productCol = mosCol.map(index.INDEX_MAP[sat][product])
-
-                    # TODO: Implement with EE Iterate.
-                    for i in range(0, count):
-                        image = gee.extractImage(imageCol=productCol, index=i)
-                        image = gee.fixMetadata(image=image, sensor="L2A", aqDate=Date(datelist[i]))
-                        imagelist.append(image)
+                # noinspection PyUnresolvedReferences
+                def algoAddBands(image):
+                    """ A mapping algorithm that adds the required index bands to a mosaic Image. """
+                    image = ee.Image(image)
+                    indexBands = [index.quantizeIndex(image=index.INDEX_MAP[sat][band](image), index=band)
+                                  if band in quantBands else index.INDEX_MAP[sat][band](image).float()
+                                  for band in reqBands]
+                    return image.addBands(ee.Image.cat(indexBands)) if indexBands else image
 
-                    productCol = ee.ImageCollection(imagelist)
-                    mosCol = mosCol.combine(productCol)
+                productCol = mosCol.map(algoAddBands)
 
             except Exception as e:
                 raise apexception.EEExportError(f"ImageCollection Export Processing Failed @ band generation: {e}")
 
             try:
+                products = requestList.products
                 sensorProducts = requestList.sensorProducts
+                imageList = productCol.toList(count)
 
                 exportList = []
                 for i in range(0, count):
-                    image = gee.extractImage(imageCol=mosCol, index=i)
+                    image = ee.Image(imageList.get(i))
+
+                    if multiband:
+                        exportList.append([image.select(requestList.exportBands).toFloat()])
+                        continue
 
                     exportProductList = []
                     for product in products:
@@ -476,7 +998,9 @@ class Export:
                     dimensions=None, region=None, scale=10,
                     crs='EPSG:4326', crsTransform=None, maxPixels=100000000,
                     shardSize=None, fileDimensions=None, skipEmptyTiles=True,
-                    fileFormat='GeoTIFF', formatOptions=None, *args, **kwargs) -> list:
+                    fileFormat='GeoTIFF', formatOptions=None,
+                    manifest: ExportManifest = None, multiband: bool = False, nativeScale: bool = False,
+                    quantize: bool = False, *args, **kwargs) -> list:
             """ *A method to export Earth Engine ImageCollection to Google Drive.*
 
             The method takes export parameters that are supported by the EE Batch Export System for
@@ -534,6 +1058,16 @@ class Export:
                 fileFormat:         The string file format to which the image is exported. Currently only 'GeoTIFF'
                                     and 'TFRecord' are supported, defaults to 'GeoTIFF'.
                 formatOptions:      A dictionary of string keys to format specific options.
+                manifest:           An ExportManifest used to skip exports that are already complete or in flight.
+                                    Generated tasks are recorded in it. Defaults to None.
+                multiband:          A bool to export all the products of a date into a single float GeoTIFF with
+                                    one task instead of a task per product. The product ID in the filename is
+                                    replaced by the product IDs joined by "_". Use apraster.splitProducts() to
+                                    split it locally. Defaults to False.
+                nativeScale:        A bool to export the bands at their native resolution. See
+                                    Export.Image.toDrive(). Defaults to False.
+                quantize:           A bool to export the index bands as int16. See Export.Image.toDrive().
+                                    Defaults to False.
             Returns:
                 list:       A list of lists that contain unstarted Tasks.
             Raises:
@@ -565,7 +1099,6 @@ class Export:
                     "folder": folder,
                     "dimensions": dimensions,
                     "region": region,
-                    "scale": scale,
                     "crs": crs,
                     "crsTransform": crsTransform,
                     "maxPixels": maxPixels,
@@ -573,7 +1106,8 @@ class Export:
                     "fileDimensions": fileDimensions,
                     "skipEmptyTiles": skipEmptyTiles,
                     "fileFormat": fileFormat,
-                    "formatOptions": formatOptions
+                    "formatOptions": Export.__format_options__(formatOptions=formatOptions, fileFormat=fileFormat,
+                                                               quantize=quantize)
                 }
 
             except Exception as e:
@@ -582,7 +1116,9 @@ class Export:
 
             try:
                 products = requestList.products
-                exportList, datelist = Export.ImageCollection.__process_image_collection_export__(imageCol, requestList)
+                products = [raster.MULTIBAND_SEPARATOR.join(products)] if multiband else products
+                exportList, datelist = Export.ImageCollection.__process_image_collection_export__(imageCol, requestList,
+                                                                                                  multiband, quantize)
 
                 if len(exportList) != len(datelist):
                     raise apexception.EEExportError("ExportList & Date Lists Size Mismatch")
@@ -602,17 +1138,27 @@ class Export:
                     exports = imagelist
 
                     productTaskList = []
-                    for (export, product) in zip(exports, products):
+                    scaledExports = Export.__scale_exports__(exports=exports, products=products,
+                                                             requestList=requestList, scale=scale,
+                                                             nativeScale=nativeScale, multiband=multiband)
+                    for (export, product, taskScale) in scaledExports:
                         taskConfig = {
                             "image": export,
                             "description": f"Drive Image Export Task-{product}",
                             "fileNamePrefix": "-".join([filename, product, aqDate]),
+                            "scale": taskScale,
                         }
-                        task = ee.batch.Export.image.toDrive(**taskConfig, **stdConfig)
-                        productTaskList.append(task)
+                        task = Export.__manifest_export__(exportTask=ee.batch.Export.image.toDrive,
+                                                          taskConfig=taskConfig, stdConfig=stdConfig,
+                                                          manifest=manifest, destination="Drive", location=folder)
+                        if task is not None:
+                            productTaskList.append(task)
 
                     taskList.append(productTaskList)
 
+                if manifest is not None:
+                    manifest.save()
+
                 return taskList
 
             except Exception as e:
@@ -626,7 +1172,9 @@ class Export:
                     dimensions=None, region=None, scale=10,
                     crs='EPSG:4326', crsTransform=None, maxPixels=100000000,
                     shardSize=None, fileDimensions=None, skipEmptyTiles=True,
-                    fileFormat='GeoTIFF', formatOptions=None, *args, **kwargs):
+                    fileFormat='GeoTIFF', formatOptions=None,
+                    manifest: ExportManifest = None, multiband: bool = False, nativeScale: bool = False,
+                    quantize: bool = False, *args, **kwargs):
             """doc"""
             if not isinstance(imageCol, ee.ImageCollection):
                 raise TypeError("Google Cloud ImageCollection Export Failed @ type check:"
@@ -652,7 +1200,6 @@ class Export:
                     "bucket": bucket,
                     "dimensions": dimensions,
                     "region": region,
-                    "scale": scale,
                     "crs": crs,
                     "crsTransform": crsTransform,
                     "maxPixels": maxPixels,
@@ -660,7 +1207,8 @@ class Export:
                     "fileDimensions": fileDimensions,
                     "skipEmptyTiles": skipEmptyTiles,
                     "fileFormat": fileFormat,
-                    "formatOptions": formatOptions
+                    "formatOptions": Export.__format_options__(formatOptions=formatOptions, fileFormat=fileFormat,
+                                                               quantize=quantize)
                 }
 
             except Exception as e:
@@ -669,7 +1217,9 @@ class Export:
 
             try:
                 products = requestList.products
-                exportList, datelist = Export.ImageCollection.__process_image_collection_export__(imageCol, requestList)
+                products = [raster.MULTIBAND_SEPARATOR.join(products)] if multiband else products
+                exportList, datelist = Export.ImageCollection.__process_image_collection_export__(imageCol, requestList,
+                                                                                                  multiband, quantize)
 
                 if len(exportList) != len(datelist):
                     raise apexception.EEExportError("ExportList & Date Lists Size Mismatch")
@@ -689,17 +1239,27 @@ class Export:
                     exports = imagelist
 
                     productTaskList = []
-                    for (export, product) in zip(exports, products):
+                    scaledExports = Export.__scale_exports__(exports=exports, products=products,
+                                                             requestList=requestList, scale=scale,
+                                                             nativeScale=nativeScale, multiband=multiband)
+                    for (export, product, taskScale) in scaledExports:
                         taskConfig = {
                             "image": export,
                             "description": f"Cloud Image Export Task-{product}",
                             "fileNamePrefix": "-".join([filename, product, aqDate]),
+                            "scale": taskScale,
                         }
-                        task = ee.batch.Export.image.toCloudStorage(**taskConfig, **stdConfig)
-                        productTaskList.append(task)
+                        task = Export.__manifest_export__(exportTask=ee.batch.Export.image.toCloudStorage,
+                                                          taskConfig=taskConfig, stdConfig=stdConfig,
+                                                          manifest=manifest, destination="Cloud", location=bucket)
+                        if task is not None:
+                            productTaskList.append(task)
 
                     taskList.append(productTaskList)
 
+                if manifest is not None:
+                    manifest.save()
+
                 return taskList
 
             except Exception as e:
@@ -730,19 +1290,205 @@ class Export:
             raise AssertionError(INSTANTIATION_ERROR)
 
         @staticmethod
-        def __processTableExport__():
-            """doc"""
-            raise NotImplementedError("Table Exports are unavailable at this time")
+        def __processTableExport__(collection: ee.FeatureCollection,
+                                   product: str,
+                                   geometry: str = None,
+                                   selectors: list = None) -> tuple:
+            """ *A staticmethod that shapes a FeatureCollection into the columns of a table export.*
+
+            Geometry is written as a '.geo' column of GeoJSON strings in 'geo' mode, as 'longitude' and 'latitude'
+            columns of the geometry centroid in 'lonlat' mode and dropped in 'none' mode. The geometry mode and the
+            selectors default to those of the product in TABLE_PRODUCTS.
+
+            Args:
+                collection:     The ee.FeatureCollection to be exported.
+                product:        The product ID of the table.
+                geometry:       The geometry mode, 'geo', 'lonlat' or 'none'. Defaults to the product geometry mode.
+                selectors:      A list of the properties to be exported. Defaults to the product properties.
+            Returns:
+                tuple:      The processed ee.FeatureCollection and the list of selectors.
+            Raises:
+                ValueError:     Occurs if the geometry mode is invalid.
+                EEExportError:  Occurs if the collection processing fails.
+            """
+            productGeometry, productSelectors = TABLE_PRODUCTS.get(product, ("geo", None))
+            geometry = geometry or productGeometry
+            selectors = list(selectors or productSelectors or [])
+
+            if geometry not in TABLE_GEOMETRY:
+                raise ValueError(f"Table Export Processing Failed @ geometry check: geometry must be one of "
+                                 f"{TABLE_GEOMETRY}")
+
+            try:
+                if geometry == "lonlat":
+                    def algoLonLat(feature):
+                        """ A function that sets the centroid coordinates of a feature as properties and drops the
+                        geometry."""
+                        feature = ee.Feature(feature)
+                        coordinates = feature.geometry().centroid(1).coordinates()
+                        return feature.set({"longitude": coordinates.get(0),
+                                            "latitude": coordinates.get(1)}).setGeometry(None)
+
+                    collection = collection.map(algoLonLat)
+                    selectors = selectors + ["longitude", "latitude"] if selectors else selectors
+
+                elif geometry == "none":
+                    collection = collection.map(lambda feature: ee.Feature(feature).setGeometry(None))
+
+                elif selectors:
+                    selectors = selectors + [".geo"]
+
+                return collection, selectors or None
+
+            except Exception as e:
+                raise apexception.EEExportError(f"Table Export Processing Failed @ collection processing: {e}")
 
         @staticmethod
-        def toDrive(self):
-            """doc"""
-            raise NotImplementedError("Table Exports to Drive are unavailable at this time")
+        def __generate_table_task__(exportTask, collection: ee.FeatureCollection, field: Field, aqDate: Date,
+                                    product: str, geometry: str, selectors: list, fileFormat: str, stdConfig: dict,
+                                    manifest: ExportManifest, destination: str, location: str, target: str) -> list:
+            """ *A staticmethod that validates, processes and generates the task of a table export.*
+
+            Args:
+                exportTask:     The ee.batch.Export.table function that generates the task.
+                destination:    The export destination, "Drive" or "Cloud".
+                location:       The Drive folder or the Cloud Storage bucket of the export.
+                target:         The name of the export target used in error messages.
+                Others:         See Export.Table.toDrive().
+            Returns:
+                list:       A list with the unstarted Task, empty if the export is live in the manifest.
+            """
+            if not isinstance(collection, ee.FeatureCollection):
+                raise TypeError(f"{target} Table Export Failed @ type check: "
+                                "collection must be an ee.FeatureCollection")
+
+            if not isinstance(field, Field):
+                raise TypeError(f"{target} Table Export Failed @ type check: field must be a Field object")
+
+            if not isinstance(aqDate, Date):
+                raise TypeError(f"{target} Table Export Failed @ type check: aqDate must be a Date object")
+
+            if fileFormat not in TABLE_FORMATS:
+                raise ValueError(f"{target} Table Export Failed @ fileFormat check: fileFormat must be one of "
+                                 f"{TABLE_FORMATS}")
+
+            try:
+                export, selectors = Export.Table.__processTableExport__(collection=collection, product=product,
+                                                                        geometry=geometry, selectors=selectors)
+
+            except (ValueError, apexception.EEExportError) as e:
+                raise apexception.EEExportError(f"{target} Table Export Failed @ Export Processing: {e}")
+
+            try:
+                taskConfig = {
+                    "collection": export,
+                    "description": f"{target} Table Export Task-{product}",
+                    "fileNamePrefix": "-".join([field.apfieldID, product, aqDate.dateString]),
+                    "selectors": selectors
+                }
+                stdConfig = {**stdConfig, "fileFormat": fileFormat}
+
+                task = Export.__manifest_export__(exportTask=exportTask, taskConfig=taskConfig, stdConfig=stdConfig,
+                                                  manifest=manifest, destination=destination, location=location)
+
+                if manifest is not None:
+                    manifest.save()
+
+                return [task] if task is not None else []
+
+            except Exception as e:
+                raise apexception.EEExportError(f"{target} Table Export Failed @ Task Generation: {e}")
 
         @staticmethod
-        def toCloud(self):
-            """doc"""
-            raise NotImplementedError("Table Exports to Cloud Storage are unavailable at this time")
+        def toDrive(collection: ee.FeatureCollection,
+                    field: Field,
+                    aqDate: Date,
+                    product: str,
+                    folder: str = "Unassigned Exports",
+                    geometry: str = None, selectors: list = None,
+                    fileFormat: str = "CSV", manifest: ExportManifest = None, *args, **kwargs) -> list:
+            """ *A method to export an Earth Engine FeatureCollection as a table to Google Drive.*
+
+            Made for the outputs of geespatial.accumulateRawValue(), geespatial.layerCoding() and
+            geespatial.genSZRender(), registered in TABLE_PRODUCTS as 'RawData', 'NDVIRender' and 'SZRender'.
+            Point tables like RawData are exported with 'longitude' and 'latitude' columns in place of the
+            geometry, so they can be read locally as plain numeric columns with aptable.readTable().
+
+            The export is named ``apfieldID-product-date``. Use aptable.toColumnar() to convert a downloaded
+            CSV into the compact columnar '.npz' format.
+
+            THE EARTH ENGINE SESSION MUST BE INITIALIZED WITH AN INTERNAL OAUTH CONFIGURATION.
+            PROJECT ID/ SERVICE ACCOUNT AUTHENTICATION IS NOT ALLOWED FOR GOOGLE DRIVE EXPORTS.\n
+
+            Args:
+                collection:     The ee.FeatureCollection to be exported.
+                field:          A Field object.
+                aqDate:         A Date object.
+                product:        The product ID of the table, like 'RawData', 'NDVIRender' or 'SZRender'.
+                folder:         The Google Drive Folder that the export will reside in.
+                                Defaults to "Unassigned Exports".
+                geometry:       The geometry mode, 'geo' for a '.geo' GeoJSON column, 'lonlat' for centroid
+                                'longitude' and 'latitude' columns or 'none'. Defaults to the product geometry mode.
+                selectors:      A list of the properties to be exported. Defaults to the product properties or
+                                all the properties for other products.
+                fileFormat:     The file format of the export, one of TABLE_FORMATS. Defaults to 'CSV'.
+                manifest:       An ExportManifest used to skip exports that are already complete or in flight.
+                                Generated tasks are recorded in it. Defaults to None.
+            Returns:
+                list:       A list with the unstarted Task, empty if the export is live in the manifest.
+            Raises:
+                TypeError:      Occurs if the parameter type checks fail.
+                ValueError:     Occurs if the fileFormat is invalid.
+                EEExportError:  Occurs if export runtime fails.
+
+            Examples:
+                Some example uses of this method are:\n
+            *Exporting the raw NDVI values of a field:*\n
+            ``>> rawData = spatial.accumulateRawValue(indexImage=ndvi, field=field)``\n
+            ``>> tasks = Export.Table.toDrive(collection=rawData, field=field, aqDate=date, product="RawData")``
+            """
+            return Export.Table.__generate_table_task__(exportTask=ee.batch.Export.table.toDrive,
+                                                        collection=collection, field=field, aqDate=aqDate,
+                                                        product=product, geometry=geometry, selectors=selectors,
+                                                        fileFormat=fileFormat, stdConfig={"folder": folder},
+                                                        manifest=manifest, destination="Drive", location=folder,
+                                                        target="Google Drive")
+
+        @staticmethod
+        def toCloud(collection: ee.FeatureCollection,
+                    field: Field,
+                    aqDate: Date,
+                    product: str,
+                    bucket: str = "antpod-apgis-exports",
+                    geometry: str = None, selectors: list = None,
+                    fileFormat: str = "CSV", manifest: ExportManifest = None, *args, **kwargs) -> list:
+            """ *A method to export an Earth Engine FeatureCollection as a table to Google Cloud Storage.*
+
+            The Cloud Storage counterpart of Export.Table.toDrive().
+
+            Args:
+                bucket:         The Google Cloud Storage bucket that the export will reside in.
+                                Defaults to "antpod-apgis-exports".
+                Others:         See Export.Table.toDrive().
+            Returns:
+                list:       A list with the unstarted Task, empty if the export is live in the manifest.
+            Raises:
+                TypeError:      Occurs if the parameter type checks fail.
+                ValueError:     Occurs if the fileFormat is invalid.
+                EEExportError:  Occurs if export runtime fails.
+
+            Examples:
+                Some example uses of this method are:\n
+            *Exporting the StressZone render of a field:*\n
+            ``>> szRender = spatial.genSZRender(ndviLayerCol=layers, ndvi=ndvi, field=field)``\n
+            ``>> tasks = Export.Table.toCloud(collection=szRender, field=field, aqDate=date, product="SZRender")``
+            """
+            return Export.Table.__generate_table_task__(exportTask=ee.batch.Export.table.toCloudStorage,
+                                                        collection=collection, field=field, aqDate=aqDate,
+                                                        product=product, geometry=geometry, selectors=selectors,
+                                                        fileFormat=fileFormat, stdConfig={"bucket": bucket},
+                                                        manifest=manifest, destination="Cloud", location=bucket,
+                                                        target="Google Cloud")
 
         @staticmethod
         def toAsset(self):
@@ -13,6 +13,7 @@ Copyrights (c) 2020 ANTPOD Designs Private Limited. All Rights Reserved.
 import ee
 
 import apgis.geebase as gee
+import apgis.apraster as raster
 import apgis.apexception as apexception
 
 from apgis.apdate import Date
@@ -433,19 +434,122 @@ INDEX_MAP = {
 }
 
 
+# Input bands of each index, which set the native resolution of the index to that of its coarsest input.
+INDEX_BANDS = {
+    "S2": {
+        "NDVI": ["B8", "B4"],
+        "SAVI": ["B8", "B4"],
+        "AVI": ["B8", "B4"],
+        "EVI": ["B8", "B4", "B2"],
+        "ARVI": ["B8", "B4", "B2"],
+        "GNDVI": ["B8", "B3"],
+        "NDCI": ["B5", "B4"],
+        "NPCRI": ["B4", "B2"],
+        "PSRI": ["B4", "B2", "B6"],
+        "BSI": ["B4", "B2", "B8", "B11"],
+        "NDWI": ["B3", "B8"],
+        "NDMI": ["B8", "B11"],
+        "NDGI": ["B3", "B4"],
+        "NDSI": ["B3", "B11"],
+        "NBRI": ["B8", "B12"],
+        "SI": ["B4", "B3", "B2"],
+        "MCARI": ["B5", "B4", "B3"]
+    },
+    "L8": {
+        "NDVI": ["B5", "B4"],
+        "SAVI": ["B5", "B4"],
+        "AVI": ["B5", "B4"],
+        "EVI": ["B5", "B4", "B2"],
+        "ARVI": ["B5", "B4", "B2"],
+        "GNDVI": ["B5", "B3"],
+        "NPCRI": ["B4", "B2"],
+        "BSI": ["B4", "B2", "B5", "B6"],
+        "NDWI": ["B3", "B5"],
+        "NDMI": ["B5", "B6"],
+        "NDGI": ["B3", "B4"],
+        "NDSI": ["B3", "B6"],
+        "NBRI": ["B5", "B7"],
+        "SI": ["B4", "B3", "B2"]
+    }
+}
+
+
+def quantizedBands(requestList) -> tuple:
+    """ A function that returns the index bands of a RequestList that are quantized by a quantized export.
+
+    Only the indices of apraster.QUANTIZED_INDICES are quantized. A GeoTIFF export requires all its bands to
+    share a data type, so a product with an index that cannot be quantized, like AVI or EVI of the VI product,
+    is exported as float, along with the products that share an index band with it.
+
+    Keyword Args:
+        requestList:    The RequestList of the export.
+    Returns:
+        The list of the index bands to quantize and the list of the products exported as float.
+
+    Examples:
+        *Planning a quantized VI and WI export:*
+    ``>> bands, floatProducts = quantizedBands(requestList=RequestList(["VI", "WI"], "L2A"))``
+    """
+    reqBands = requestList.reqBands
+    productBands = {product: [band for band in requestList.sensorProducts[product] if band in reqBands]
+                    for product in requestList.products}
+
+    floatBands = {band for band in reqBands if band not in raster.QUANTIZED_INDICES}
+    floatProducts = []
+    changed = True
+    while changed:
+        changed = False
+        for product, bands in productBands.items():
+            if product not in floatProducts and any(band in floatBands for band in bands):
+                floatProducts.append(product)
+                floatBands.update(bands)
+                changed = True
+
+    return [band for band in reqBands if band not in floatBands], floatProducts
+
+
+def quantizeIndex(image: ee.Image, index: str) -> ee.Image:
+    """ A function that quantizes an index Image to int16.
+
+    The index is stored as ``round((value - offset) / scale)`` with the scale and offset of
+    apraster.quantization(), clamped to the int16 range. Masked pixels are set to the
+    apraster.QUANTIZED_NODATA sentinel, since an int16 GeoTIFF has no NaN.
+    Only the indices of apraster.QUANTIZED_INDICES, whose range fits int16, can be quantized.
+
+    Keyword Args:
+        image:      The single band index Image.
+        index:      The Index ID of the Image.
+    Returns:
+        An int16 Image of the quantized index.
+    Raises:
+        ValueError:     if the index cannot be quantized.
+
+    Examples:
+        *Quantizing an NDVI Image:*
+    ``>> quantized = quantizeIndex(image=calculateNDVI_S2(image), index="NDVI")``
+    """
+    scale, offset = raster.quantization(index)
+    quantized = image.subtract(offset).divide(scale).round().clamp(-raster.QUANTIZED_LIMIT, raster.QUANTIZED_LIMIT)
+    return quantized.unmask(raster.QUANTIZED_NODATA).toInt16().rename(index)
+
+
 def generateIndex(image: ee.Image,
                   index: str,
-                  sensor: str):
+                  sensor: str,
+                  quantize: bool = False):
     """ A function that generates an index out of an Image.
 
     The function generates a bandmath index from an Image based on the Index ID and Sensor ID provided.\n
     The resultant Image has it's metadata rebuilt based on the image used to perform the bandmath and only
-    contains just one band named by the Index ID provided.
+    contains just one band named by the Index ID provided.\n
+    The index is a float band, or an int16 band quantized with quantizeIndex() if quantize is set.
+    Only the indices of apraster.QUANTIZED_INDICES can be quantized.
 
     Keyword Args:
         image:      The Image on which to perform bandmath and retrieve and Index Image.
         index:      The Index ID to calculate.
         sensor:     The Sensor ID of the Image.
+        quantize:   A bool to quantize the index to int16. Defaults to False.
     Returns:
         An Image that contains the Index as the only band in it.
     Raises:
@@ -467,19 +571,25 @@ def generateIndex(image: ee.Image,
     if index not in CONFIG.getSensorProducts(sensor):
         raise NotImplementedError(f"Index Generation Failed @ Index Check: {index} is not possible for {sensor}")
 
+    if quantize and index not in raster.QUANTIZED_INDICES:
+        raise ValueError(f"Index Generation Failed @ Quantization Check: {index} cannot be quantized to int16")
+
     if not gee.verifyImage(image=image, mode=sensor):
         raise ValueError(f"Index Generation Failed @ image must be an Image of {sensor}")
 
     try:
         sat = CONFIG.getSatfromSensor(sensor)
         indexImage = INDEX_MAP[sat][index](image)
+        if quantize:
+            indexImage = quantizeIndex(image=indexImage, index=index)
 
     except Exception as e:
         raise apexception.EERuntimeError(f"Index Generation Failed @ Bandmath Runtime: {e}")
 
     try:
         # noinspection PyUnresolvedReferences
-        indexImage = gee.fixMetadata(image=indexImage, sensor=sensor, aqDate=Date(image.date()), precision="float")
+        indexImage = gee.fixMetadata(image=indexImage, sensor=sensor, aqDate=Date(image.date()),
+                                     precision=None if quantize else "float")
         return indexImage
 
     except Exception as e:
@@ -0,0 +1,806 @@
+"""
+Class module that implements the classes *TaskScheduler*, *LocalTask* and *LocalTaskBackend*.
+
+The TaskScheduler class starts and polls the unstarted Earth Engine batch tasks returned by the
+Export classes. Tasks are started under a concurrency cap that matches the EE batch quota, polled with
+an adaptive backoff and resubmitted on transient failures. Per-task latencies are reported on completion.
+The start_all() and as_completed() coroutines are an asyncio interface for thousands of tasks that starts them
+with a bounded number of in-flight requests and polls them with one bulk task list query per cycle.
+The LocalTaskBackend class is a stand-in for the EE batch system that runs LocalTask objects against a
+virtual clock, so scheduling behaviour can be tested and benchmarked offline.
+
+************************************************************************
+Copyrights (c) 2020 ANTPOD Designs Private Limited. All Rights Reserved.
+************************************************************************
+"""
+import re
+import ee
+import time
+import random
+import asyncio
+import itertools
+import threading
+
+import apgis.apexception as apexception
+
+UNSUBMITTED = "UNSUBMITTED"
+READY = "READY"
+RUNNING = "RUNNING"
+COMPLETED = "COMPLETED"
+FAILED = "FAILED"
+CANCEL_REQUESTED = "CANCEL_REQUESTED"
+CANCELLED = "CANCELLED"
+
+TERMINAL_STATES = (COMPLETED, FAILED, CANCELLED)
+
+TRANSIENT_ERRORS = (
+    "too many tasks",
+    "internal error",
+    "service unavailable",
+    "backend error",
+    "deadline exceeded",
+    "timed out",
+    "try again",
+    "quota exceeded",
+    "rate limit exceeded",
+    "too many requests"
+)
+TRANSIENT_STATUSES = ("RESOURCE_EXHAUSTED", "UNAVAILABLE", "DEADLINE_EXCEEDED", "INTERNAL")
+TRANSIENT_CODES = (429, 500, 502, 503, 504)
+STATUS_CODE_PATTERN = re.compile(r"\b(?:HttpError|HTTP|status|code)\W{0,3}(\d{3})\b", re.IGNORECASE)
+
+
+def isTransient(message: str) -> bool:
+    """ *A function that checks whether a task error message describes a transient failure.*
+
+    Transient failures are queue limits, rate limits, timeouts and internal server errors that are likely to
+    succeed on a resubmission. Computation errors like memory limits or invalid parameters are not transient.\n
+    Errors are matched on the messages of TRANSIENT_ERRORS, the API statuses of TRANSIENT_STATUSES and the HTTP
+    status codes of TRANSIENT_CODES, like ``HttpError 429``, so numbers that happen to be in a message, like
+    an asset ID, do not match.
+
+    Args:
+        message:    The error message of a failed task or start request.
+    Returns:
+        bool:       True if the failure is transient.
+    """
+    message = str(message)
+    if any(error in message.lower() for error in TRANSIENT_ERRORS):
+        return True
+
+    if any(re.search(rf"\b{status}\b", message) for status in TRANSIENT_STATUSES):
+        return True
+
+    return any(int(code) in TRANSIENT_CODES for code in STATUS_CODE_PATTERN.findall(message))
+
+
+def flattenTasks(taskList: list) -> list:
+    """ *A function that flattens a list or a list of lists of tasks into a single list.*
+
+    Args:
+        taskList:   A list of tasks or a list of lists of tasks as returned by the Export classes.
+    Returns:
+        list:       A flat list of tasks.
+    """
+    if taskList and isinstance(taskList[0], (list, tuple)):
+        return list(itertools.chain.from_iterable(taskList))
+
+    return list(taskList)
+
+
+class LocalTask:
+    """
+    *Class for a local stand-in of an Earth Engine batch task.*
+
+    **Class Attributes:**\n
+    - ``id:``       The task ID. None until the task is started.
+    - ``task_type:``    The task type, like "EXPORT_IMAGE".
+    - ``state:``    The last known state of the task.
+    - ``config:``   The task configuration dictionary.
+    - ``backend:``  The LocalTaskBackend that runs the task.
+
+    Mirrors the ``start()``, ``status()``, ``active()`` and ``cancel()`` interface of ``ee.batch.Task``.
+    LocalTask objects are created by a LocalTaskBackend with LocalTaskBackend.createTask().
+    """
+
+    def __init__(self, backend, task_type: str, config: dict):
+        """ **Constructor Method**\n
+        Yields a ``LocalTask`` object.
+
+        Args:
+            backend:    The LocalTaskBackend that runs the task.
+            task_type:  The task type, like "EXPORT_IMAGE".
+            config:     The task configuration dictionary. The "description" key is reported in the status.
+        """
+        self.id = None
+        self.task_type = task_type
+        self.state = UNSUBMITTED
+        self.config = config
+        self.backend = backend
+
+    def start(self) -> None:
+        """ A method that submits the task to the backend. """
+        self.backend.__submit__(self)
+
+    def status(self) -> dict:
+        """ A method that returns the status dictionary of the task. """
+        return self.backend.__status__(self)
+
+    def active(self) -> bool:
+        """ A method that returns whether the task is queued or running. """
+        return self.status()["state"] in (READY, RUNNING)
+
+    def cancel(self) -> None:
+        """ A method that cancels the task. """
+        self.backend.__cancel__(self)
+
+    def __repr__(self):
+        return f"<LocalTask {self.task_type}: {self.config.get('description')} ({self.state})>"
+
+
+class LocalTaskBackend:
+    """
+    *Class for a local stand-in of the Earth Engine batch task system.*
+
+    **Class Attributes:**\n
+    - ``slots:``        The number of tasks the backend runs concurrently.
+    - ``maxQueued:``    The number of queued and running tasks after which start requests are rejected.
+    - ``statusCalls:``  The number of single task status requests served.
+    - ``listCalls:``    The number of bulk task list requests served.
+    - ``startCalls:``   The number of start requests served.
+
+    Submitted tasks wait in a queue until one of the slots is free and then run for a random duration.
+    A fraction of tasks fail, either with a transient error or with a permanent computation error.
+    Start requests beyond maxQueued are rejected with a transient "Too many tasks" error like the EE queue.\n
+    The backend runs on a virtual clock by default. Pass backend.clock and backend.sleep to a TaskScheduler so
+    that sleeping advances the virtual time instantly and hours of scheduling can be benchmarked in seconds.
+    The asyncio interface takes backend.asleep for the same purpose. Backend requests are thread safe.
+    """
+
+    def __init__(self, slots: int = 2,
+                 duration: tuple = (60, 300),
+                 transientRate: float = 0.0,
+                 failureRate: float = 0.0,
+                 maxQueued: int = 3000,
+                 seed: int = None,
+                 realtime: bool = False):
+        """ **Constructor Method**\n
+        Yields a ``LocalTaskBackend`` object.
+
+        Args:
+            slots:          The number of tasks the backend runs concurrently. Defaults to 2.
+            duration:       A tuple of the minimum and maximum task run time in seconds, or a function that
+                            returns the run time of a task from its config dictionary. Defaults to (60, 300).
+            transientRate:  The probability that a task fails with a transient error. Defaults to 0.
+            failureRate:    The probability that a task fails with a permanent error. Defaults to 0.
+            maxQueued:      The number of queued and running tasks after which start requests are rejected.
+                            Defaults to 3000.
+            seed:           A seed for the random durations and failures. Defaults to None.
+            realtime:       A bool to run on the wall clock instead of a virtual clock. Defaults to False.
+        """
+        self.slots = slots
+        self.duration = duration
+        self.transientRate = transientRate
+        self.failureRate = failureRate
+        self.maxQueued = maxQueued
+        self.realtime = realtime
+
+        self.statusCalls = 0
+        self.listCalls = 0
+        self.startCalls = 0
+
+        self.__random__ = random.Random(seed)
+        self.__ids__ = itertools.count(1)
+        self.__now__ = 0.0
+        self.__queue__ = []
+        self.__running__ = []
+        self.__records__ = {}
+        self.__lock__ = threading.RLock()
+
+    def clock(self) -> float:
+        """ A method that returns the current backend time in seconds. """
+        return time.monotonic() if self.realtime else self.__now__
+
+    def sleep(self, seconds: float) -> None:
+        """ A method that sleeps on the wall clock or advances the virtual clock. """
+        if self.realtime:
+            time.sleep(seconds)
+        else:
+            self.__now__ += max(seconds, 0)
+
+    async def asleep(self, seconds: float) -> None:
+        """ A coroutine that sleeps on the wall clock or advances the virtual clock. """
+        if self.realtime:
+            await asyncio.sleep(seconds)
+        else:
+            self.__now__ += max(seconds, 0)
+            await asyncio.sleep(0)
+
+    def taskList(self) -> list:
+        """ *A method that returns the status dictionaries of all started tasks in a single request.*
+
+        Mirrors ``ee.data.getTaskList()``.
+
+        Returns:
+            list:       A list of task status dictionaries.
+        """
+        with self.__lock__:
+            self.listCalls += 1
+            self.__advance__()
+            return [self.__describe__(record["task"]) for record in self.__records__.values()]
+
+    def createTask(self, description: str = "Local Export Task",
+                   task_type: str = "EXPORT_IMAGE",
+                   config: dict = None) -> LocalTask:
+        """ *A method that creates an unstarted LocalTask.*
+
+        Args:
+            description:    The description of the task. Defaults to "Local Export Task".
+            task_type:      The task type. Defaults to "EXPORT_IMAGE".
+            config:         The task configuration dictionary. Defaults to None.
+        Returns:
+            LocalTask:      An unstarted LocalTask.
+        """
+        config = dict(config or {})
+        config.setdefault("description", description)
+        return LocalTask(backend=self, task_type=task_type, config=config)
+
+    def __advance__(self) -> None:
+        """ A method that moves tasks through the queue up to the current backend time. """
+        now = self.clock()
+        while True:
+            while self.__queue__ and len(self.__running__) < self.slots:
+                record = self.__queue__.pop(0)
+                record["started"] = max(record["submitted"], record.get("freed", record["submitted"]))
+                record["finishes"] = record["started"] + record["duration"]
+                record["state"] = RUNNING
+                self.__running__.append(record)
+
+            finished = [record for record in self.__running__ if record["finishes"] <= now]
+            if not finished:
+                break
+
+            record = min(finished, key=lambda r: r["finishes"])
+            self.__running__.remove(record)
+            record["state"] = record["outcome"]
+            for queued in self.__queue__:
+                queued["freed"] = max(queued.get("freed", 0), record["finishes"])
+
+    def __submit__(self, task: LocalTask) -> None:
+        """ A method that queues a started task. """
+        with self.__lock__:
+            self.startCalls += 1
+            if task.id is not None:
+                raise apexception.EERuntimeError(f"Task {task.id} has already been started")
+
+            self.__advance__()
+            if len(self.__queue__) + len(self.__running__) >= self.maxQueued:
+                raise apexception.EERuntimeError(f"Too many tasks already in the queue ({self.maxQueued})")
+
+            roll = self.__random__.random()
+            if roll < self.transientRate:
+                outcome, error = FAILED, "Internal error. Please try again."
+            elif roll < self.transientRate + self.failureRate:
+                outcome, error = FAILED, "User memory limit exceeded."
+            else:
+                outcome, error = COMPLETED, None
+
+            task.id = f"LOCAL{next(self.__ids__):08d}"
+            record = {
+                "task": task,
+                "state": READY,
+                "submitted": self.clock(),
+                "duration": (self.duration(task.config) if callable(self.duration)
+                             else self.__random__.uniform(*self.duration)),
+                "outcome": outcome,
+                "error": error
+            }
+            self.__records__[task.id] = record
+            self.__queue__.append(record)
+            task.state = READY
+
+    def __status__(self, task: LocalTask) -> dict:
+        """ A method that returns the status dictionary of a task. """
+        with self.__lock__:
+            self.statusCalls += 1
+            if task.id is None:
+                return {"state": UNSUBMITTED, "description": task.config["description"]}
+
+            self.__advance__()
+            return self.__describe__(task)
+
+    def __describe__(self, task: LocalTask) -> dict:
+        """ A method that builds the status dictionary of a started task. """
+        record = self.__records__[task.id]
+        task.state = record["state"]
+
+        status = {
+            "state": record["state"],
+            "description": task.config["description"],
+            "id": task.id,
+            "task_type": task.task_type,
+            "creation_timestamp_ms": int(record["submitted"] * 1000)
+        }
+        if record["state"] == FAILED:
+            status["error_message"] = record["error"]
+
+        return status
+
+    def __cancel__(self, task: LocalTask) -> None:
+        """ A method that cancels a queued or running task. """
+        with self.__lock__:
+            if task.id is None:
+                return
+
+            self.__advance__()
+            record = self.__records__[task.id]
+            if record in self.__queue__:
+                self.__queue__.remove(record)
+            elif record in self.__running__:
+                self.__running__.remove(record)
+            else:
+                return
+
+            record["state"] = task.state = CANCELLED
+
+
+class TaskScheduler:
+    """
+    *Class for starting and polling Earth Engine batch tasks under a concurrency cap.*
+
+    **Class Attributes:**\n
+    - ``maxConcurrent:``    The maximum number of tasks that are submitted and not yet finished.
+    - ``pollInterval:``     The initial interval in seconds between status polls of a task.
+    - ``maxPollInterval:``  The maximum interval in seconds between status polls of a task.
+    - ``backoff:``      The factor by which the poll interval grows while a task's state is unchanged.
+    - ``maxRetries:``   The number of times a task is resubmitted after a transient failure.
+    - ``retryDelay:``   The delay in seconds before the first resubmission. Doubles on every retry.
+
+    The Export classes return lists (or lists of lists) of unstarted tasks. The TaskScheduler starts them
+    while keeping at most maxConcurrent of them in the EE queue, so large batches do not run into the
+    concurrent task quota. Each task is polled on its own schedule that starts at pollInterval and backs off
+    by the backoff factor up to maxPollInterval for as long as its state does not change.\n
+    Tasks that fail with a transient error (see isTransient()) or whose start request is rejected with one are
+    resubmitted as new tasks with the same configuration, up to maxRetries times.
+    Permanent failures are not retried.\n
+    The clock and sleep functions can be replaced, for example with the virtual clock of a LocalTaskBackend.
+    """
+
+    def __init__(self, maxConcurrent: int = 2,
+                 pollInterval: float = 5.0,
+                 maxPollInterval: float = 60.0,
+                 backoff: float = 1.5,
+                 maxRetries: int = 3,
+                 retryDelay: float = 30.0,
+                 clock=time.monotonic,
+                 sleep=time.sleep):
+        """ **Constructor Method**\n
+        Yields a ``TaskScheduler`` object.
+
+        Args:
+            maxConcurrent:      The maximum number of tasks that are submitted and not yet finished. Defaults to 2.
+            pollInterval:       The initial interval in seconds between status polls. Defaults to 5.
+            maxPollInterval:    The maximum interval in seconds between status polls. Defaults to 60.
+            backoff:            The poll interval growth factor while a task's state is unchanged. Defaults to 1.5.
+            maxRetries:         The number of resubmissions after a transient failure. Defaults to 3.
+            retryDelay:         The delay in seconds before the first resubmission. Defaults to 30.
+            clock:              A function that returns the current time in seconds. Defaults to time.monotonic.
+            sleep:              A function that sleeps for a number of seconds. Defaults to time.sleep.
+        Raises:
+            ValueError:     Occurs if any of the limits or intervals are not positive.
+        """
+        if not isinstance(maxConcurrent, int) or maxConcurrent < 1:
+            raise ValueError("TaskScheduler Construction Failed @ maxConcurrent check: must be a positive int")
+
+        if pollInterval <= 0 or maxPollInterval < pollInterval or backoff < 1:
+            raise ValueError("TaskScheduler Construction Failed @ poll check: pollInterval must be positive, "
+                             "maxPollInterval must not be less than pollInterval and backoff must be at least 1")
+
+        if maxRetries < 0 or retryDelay < 0:
+            raise ValueError("TaskScheduler Construction Failed @ retry check: maxRetries and retryDelay "
+                             "must not be negative")
+
+        self.maxConcurrent = maxConcurrent
+        self.pollInterval = pollInterval
+        self.maxPollInterval = maxPollInterval
+        self.backoff = backoff
+        self.maxRetries = maxRetries
+        self.retryDelay = retryDelay
+        self.clock = clock
+        self.sleep = sleep
+
+    @staticmethod
+    def __resubmission__(task):
+        """ A staticmethod that creates a new unstarted task with the configuration of a failed task. """
+        if isinstance(task, LocalTask):
+            return task.backend.createTask(task_type=task.task_type, config=task.config)
+
+        return ee.batch.Task(None, task.task_type, ee.batch.Task.State.UNSUBMITTED, task.config)
+
+    def __start__(self, job: dict, now: float) -> None:
+        """ A method that starts the task of a job or schedules its retry. """
+        job["attempts"] += 1
+        try:
+            job["task"].start()
+
+        except Exception as e:
+            self.__fail__(job, f"Task Start Failed: {e}", now)
+            return
+
+        job["state"] = READY
+        job["submitted"] = job["submitted"] if job["submitted"] is not None else now
+        job["interval"] = self.pollInterval
+        job["nextPoll"] = now + self.pollInterval
+
+    def __fail__(self, job: dict, error: str, now: float) -> None:
+        """ A method that marks a job as failed or schedules its resubmission if the failure is transient. """
+        job["error"] = error
+        if isTransient(error) and job["attempts"] <= self.maxRetries:
+            job["state"] = UNSUBMITTED
+            job["retryAt"] = now + self.retryDelay * 2 ** (job["attempts"] - 1)
+            if job["task"].id is not None:
+                job["task"] = self.__resubmission__(job["task"])
+        else:
+            job["state"] = FAILED
+            job["finished"] = now
+
+    def __poll__(self, job: dict, now: float) -> None:
+        """ A method that polls the status of a job's task and reschedules its next poll. """
+        try:
+            status = job["task"].status()
+            state = status["state"]
+
+        except Exception:
+            # Status requests that fail are retried on the next poll, like an unchanged state.
+            state = job["state"]
+            status = {}
+
+        if state != job["state"]:
+            job["interval"] = self.pollInterval
+            if state == RUNNING and job["started"] is None:
+                job["started"] = now
+        else:
+            job["interval"] = min(job["interval"] * self.backoff, self.maxPollInterval)
+
+        job["nextPoll"] = now + job["interval"]
+
+        if state == FAILED:
+            self.__fail__(job, status.get("error_message", "Unknown task error"), now)
+        elif state in (COMPLETED, CANCELLED):
+            job["state"] = state
+            job["finished"] = now
+        else:
+            job["state"] = state
+
+    def run(self, taskList: list, timeout: float = None) -> list:
+        """ *A method that starts and polls a list of tasks until all of them finish.*
+
+        Reports the final state, the number of attempts, the error message and the latencies of each task.
+        Latencies are measured on the scheduler's clock and are accurate to the poll interval at the time.\n
+        The report holds one dictionary per task in the order of the flattened taskList, with the keys:\n
+        - ``description:``  The task description.
+        - ``id:``       The ID of the last submission of the task.
+        - ``state:``    The final state, COMPLETED, FAILED, CANCELLED or UNSUBMITTED if timed out.
+        - ``attempts:`` The number of start requests made for the task.
+        - ``error:``    The last error message of the task, if any.
+        - ``waitTime:`` The seconds between the scheduler run start and the first submission.
+        - ``queueTime:``    The seconds between the first submission and the task running.
+        - ``runTime:``  The seconds between the task running and finishing.
+        - ``latency:``  The seconds between the first submission and the task finishing.
+
+        Args:
+            taskList:   A list or a list of lists of unstarted tasks, as returned by the Export classes.
+            timeout:    The maximum number of seconds to schedule for. Unfinished tasks are cancelled.
+                        Defaults to None (no timeout).
+        Returns:
+            list:       A list of dictionaries that report the outcome of each task.
+        Raises:
+            TypeError:      Occurs if the taskList is not a list.
+            EERuntimeError: Occurs if the scheduling runtime fails.
+
+        Examples:
+            Some example uses of this method are:\n
+        *Exporting an ImageCollection with at most 2 concurrent tasks:*\n
+        ``>> tasks = Export.ImageCollection.toDrive(imageCol=imageCol, requestList=requestList, field=field)``\n
+        ``>> report = TaskScheduler(maxConcurrent=2).run(taskList=tasks)``
+
+        *Benchmarking the scheduler offline:*\n
+        ``>> backend = LocalTaskBackend(slots=2, transientRate=0.1, seed=1)``\n
+        ``>> tasks = [backend.createTask(description=f"Task-{i}") for i in range(20)]``\n
+        ``>> scheduler = TaskScheduler(maxConcurrent=2, clock=backend.clock, sleep=backend.sleep)``\n
+        ``>> report = scheduler.run(taskList=tasks)``
+        """
+        if not isinstance(taskList, (list, tuple)):
+            raise TypeError("Task Scheduling Failed @ type check: taskList must be a list of tasks")
+
+        try:
+            begin = self.clock()
+            jobs = []
+            for task in flattenTasks(taskList):
+                jobs.append({
+                    "task": task,
+                    "description": getattr(task, "config", {}).get("description"),
+                    "state": UNSUBMITTED,
+                    "attempts": 0,
+                    "error": None,
+                    "retryAt": begin,
+                    "submitted": None,
+                    "started": None,
+                    "finished": None,
+                    "interval": self.pollInterval,
+                    "nextPoll": begin
+                })
+
+        except Exception as e:
+            raise apexception.EERuntimeError(f"Task Scheduling Failed @ Job Building: {e}")
+
+        try:
+            while True:
+                now = self.clock()
+                pending = [job for job in jobs if job["state"] not in TERMINAL_STATES]
+                if not pending:
+                    break
+
+                if timeout is not None and now - begin >= timeout:
+                    for job in pending:
+                        if job["state"] in (READY, RUNNING):
+                            job["task"].cancel()
+                            job["state"] = CANCELLED
+                            job["finished"] = now
+                    break
+
+                for job in pending:
+                    if job["state"] in (READY, RUNNING) and job["nextPoll"] <= now:
+                        self.__poll__(job, now)
+
+                active = sum(1 for job in jobs if job["state"] in (READY, RUNNING))
+                for job in jobs:
+                    if active >= self.maxConcurrent:
+                        break
+                    if job["state"] == UNSUBMITTED and job["retryAt"] <= now:
+                        self.__start__(job, now)
+                        active += job["state"] == READY
+
+                waits = [job["nextPoll"] for job in jobs if job["state"] in (READY, RUNNING)]
+                if active < self.maxConcurrent:
+                    waits += [job["retryAt"] for job in jobs if job["state"] == UNSUBMITTED]
+
+                if waits:
+                    self.sleep(max(min(waits) - self.clock(), 0))
+
+        except Exception as e:
+            raise apexception.EERuntimeError(f"Task Scheduling Failed @ Polling: {e}")
+
+        report = []
+        for job in jobs:
+            submitted, started, finished = job["submitted"], job["started"], job["finished"]
+            report.append({
+                "description": job["description"],
+                "id": job["task"].id,
+                "state": job["state"],
+                "attempts": job["attempts"],
+                "error": job["error"] if job["state"] != COMPLETED else None,
+                "waitTime": None if submitted is None else submitted - begin,
+                "queueTime": None if started is None else started - submitted,
+                "runTime": None if started is None or finished is None else finished - started,
+                "latency": None if submitted is None or finished is None else finished - submitted
+            })
+
+        return report
+
+    @staticmethod
+    def summarize(report: list) -> dict:
+        """ *A staticmethod that summarizes a TaskScheduler report.*
+
+        Args:
+            report:     A list of task reports returned by TaskScheduler.run().
+        Returns:
+            dict:       A dictionary with the task count, the count of each final state, the total attempts
+                        and the mean and maximum task latency in seconds.
+        """
+        latencies = [task["latency"] for task in report if task["latency"] is not None]
+        states = {}
+        for task in report:
+            states[task["state"]] = states.get(task["state"], 0) + 1
+
+        return {
+            "tasks": len(report),
+            "states": states,
+            "attempts": sum(task["attempts"] for task in report),
+            "meanLatency": sum(latencies) / len(latencies) if latencies else None,
+            "maxLatency": max(latencies) if latencies else None
+        }
+
+
+def eeTaskStatuses() -> dict:
+    """ *A function that fetches the status of every recent Earth Engine batch task in a single bulk query.*
+
+    Returns:
+        dict:       A dictionary of task status dictionaries keyed by task ID.
+    """
+    return {status["id"]: status for status in ee.data.getTaskList()}
+
+
+def _statusQuery(tasks: list):
+    """ A function that returns the bulk status query function for a list of tasks. """
+    backends = {task.backend for task in tasks if isinstance(task, LocalTask)}
+    if not backends:
+        return eeTaskStatuses
+
+    if len(backends) > 1 or not all(isinstance(task, LocalTask) for task in tasks):
+        raise ValueError("tasks must all belong to Earth Engine or to a single LocalTaskBackend")
+
+    backend = backends.pop()
+    return lambda: {status["id"]: status for status in backend.taskList()}
+
+
+async def start_all(tasks: list,
+                    maxInFlight: int = 8,
+                    maxRetries: int = 3,
+                    retryDelay: float = 5.0,
+                    sleep=asyncio.sleep) -> tuple:
+    """ *A coroutine that starts a list of Earth Engine batch tasks with a bounded number of in-flight requests.*
+
+    Start requests are blocking HTTP calls, so they are run on the event loop's default executor with at
+    most maxInFlight of them in flight at a time. Requests rejected with a transient error (see isTransient())
+    are retried with an exponential delay up to maxRetries times.\n
+    Tasks that could not be started keep an ID of None and are returned along with the error of their last
+    start request, so rejections like the queue limit of a large export can be resubmitted later.
+
+    Args:
+        tasks:          A list or a list of lists of unstarted tasks, as returned by the Export classes.
+        maxInFlight:    The maximum number of concurrent start requests. Defaults to 8.
+        maxRetries:     The number of retries of a transiently rejected start request. Defaults to 3.
+        retryDelay:     The delay in seconds before the first retry. Doubles on every retry. Defaults to 5.
+        sleep:          A coroutine function that sleeps for a number of seconds. Defaults to asyncio.sleep.
+    Returns:
+        tuple:      A flat list of the started tasks and a list of (task, error) tuples of the tasks that could
+                    not be started.
+    Raises:
+        TypeError:      Occurs if the tasks are not a list.
+        ValueError:     Occurs if maxInFlight is not a positive int.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Starting the tasks of an ImageCollection export:*\n
+    ``>> tasks = Export.ImageCollection.toCloud(imageCol=imageCol, requestList=requestList, field=field)``\n
+    ``>> started, failed = asyncio.run(start_all(tasks=tasks))``\n
+    ``>> for task, error in failed: print(task.config["description"], error)``
+    """
+    if not isinstance(tasks, (list, tuple)):
+        raise TypeError("Task Start Failed @ type check: tasks must be a list of tasks")
+
+    if not isinstance(maxInFlight, int) or maxInFlight < 1:
+        raise ValueError("Task Start Failed @ maxInFlight check: maxInFlight must be a positive int")
+
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(maxInFlight)
+
+    async def startTask(task):
+        """ A coroutine that starts a single task, retries transient rejections and returns the last error. """
+        for attempt in range(maxRetries + 1):
+            async with semaphore:
+                try:
+                    await loop.run_in_executor(None, task.start)
+                    return None
+
+                except Exception as e:
+                    error = str(e)
+
+            if not isTransient(error) or attempt == maxRetries:
+                return error
+
+            await sleep(retryDelay * 2 ** attempt)
+
+    tasks = flattenTasks(tasks)
+    errors = await asyncio.gather(*[startTask(task) for task in tasks])
+    started = [task for task, error in zip(tasks, errors) if error is None]
+    failed = [(task, error) for task, error in zip(tasks, errors) if error is not None]
+    return started, failed
+
+
+async def as_completed(tasks: list,
+                       pollInterval: float = 10.0,
+                       maxPollInterval: float = 120.0,
+                       backoff: float = 1.5,
+                       statusQuery=None,
+                       sleep=asyncio.sleep,
+                       timeout: float = None,
+                       clock=time.monotonic):
+    """ *An asynchronous generator that yields started tasks as they finish.*
+
+    The status of every pending task is fetched with one bulk task list query per polling cycle
+    (``ee.data.getTaskList()``) rather than a status request per task, so a single request is in flight
+    however many tasks are polled. The polling interval starts at pollInterval and backs off by the backoff
+    factor up to maxPollInterval while no task finishes.\n
+    Yields a tuple of the task and its final status dictionary as soon as the task is COMPLETED, FAILED
+    or CANCELLED. Tasks that have not shown up in the task list yet are treated as pending.\n
+    Once the timeout has elapsed the tasks that are still pending are cancelled and yielded with a CANCELLED
+    status, and polling stops, so a task ID that never shows up in the task list cannot block the generator.
+
+    Args:
+        tasks:              A list or a list of lists of started tasks, like the started tasks of start_all().
+        pollInterval:       The initial interval in seconds between bulk queries. Defaults to 10.
+        maxPollInterval:    The maximum interval in seconds between bulk queries. Defaults to 120.
+        backoff:            The interval growth factor while no task finishes. Defaults to 1.5.
+        statusQuery:        A function that returns a dictionary of status dictionaries keyed by task ID.
+                            Defaults to eeTaskStatuses() or the task list of the tasks' LocalTaskBackend.
+        sleep:              A coroutine function that sleeps for a number of seconds. Defaults to asyncio.sleep.
+        timeout:            The maximum number of seconds to poll for. Unfinished tasks are cancelled.
+                            Defaults to None (no timeout).
+        clock:              A function that returns the current time in seconds. Defaults to time.monotonic.
+    Yields:
+        tuple:      A tuple of a finished task and its status dictionary.
+    Raises:
+        TypeError:      Occurs if the tasks are not a list.
+        ValueError:     Occurs if any of the tasks has not been started.
+        EERuntimeError: Occurs if a bulk status query or a cancellation fails.
+
+    Examples:
+        Some example uses of this method are:\n
+    *Processing the tasks of an ImageCollection export as they finish:*\n
+    ``>> async def export(tasks):``\n
+    ``>>     started, failed = await start_all(tasks=tasks)``\n
+    ``>>     async for task, status in as_completed(tasks=started):``\n
+    ``>>         print(status["description"], status["state"])``\n
+    ``>> asyncio.run(export(tasks))``
+
+    *Benchmarking the polling offline:*\n
+    ``>> backend = LocalTaskBackend(slots=20, seed=1)``\n
+    ``>> tasks = [backend.createTask(description=f"Task-{i}") for i in range(2000)]``\n
+    ``>> started, failed = await start_all(tasks=tasks, sleep=backend.asleep)``\n
+    ``>> finished = [status async for task, status in as_completed(tasks=started, sleep=backend.asleep)]``
+
+    *Giving up on the tasks after an hour:*\n
+    ``>> async for task, status in as_completed(tasks=started, timeout=3600):``\n
+    ``>>     print(status["description"], status["state"])``
+    """
+    if not isinstance(tasks, (list, tuple)):
+        raise TypeError("Task Polling Failed @ type check: tasks must be a list of tasks")
+
+    tasks = flattenTasks(tasks)
+    if any(task.id is None for task in tasks):
+        raise ValueError("Task Polling Failed @ task check: all tasks must be started")
+
+    if statusQuery is None:
+        statusQuery = _statusQuery(tasks)
+
+    loop = asyncio.get_running_loop()
+    pending = {task.id: task for task in tasks}
+    interval = pollInterval
+    begin = clock()
+
+    while pending:
+        try:
+            statuses = await loop.run_in_executor(None, statusQuery)
+
+        except Exception as e:
+            raise apexception.EERuntimeError(f"Task Polling Failed @ Bulk Status Query: {e}")
+
+        finished = [taskID for taskID in pending
+                    if statuses.get(taskID, {}).get("state") in TERMINAL_STATES]
+
+        for taskID in finished:
+            yield pending.pop(taskID), statuses[taskID]
+
+        if not pending:
+            break
+
+        if timeout is not None and clock() - begin >= timeout:
+            for taskID, task in list(pending.items()):
+                try:
+                    await loop.run_in_executor(None, task.cancel)
+
+                except Exception as e:
+                    raise apexception.EERuntimeError(f"Task Polling Failed @ Cancel {taskID}: {e}")
+
+                status = dict(statuses.get(taskID, {"id": taskID}), state=CANCELLED)
+                status.setdefault("description", getattr(task, "config", {}).get("description"))
+                status.setdefault("error_message", f"Polling timed out after {timeout} seconds")
+                yield pending.pop(taskID), status
+            break
+
+        interval = pollInterval if finished else min(interval * backoff, maxPollInterval)
+        if timeout is not None:
+            interval = max(min(interval, begin + timeout - clock()), 0)
+        await sleep(interval)